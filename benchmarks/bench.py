@@ -0,0 +1,304 @@
+"""
+Banco de pruebas de rendimiento del cifrado, la validación y la interfaz.
+
+Mide operaciones por segundo, nanosegundos por operación y el pico de memoria
+residente (RSS), guarda una línea base en JSON y falla si una ejecución
+empeora más allá de un umbral respecto a esa base.
+
+ru_maxrss es el máximo histórico de todo el proceso, así que cada caso se
+ejecuta por defecto en un proceso nuevo: el pico reportado es el de ese caso
+(incluidos el intérprete y los módulos que importa), no el de los anteriores.
+
+Uso:
+    python -m benchmarks.bench                              # 1K, 1M y 10M registros
+    python -m benchmarks.bench --tamanos 1000 1000000 --guardar-base base.json
+    python -m benchmarks.bench --base base.json --umbral 0.15
+    python -m benchmarks.bench --sin-aislar                 # todo en este proceso (RSS no comparable)
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from src.logic.cipher import CipherLogic
+from src.logic.flujo import transformar_lineas, escribir_resultados
+from src.utils.validators import Validator
+
+TAMANOS = (1_000, 1_000_000, 10_000_000)
+REPETICIONES = 3
+UMBRAL = 0.10
+
+
+def _codigos(n: int) -> List[str]:
+    """Genera n códigos reutilizando las cadenas del dominio para ahorrar memoria."""
+    dominio = [f"{valor:06d}" for valor in range(min(n, 10 ** 6))]
+    veces = -(-n // len(dominio))
+    return (dominio * veces)[:n]
+
+
+def _buffer(n: int) -> bytes:
+    """Genera un búfer de n registros de 6 dígitos terminados en salto de línea."""
+    return ("\n".join(_codigos(n)) + "\n").encode("ascii")
+
+
+def _caso_escalar(funcion: Callable[[str], object]):
+    def preparar(n: int):
+        codigos = _codigos(n)
+
+        def ejecutar():
+            for codigo in codigos:
+                funcion(codigo)
+        return ejecutar
+    return preparar
+
+
+def _caso_buffer(funcion: Callable[[bytes], object]):
+    def preparar(n: int):
+        datos = _buffer(n)
+        return lambda: funcion(datos)
+    return preparar
+
+
+def _preparar_validar_lote(n: int):
+    codigos = _codigos(n)
+    return lambda: Validator.validar_lote(codigos)
+
+
+def _preparar_cifrar_lote(n: int):
+    import numpy as np
+
+    numeros = np.arange(n, dtype=np.uint32) % 10 ** 6
+    return lambda: CipherLogic.cifrar_lote(numeros)
+
+
+def _preparar_flujo_archivo(n: int):
+    with tempfile.NamedTemporaryFile("wb", suffix=".txt", delete=False) as archivo:
+        archivo.write(_buffer(n))
+        ruta = archivo.name
+
+    def ejecutar():
+        with open(ruta, encoding="utf-8") as entrada, open(os.devnull, "w") as salida:
+            escribir_resultados(transformar_lineas(entrada, "cifrar"), salida, salida)
+    ejecutar.limpiar = lambda: os.unlink(ruta)
+    return ejecutar
+
+
+def _preparar_ui(_n: int):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6 import QtWidgets
+    from src.ui.app_window import AplicacionCifrado
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def ejecutar():
+        ventana = AplicacionCifrado()
+        app.processEvents()
+        ventana.deleteLater()
+    return ejecutar
+
+
+# nombre -> (preparar(n) -> ejecutar(), depende_del_tamano, módulo opcional requerido)
+CASOS: Dict[str, Tuple[Callable, bool, Optional[str]]] = {
+    "cifrar_escalar": (_caso_escalar(CipherLogic.cifrar), True, None),
+    "descifrar_escalar": (_caso_escalar(CipherLogic.descifrar), True, None),
+    "validar_escalar": (_caso_escalar(Validator.validar_numero_6_digitos), True, None),
+    "validar_lote": (_preparar_validar_lote, True, None),
+    "cifrar_buffer": (_caso_buffer(CipherLogic.cifrar_buffer), True, None),
+    "descifrar_buffer": (_caso_buffer(CipherLogic.descifrar_buffer), True, None),
+    "cifrar_lote_numpy": (_preparar_cifrar_lote, True, "numpy"),
+    "flujo_archivo": (_preparar_flujo_archivo, True, None),
+    "construir_aplicacion": (_preparar_ui, False, "PyQt6"),
+}
+
+
+def pico_rss_mb() -> Optional[float]:
+    """
+    Devuelve el pico de memoria residente del proceso en MiB (None si no se puede medir).
+
+    Es el máximo desde que arrancó el proceso, no desde que empezó el caso
+    (ver ejecutar_casos). En Linux se lee VmHWM, que empieza de cero con cada
+    exec; ru_maxrss, en cambio, conserva a través del exec el RSS que tenía el
+    proceso padre al crear el hijo.
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as estado:
+            for linea in estado:
+                if linea.startswith("VmHWM:"):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa KiB y macOS bytes
+    return pico / (1 << 20) if sys.platform == "darwin" else pico / 1024
+
+
+def _disponible(modulo: Optional[str]) -> bool:
+    if modulo is None:
+        return True
+    try:
+        __import__(modulo)
+    except ImportError:
+        return False
+    return True
+
+
+def medir(preparar: Callable, n: int, repeticiones: int = REPETICIONES) -> Dict[str, float]:
+    """
+    Ejecuta un caso varias veces y conserva la mejor medición.
+
+    Returns:
+        Diccionario con operaciones, segundos, ops_por_segundo, ns_por_op y pico_rss_mb
+    """
+    ejecutar = preparar(n)
+    mejor = float("inf")
+    try:
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            ejecutar()
+            mejor = min(mejor, time.perf_counter() - inicio)
+    finally:
+        limpiar = getattr(ejecutar, "limpiar", None)
+        if limpiar:
+            limpiar()
+    return {
+        "operaciones": n,
+        "segundos": mejor,
+        "ops_por_segundo": n / mejor if mejor else float("inf"),
+        "ns_por_op": mejor * 1e9 / n,
+        "pico_rss_mb": pico_rss_mb(),
+    }
+
+
+def _medir_caso(nombre: str, n: int, repeticiones: int) -> Dict[str, float]:
+    return medir(CASOS[nombre][0], n, repeticiones)
+
+
+def medir_aislado(nombre: str, n: int, repeticiones: int = REPETICIONES) -> Dict[str, float]:
+    """Mide un caso en un proceso nuevo ("spawn"), de modo que el pico de RSS sea solo suyo."""
+    contexto = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=contexto) as ejecutor:
+        return ejecutor.submit(_medir_caso, nombre, n, repeticiones).result()
+
+
+def ejecutar_casos(tamanos=TAMANOS, casos=None, repeticiones: int = REPETICIONES, informar=None,
+                   aislar: bool = True) -> Dict[str, dict]:
+    """
+    Ejecuta los casos seleccionados en cada tamaño.
+
+    Args:
+        tamanos: Número de registros por caso
+        casos: Nombres de casos a ejecutar (None = todos los disponibles)
+        repeticiones: Repeticiones por medición (se toma la mejor)
+        informar: Función opcional que recibe (clave, resultado) al terminar cada caso
+        aislar: Ejecutar cada caso en su propio proceso; si es False, pico_rss_mb
+            es el máximo acumulado de este proceso y no sirve para comparar casos
+
+    Returns:
+        Diccionario "caso@tamaño" -> resultado de medir()
+    """
+    resultados = {}
+    for nombre in casos or CASOS:
+        preparar, depende_del_tamano, modulo = CASOS[nombre]
+        if not _disponible(modulo):
+            continue
+        for n in (tamanos if depende_del_tamano else (1,)):
+            clave = f"{nombre}@{n}"
+            resultados[clave] = medir_aislado(nombre, n, repeticiones) if aislar else medir(preparar, n, repeticiones)
+            if informar:
+                informar(clave, resultados[clave])
+    return resultados
+
+
+def comparar_con_base(resultados: Dict[str, dict], base: Dict[str, dict], umbral: float = UMBRAL) -> List[str]:
+    """
+    Compara los resultados con la línea base.
+
+    Args:
+        resultados: Resultados de la ejecución actual
+        base: Resultados guardados como línea base
+        umbral: Caída relativa de ops/s tolerada (0.10 = 10 %)
+
+    Returns:
+        Lista de descripciones de las regresiones encontradas
+    """
+    regresiones = []
+    for clave, actual in resultados.items():
+        anterior = base.get(clave)
+        if anterior is None:
+            continue
+        minimo = anterior["ops_por_segundo"] * (1 - umbral)
+        if actual["ops_por_segundo"] < minimo:
+            caida = 1 - actual["ops_por_segundo"] / anterior["ops_por_segundo"]
+            regresiones.append(
+                f"{clave}: {actual['ops_por_segundo']:,.0f} ops/s frente a "
+                f"{anterior['ops_por_segundo']:,.0f} en la base ({caida:.1%} más lento)"
+            )
+    return regresiones
+
+
+def _imprimir(clave: str, resultado: dict):
+    rss = resultado["pico_rss_mb"]
+    rss_texto = f"{rss:9.1f}" if rss is not None else "        -"
+    print(f"{clave:34} {resultado['ops_por_segundo']:16,.0f} {resultado['ns_por_op']:12,.1f} {rss_texto}", flush=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ejecuta el banco de pruebas desde la línea de comandos."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench",
+                                     description="Banco de pruebas de rendimiento.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=list(TAMANOS),
+                        help="Número de registros por caso (por defecto 1K, 1M y 10M)")
+    parser.add_argument("--casos", nargs="+", choices=list(CASOS), help="Casos a ejecutar (por defecto todos)")
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES)
+    parser.add_argument("--salida", metavar="RUTA", help="Guardar los resultados en JSON")
+    parser.add_argument("--guardar-base", metavar="RUTA", help="Guardar los resultados como línea base")
+    parser.add_argument("--base", metavar="RUTA", help="Línea base con la que comparar")
+    parser.add_argument("--umbral", type=float, default=UMBRAL,
+                        help="Caída relativa de ops/s tolerada frente a la base (por defecto 0.10)")
+    parser.add_argument("--sin-aislar", action="store_true",
+                        help="Ejecutar todos los casos en este proceso (más rápido; el pico de RSS se acumula)")
+    args = parser.parse_args(argv)
+
+    print(f"{'caso@tamaño':34} {'ops/s':>16} {'ns/op':>12} {'RSS MiB':>9}")
+    resultados = ejecutar_casos(args.tamanos, args.casos, args.repeticiones, informar=_imprimir,
+                                aislar=not args.sin_aislar)
+
+    documento = {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+    for ruta in (args.salida, args.guardar_base):
+        if ruta:
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                json.dump(documento, archivo, indent=2)
+
+    if args.base:
+        with open(args.base, encoding="utf-8") as archivo:
+            base = json.load(archivo)["resultados"]
+        regresiones = comparar_con_base(resultados, base, args.umbral)
+        if regresiones:
+            print("\nRegresiones de rendimiento:", file=sys.stderr)
+            for regresion in regresiones:
+                print(f"  {regresion}", file=sys.stderr)
+            return 1
+        print(f"\nSin regresiones respecto a {args.base} (umbral {args.umbral:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
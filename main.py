@@ -7,15 +7,38 @@ Correo: oduque94@unisalle.edu.co
 Asignatura: Aplicaciones I
 """
 
-import sys
-from PyQt6 import QtWidgets
-from src.ui.app_window import AplicacionCifrado
+import time
+
+# Instante de arranque, antes de importar PyQt6: la importación es buena parte del arranque en frío
+INICIO = time.perf_counter()
+
+import os  # noqa: E402
+import sys  # noqa: E402
+from PyQt6 import QtWidgets  # noqa: E402
+from src.ui.app_window import AplicacionCifrado  # noqa: E402
+
+
+def reportar_inicio(segundos: float):
+    """Informa en stderr el tiempo transcurrido hasta el primer pintado."""
+    print(f"Primer pintado a los {segundos * 1000:.1f} ms", file=sys.stderr)
 
 
 def main():
     """Función principal que inicia la aplicación."""
     app = QtWidgets.QApplication(sys.argv)
-    ventana = AplicacionCifrado()
+    # CIFRADO_MEDIR_INICIO=1 reporta el tiempo de arranque en frío
+    al_primer_pintado = reportar_inicio if os.environ.get("CIFRADO_MEDIR_INICIO") else None
+    # CIFRADO_CACHE_TABLA=ruta cifra con tablas precalculadas (persistidas en esa ruta)
+    ruta_tabla = os.environ.get("CIFRADO_CACHE_TABLA")
+    if ruta_tabla:
+        from src.logic.cipher import CipherLogic
+        from src.logic.tabla import TablaCifrado
+        CipherLogic.usar_tabla(TablaCifrado.cargar_o_construir(ruta_tabla))
+    ventana = AplicacionCifrado(inicio=INICIO, al_primer_pintado=al_primer_pintado)
+    # CIFRADO_METRICAS=1 instrumenta las operaciones y muestra su ritmo
+    if os.environ.get("CIFRADO_METRICAS"):
+        from src.utils.metricas import activar
+        ventana.mostrar_metricas(activar())
     ventana.show()
     sys.exit(app.exec())
 
@@ -0,0 +1,289 @@
+"""
+Punto de entrada de consola para cifrar y descifrar códigos en flujo.
+
+No importa nada de src/ui, de modo que puede usarse en tuberías de shell
+sin cargar PyQt6.
+
+Uso:
+    python -m src.cli cifrar [-i ENTRADA] [-o SALIDA]
+    python -m src.cli descifrar [-i ENTRADA] [-o SALIDA]
+    python -m src.cli cifrar -i ENTRADA -o SALIDA --procesos 8
+    python -m src.cli cifrar -i ARCHIVO --en-sitio
+    python -m src.cli cifrar -i datos.csv -o cifrados.csv --columna codigo
+    python -m src.cli verificar [--rutas buffer,entero,escalar] [--procesos N]
+    python -m src.cli rotar --nuevo 3:1,0,3,2,5,4 [-i ENTRADA] [-o SALIDA | --en-sitio]
+    python -m src.cli indexar -i CIFRADOS -o ARCHIVO.idx
+    python -m src.cli consultar ARCHIVO.idx 12345 1000:1010
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from src.logic.cipher import CipherLogic
+from src.logic.csv_columna import MODOS_RECHAZO, RECHAZO_CONSERVAR, transformar_columna_csv
+from src.logic.flujo import TAM_BUFFER, OPERACIONES, transformar_lineas, escribir_resultados
+
+
+def _abrir_entrada(ruta: Optional[str], newline: Optional[str] = None, errors: str = "replace"):
+    """Abre el archivo de entrada (o stdin) con un búfer grande."""
+    if ruta is None or ruta == "-":
+        return open(sys.stdin.fileno(), "r", buffering=TAM_BUFFER, encoding="utf-8",
+                    errors=errors, newline=newline, closefd=False)
+    return open(ruta, "r", buffering=TAM_BUFFER, encoding="utf-8", errors=errors, newline=newline)
+
+
+def _abrir_salida(ruta: Optional[str], newline: str = "\n", errors: str = "strict"):
+    """Abre el archivo de salida (o stdout) con un búfer grande."""
+    if ruta is None or ruta == "-":
+        return open(sys.stdout.fileno(), "w", buffering=TAM_BUFFER, encoding="utf-8",
+                    errors=errors, newline=newline, closefd=False)
+    return open(ruta, "w", buffering=TAM_BUFFER, encoding="utf-8", errors=errors, newline=newline)
+
+
+def _abrir_binario(ruta: Optional[str], modo: str):
+    """Abre un archivo binario, o stdin/stdout si la ruta es None o "-"."""
+    if ruta is None or ruta == "-":
+        flujo = sys.stdin if "r" in modo else sys.stdout
+        return open(flujo.fileno(), modo, buffering=TAM_BUFFER, closefd=False)
+    return open(ruta, modo, buffering=TAM_BUFFER)
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Construye el analizador de argumentos de la consola."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Cifra o descifra códigos de 6 dígitos, uno por línea.",
+    )
+    subparsers = parser.add_subparsers(dest="operacion", required=True)
+
+    comunes = argparse.ArgumentParser(add_help=False)
+    comunes.add_argument("-i", "--entrada", help="Archivo de entrada (por defecto stdin)")
+    comunes.add_argument("-o", "--salida", help="Archivo de salida (por defecto stdout)")
+    comunes.add_argument("--tabla", action="store_true",
+                         help="Usar tablas precalculadas (conviene en entradas grandes)")
+    comunes.add_argument("--cache-tabla", metavar="RUTA",
+                         help="Archivo donde cargar o guardar las tablas precalculadas")
+    comunes.add_argument("-p", "--procesos", type=int, metavar="N",
+                         help="Procesar el archivo en paralelo con N procesos (requiere -i y -o)")
+    comunes.add_argument("--tam-fragmento", type=int, default=16, metavar="MIB",
+                         help="Tamaño de cada fragmento en modo paralelo, en MiB (por defecto 16)")
+    comunes.add_argument("--en-sitio", action="store_true",
+                         help="Reescribir el archivo de entrada en sitio; requiere registros de "
+                              "ancho fijo (6 dígitos y salto de línea) y se reanuda si se interrumpe")
+    comunes.add_argument("--columna", metavar="NOMBRE|INDICE",
+                         help="Tratar la entrada como CSV y transformar solo esta columna "
+                              "(nombre del encabezado o índice desde 0)")
+    comunes.add_argument("--delimitador", default=",", help="Separador de campos del CSV (por defecto ,)")
+    comunes.add_argument("--sin-encabezado", action="store_true",
+                         help="El CSV no tiene fila de encabezado")
+    comunes.add_argument("--rechazo", choices=MODOS_RECHAZO, default=RECHAZO_CONSERVAR,
+                         help="Qué hacer con las filas inválidas del CSV (por defecto conservar)")
+
+    for operacion in OPERACIONES:
+        subparsers.add_parser(operacion, parents=[comunes], help=f"{operacion.capitalize()} códigos")
+
+    verificar = subparsers.add_parser("verificar", help="Verificar el cifrado sobre todos los códigos posibles")
+    verificar.add_argument("--rutas", default="buffer,entero,lote,tabla",
+                           help="Rutas a verificar, separadas por comas: buffer, entero, lote, tabla, "
+                                "escalar (por defecto todas menos escalar)")
+    verificar.add_argument("-p", "--procesos", type=int, metavar="N",
+                           help="Procesos para las rutas código a código (por defecto los núcleos disponibles)")
+
+    rotar = subparsers.add_parser("rotar", help="Pasar códigos cifrados de un plan a otro en una sola pasada")
+    rotar.add_argument("--anterior", default="7:2,3,0,1,5,4", metavar="D:P0,P1,...",
+                       help="Plan con el que están cifrados los datos (por defecto el plan estándar)")
+    rotar.add_argument("--nuevo", required=True, metavar="D:P0,P1,...",
+                       help="Plan con el que deben quedar cifrados: desplazamiento y permutación")
+    rotar.add_argument("-i", "--entrada", help="Archivo de entrada (por defecto stdin)")
+    rotar.add_argument("-o", "--salida", help="Archivo de salida (por defecto stdout)")
+    rotar.add_argument("--en-sitio", action="store_true",
+                       help="Reescribir el archivo de entrada (reanudable si se interrumpe)")
+
+    indexar = subparsers.add_parser("indexar", help="Crear un archivo indexado de códigos cifrados")
+    indexar.add_argument("-i", "--entrada", help="Códigos cifrados, uno por línea (por defecto stdin)")
+    indexar.add_argument("-o", "--salida", required=True, help="Archivo indexado a crear")
+    indexar.add_argument("--tam-bloque", type=int, default=4096, metavar="N",
+                         help="Registros por bloque de suma de verificación (por defecto 4096)")
+    indexar.add_argument("--sin-sumas", action="store_true", help="No guardar sumas de verificación")
+
+    consultar = subparsers.add_parser("consultar", help="Descifrar registros de un archivo indexado sin recorrerlo")
+    consultar.add_argument("archivo", help="Archivo indexado")
+    consultar.add_argument("registros", nargs="+", metavar="N|INICIO:FIN",
+                           help="Registro (base 0) o rango semiabierto de registros")
+    consultar.add_argument("--cifrados", action="store_true", help="Mostrar los códigos sin descifrar")
+    consultar.add_argument("--sin-verificar", action="store_true",
+                           help="No comprobar las sumas de verificación de los bloques leídos")
+
+    return parser
+
+
+def ejecutar(args: argparse.Namespace) -> int:
+    """
+    Ejecuta la operación solicitada.
+
+    Returns:
+        Código de salida: 0 si todas las líneas eran válidas, 1 en caso contrario
+    """
+    if args.tabla or args.cache_tabla:
+        from src.logic.tabla import TablaCifrado
+        CipherLogic.usar_tabla(TablaCifrado.cargar_o_construir(args.cache_tabla))
+
+    if args.en_sitio:
+        from src.logic.archivo_mapeado import transformar_en_sitio
+        try:
+            transformar_en_sitio(args.entrada, args.operacion)
+        except ValueError as error:
+            print(f"Error: {error}", file=sys.stderr)
+            return 1
+        return 0
+
+    if args.columna is not None:
+        return _ejecutar_csv(args)
+
+    if args.procesos is not None:
+        from src.logic.paralelo import procesar_archivo_paralelo
+        num_errores = procesar_archivo_paralelo(
+            args.entrada, args.salida, args.operacion, procesos=args.procesos,
+            tam_fragmento=args.tam_fragmento << 20, errores=sys.stderr,
+        )
+        return 1 if num_errores else 0
+
+    with _abrir_entrada(args.entrada) as entrada, _abrir_salida(args.salida) as salida:
+        resultados = transformar_lineas(entrada, args.operacion)
+        num_errores = escribir_resultados(resultados, salida, sys.stderr)
+
+    return 1 if num_errores else 0
+
+
+def _ejecutar_csv(args: argparse.Namespace) -> int:
+    """Transforma una columna de un CSV conservando el resto de cada fila."""
+    columna = int(args.columna) if args.columna.isdigit() else args.columna
+    # surrogateescape conserva intactos los bytes que no son UTF-8 válido
+    with _abrir_entrada(args.entrada, newline="", errors="surrogateescape") as entrada, \
+            _abrir_salida(args.salida, newline="", errors="surrogateescape") as salida:
+        try:
+            num_rechazos = transformar_columna_csv(
+                entrada, salida, columna, args.operacion, delimitador=args.delimitador,
+                encabezado=not args.sin_encabezado, rechazo=args.rechazo, errores=sys.stderr,
+            )
+        except ValueError as error:
+            print(f"Error: {error}", file=sys.stderr)
+            return 1
+    return 1 if num_rechazos else 0
+
+
+def _verificar(args: argparse.Namespace) -> int:
+    """Ejecuta la verificación exhaustiva e imprime su resumen."""
+    from src.logic.verificacion import verificar
+    try:
+        resultado = verificar([ruta.strip() for ruta in args.rutas.split(",") if ruta.strip()],
+                              procesos=args.procesos)
+    except ValueError as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 2
+    print(resultado.resumen())
+    return 0 if resultado.exitoso else 1
+
+
+def _rotar(args: argparse.Namespace) -> int:
+    """Pasa registros de ancho fijo del plan anterior al nuevo sin descifrarlos."""
+    from src.logic.transcodificador import componer_planes, leer_plan, transcodificar_archivo
+    try:
+        anterior, nuevo = leer_plan(args.anterior), leer_plan(args.nuevo)
+        if args.en_sitio:
+            from src.logic.archivo_mapeado import transformar_en_sitio
+            transformar_en_sitio(args.entrada, "cifrar", componer_planes(anterior, nuevo))
+            return 0
+        with _abrir_binario(args.entrada, "rb") as entrada, _abrir_binario(args.salida, "wb") as salida:
+            transcodificar_archivo(entrada, salida, anterior, nuevo)
+    except ValueError as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _indexar(args: argparse.Namespace) -> int:
+    """Crea un archivo indexado a partir de códigos cifrados."""
+    from src.logic.registros_indexados import crear_indexado
+    try:
+        with _abrir_entrada(args.entrada) as entrada, open(args.salida, "wb") as salida:
+            crear_indexado(entrada, salida, args.tam_bloque, sumas=not args.sin_sumas)
+    except ValueError as error:
+        # No dejar un archivo indexado a medias
+        os.remove(args.salida)
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _consultar(args: argparse.Namespace) -> int:
+    """Imprime los registros pedidos de un archivo indexado, descifrados o no."""
+    from src.logic.registros_indexados import LectorIndexado
+    try:
+        with LectorIndexado(args.archivo, verificar=not args.sin_verificar) as lector:
+            leer = lector.cifrados if args.cifrados else lector.descifrar_rango
+            for registro in args.registros:
+                inicio, separador, fin = registro.partition(":")
+                inicio = int(inicio)
+                fin = int(fin) if separador else inicio + 1
+                if inicio < 0 and not separador:
+                    inicio, fin = inicio + len(lector), inicio + len(lector) + 1
+                sys.stdout.write("".join(codigo + "\n" for codigo in leer(inicio, fin)))
+    except (ValueError, IndexError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Función principal de la consola."""
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    if args.operacion == "verificar":
+        if args.procesos is not None and args.procesos < 1:
+            parser.error("--procesos debe ser positivo")
+        return _verificar(args)
+    if args.operacion in ("indexar", "consultar"):
+        if args.operacion == "indexar" and args.tam_bloque < 1:
+            parser.error("--tam-bloque debe ser positivo")
+        try:
+            return _indexar(args) if args.operacion == "indexar" else _consultar(args)
+        except BrokenPipeError:
+            return 0
+        except OSError as error:
+            print(f"Error: {error}", file=sys.stderr)
+            return 2
+    if args.operacion == "rotar":
+        if args.en_sitio and (args.entrada in (None, "-") or args.salida is not None):
+            parser.error("--en-sitio requiere un archivo de entrada (-i) y no admite -o")
+        try:
+            return _rotar(args)
+        except BrokenPipeError:
+            return 0
+        except OSError as error:
+            print(f"Error: {error}", file=sys.stderr)
+            return 2
+    if args.procesos is not None:
+        if args.procesos < 1 or args.tam_fragmento < 1:
+            parser.error("--procesos y --tam-fragmento deben ser positivos")
+        if args.entrada in (None, "-") or args.salida in (None, "-"):
+            parser.error("el modo paralelo requiere archivos de entrada y salida (-i y -o)")
+    if args.en_sitio:
+        if args.entrada in (None, "-") or args.salida is not None or args.procesos is not None:
+            parser.error("--en-sitio requiere un archivo de entrada (-i) y no admite -o ni --procesos")
+    if args.columna is not None and (args.en_sitio or args.procesos is not None):
+        parser.error("--columna no admite --en-sitio ni --procesos")
+    try:
+        return ejecutar(args)
+    except BrokenPipeError:
+        # La tubería de salida se cerró (p. ej. `| head`): terminar en silencio
+        return 0
+    except OSError as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
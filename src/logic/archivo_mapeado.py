@@ -0,0 +1,186 @@
+"""
+Módulo de cifrado en sitio de archivos de registros de ancho fijo.
+Proyecta el archivo en memoria (mmap) y reescribe cada bloque de registros
+sobre sí mismo, sin copiar el archivo completo a cadenas de Python.
+
+Como cifrar dos veces no equivale a cifrar una, el avance se registra para
+poder reanudar tras una interrupción:
+- RUTA.progreso guarda el desplazamiento ya procesado y los parámetros de la
+  operación (se reemplaza de forma atómica).
+- RUTA.diario guarda una copia del bloque que se está reescribiendo; si el
+  proceso se interrumpe a mitad del bloque, se restaura antes de reanudar.
+Ambos archivos se eliminan al terminar.
+"""
+
+import json
+import mmap
+import os
+from typing import Callable, Optional
+
+from src.logic.cipher import PLAN_POR_DEFECTO
+from src.logic.plan import PlanCifrado
+
+# Tamaño aproximado de cada bloque reescrito (se ajusta a páginas y registros)
+TAM_BLOQUE_MAPEADO = 4 << 20
+
+SUFIJO_PROGRESO = ".progreso"
+SUFIJO_DIARIO = ".diario"
+
+# Cabecera del diario: desplazamiento del bloque (8 bytes little-endian)
+_TAM_CABECERA_DIARIO = 8
+
+
+def _tam_bloque_alineado(tam_bloque: int, ancho: int) -> int:
+    """Ajusta el tamaño de bloque a un múltiplo común de la página y del registro."""
+    unidad = mmap.PAGESIZE * ancho
+    return max(tam_bloque // unidad, 1) * unidad
+
+
+def _escribir_atomico(ruta: str, datos: bytes):
+    """Escribe un archivo completo y lo reemplaza de forma atómica."""
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(datos)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+
+
+def _leer_progreso(ruta_progreso: str, esperado: dict) -> int:
+    """
+    Lee el punto de control de una ejecución interrumpida.
+
+    Returns:
+        Desplazamiento ya procesado (0 si no hay punto de control)
+
+    Raises:
+        ValueError: Si el punto de control corresponde a otra operación o archivo
+    """
+    try:
+        with open(ruta_progreso, "r", encoding="utf-8") as archivo:
+            progreso = json.load(archivo)
+    except FileNotFoundError:
+        return 0
+    except (OSError, ValueError) as error:
+        raise ValueError(f"Punto de control ilegible en {ruta_progreso}: {error}") from error
+
+    desplazamiento = progreso.pop("desplazamiento", None)
+    if progreso != esperado or not isinstance(desplazamiento, int):
+        raise ValueError(
+            f"El punto de control {ruta_progreso} corresponde a otra operación; "
+            "termine esa operación o elimine el archivo"
+        )
+    return desplazamiento
+
+
+def _restaurar_diario(ruta_diario: str, mapa: mmap.mmap, desplazamiento: int):
+    """Deshace la reescritura a medias del bloque que empieza en desplazamiento."""
+    try:
+        with open(ruta_diario, "rb") as archivo:
+            datos = archivo.read()
+    except FileNotFoundError:
+        return
+
+    if len(datos) > _TAM_CABECERA_DIARIO:
+        inicio = int.from_bytes(datos[:_TAM_CABECERA_DIARIO], "little")
+        copia = datos[_TAM_CABECERA_DIARIO:]
+        # Un diario de un bloque anterior ya confirmado no se aplica
+        if inicio == desplazamiento and inicio + len(copia) <= len(mapa):
+            mapa[inicio:inicio + len(copia)] = copia
+            mapa.flush()
+
+
+def transformar_en_sitio(
+    ruta: str,
+    operacion: str,
+    plan: PlanCifrado = PLAN_POR_DEFECTO,
+    separador: bytes = b"\n",
+    tam_bloque: int = TAM_BLOQUE_MAPEADO,
+    al_avanzar: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """
+    Cifra o descifra en sitio un archivo de registros de ancho fijo.
+
+    Antes de modificar nada comprueba que el archivo esté formado solo por
+    registros completos y válidos. Si existe un punto de control de una
+    ejecución interrumpida con los mismos parámetros, continúa desde él.
+
+    Args:
+        ruta: Archivo de registros (num_digitos dígitos seguidos del separador)
+        operacion: "cifrar" o "descifrar"
+        plan: Plan de cifrado a aplicar
+        separador: Bytes que terminan cada registro
+        tam_bloque: Tamaño aproximado en bytes de cada bloque reescrito
+        al_avanzar: Función opcional que recibe (bytes_procesados, tamano_total)
+
+    Returns:
+        Número de registros del archivo
+
+    Raises:
+        ValueError: Si la operación no existe, el archivo no está alineado,
+            algún registro es inválido o el punto de control no coincide
+    """
+    if operacion == "cifrar":
+        transformar = plan.cifrar_buffer
+    elif operacion == "descifrar":
+        transformar = plan.descifrar_buffer
+    else:
+        raise ValueError(f"Operación desconocida: {operacion}")
+
+    ancho = plan.num_digitos + len(separador)
+    tamano = os.path.getsize(ruta)
+    if tamano % ancho:
+        raise ValueError(f"El archivo no está alineado a registros de {ancho} bytes ({tamano} bytes)")
+    if tamano == 0:
+        return 0
+
+    ruta_progreso = ruta + SUFIJO_PROGRESO
+    ruta_diario = ruta + SUFIJO_DIARIO
+    parametros = {
+        "operacion": operacion,
+        "desplazamiento_cifrado": plan.desplazamiento,
+        "permutacion": list(plan.permutacion),
+        "separador": separador.hex(),
+        "tamano": tamano,
+    }
+    tam_bloque = _tam_bloque_alineado(tam_bloque, ancho)
+
+    with open(ruta, "r+b") as archivo, mmap.mmap(archivo.fileno(), 0) as mapa:
+        desplazamiento = _leer_progreso(ruta_progreso, parametros)
+        if desplazamiento % ancho or not 0 <= desplazamiento <= tamano:
+            raise ValueError(f"Desplazamiento de reanudación inválido: {desplazamiento}")
+        _restaurar_diario(ruta_diario, mapa, desplazamiento)
+
+        # Verificar todo el archivo antes de la primera escritura; tras una
+        # interrupción el prefijo ya procesado también son dígitos válidos
+        for inicio in range(0, tamano, tam_bloque):
+            try:
+                plan.validar_buffer(mapa[inicio:inicio + tam_bloque], separador)
+            except ValueError as error:
+                raise ValueError(f"{error} (bloque que empieza en el registro {inicio // ancho})") from None
+
+        _escribir_atomico(ruta_progreso, json.dumps(dict(parametros, desplazamiento=desplazamiento)).encode())
+        if al_avanzar is not None:
+            al_avanzar(desplazamiento, tamano)
+
+        while desplazamiento < tamano:
+            fin = min(desplazamiento + tam_bloque, tamano)
+            original = mapa[desplazamiento:fin]
+
+            # 1. Guardar el bloque original; 2. reescribirlo; 3. confirmar el avance
+            _escribir_atomico(ruta_diario, desplazamiento.to_bytes(_TAM_CABECERA_DIARIO, "little") + original)
+            mapa[desplazamiento:fin] = transformar(original, separador, validar=False)
+            inicio_pagina = desplazamiento - desplazamiento % mmap.ALLOCATIONGRANULARITY
+            mapa.flush(inicio_pagina, fin - inicio_pagina)
+            desplazamiento = fin
+            _escribir_atomico(ruta_progreso, json.dumps(dict(parametros, desplazamiento=desplazamiento)).encode())
+
+            if al_avanzar is not None:
+                al_avanzar(desplazamiento, tamano)
+
+    for ruta_auxiliar in (ruta_diario, ruta_progreso):
+        try:
+            os.remove(ruta_auxiliar)
+        except FileNotFoundError:
+            pass
+    return tamano // ancho
@@ -3,10 +3,35 @@ Módulo de lógica de cifrado y descifrado.
 Contiene las funciones para cifrar y descifrar números de 6 dígitos.
 """
 
+from src.logic.plan import compilar_plan
+
+# Parámetros del algoritmo
+NUM_DIGITOS = 6
+DESPLAZAMIENTO = 7
+# Posición de origen de cada dígito tras los intercambios 1º↔3º, 2º↔4º, 5º↔6º.
+# Como cada intercambio es su propio inverso, sirve igual para descifrar.
+PERMUTACION = (2, 3, 0, 1, 5, 4)
+
+# Plan compilado con los parámetros por defecto (ver src/logic/plan.py)
+PLAN_POR_DEFECTO = compilar_plan(DESPLAZAMIENTO, NUM_DIGITOS, PERMUTACION)
+
 
 class CipherLogic:
     """Clase que encapsula la lógica de cifrado y descifrado."""
 
+    # Motor de tablas precalculadas (ver src/logic/tabla.py); None = cálculo por dígitos
+    _tabla = None
+
+    @classmethod
+    def usar_tabla(cls, tabla):
+        """
+        Activa un motor de tablas para cifrar() y descifrar().
+
+        Args:
+            tabla: Instancia de TablaCifrado, o None para volver al cálculo por dígitos
+        """
+        cls._tabla = tabla
+
     @staticmethod
     def cifrar(numero_str: str) -> str:
         """
@@ -22,6 +47,14 @@ class CipherLogic:
         Returns:
             Cadena con el número cifrado
         """
+        if len(numero_str) == NUM_DIGITOS and numero_str.isascii() and numero_str.isdigit():
+            tabla = CipherLogic._tabla
+            if tabla is not None:
+                return tabla.cifrar(numero_str)
+            # Función generada para el plan (ver PLAN_POR_DEFECTO.fuente_cifrar)
+            return PLAN_POR_DEFECTO.cifrar_generado(numero_str)
+
+        # Ruta general (dígitos Unicode u otras longitudes)
         # Cifrado: sumar 7 y obtener residuo de división entre 10
         digitos_cifrados = []
         for digito in numero_str:
@@ -51,6 +84,13 @@ class CipherLogic:
         Returns:
             Cadena con el número original
         """
+        if len(numero_str) == NUM_DIGITOS and numero_str.isascii() and numero_str.isdigit():
+            tabla = CipherLogic._tabla
+            if tabla is not None:
+                return tabla.descifrar(numero_str)
+            return PLAN_POR_DEFECTO.descifrar_generado(numero_str)
+
+        # Ruta general (dígitos Unicode u otras longitudes)
         # Paso 1: Invertir los intercambios (1er con 3er, 2do con 4to, 5to con 6to)
         digitos_desintercambiados = list(numero_str)
         digitos_desintercambiados[0], digitos_desintercambiados[2] = numero_str[2], numero_str[0]
@@ -64,3 +104,157 @@ class CipherLogic:
             digitos_originales.append(str(original))
 
         return ''.join(digitos_originales)
+
+    @staticmethod
+    def cifrar_entero(numero: int) -> int:
+        """
+        Cifra un número de 6 dígitos representado como entero, sin pasar por cadenas.
+
+        Los ceros a la izquierda son implícitos: cifrar_entero(123) equivale a
+        cifrar("000123").
+
+        Args:
+            numero: Entero entre 0 y 999999
+
+        Returns:
+            Entero con el número cifrado
+
+        Raises:
+            ValueError: Si el número está fuera de rango
+        """
+        tabla = CipherLogic._tabla
+        if tabla is not None and 0 <= numero < len(tabla.directa):
+            return tabla.directa[numero]
+        return PLAN_POR_DEFECTO.cifrar_entero(numero)
+
+    @staticmethod
+    def descifrar_entero(numero: int) -> int:
+        """
+        Descifra un número de 6 dígitos representado como entero.
+
+        Args:
+            numero: Entero entre 0 y 999999
+
+        Returns:
+            Entero con el número original
+
+        Raises:
+            ValueError: Si el número está fuera de rango
+        """
+        tabla = CipherLogic._tabla
+        if tabla is not None and 0 <= numero < len(tabla.inversa):
+            return tabla.inversa[numero]
+        return PLAN_POR_DEFECTO.descifrar_entero(numero)
+
+    @staticmethod
+    def cifrar_enteros(numeros):
+        """
+        Cifra una columna de enteros (arreglo NumPy, array('I') o iterable).
+
+        Returns:
+            Resultado del mismo tipo que la entrada (lista si es un iterable genérico)
+        """
+        return PLAN_POR_DEFECTO.cifrar_enteros(numeros)
+
+    @staticmethod
+    def descifrar_enteros(numeros):
+        """
+        Descifra una columna de enteros (arreglo NumPy, array('I') o iterable).
+
+        Returns:
+            Resultado del mismo tipo que la entrada (lista si es un iterable genérico)
+        """
+        return PLAN_POR_DEFECTO.descifrar_enteros(numeros)
+
+    @staticmethod
+    def cifrar_lote(numeros):
+        """
+        Cifra un lote de números de 6 dígitos con operaciones vectorizadas.
+
+        Acepta un arreglo NumPy de enteros (0-999999) o una matriz (N, 6)
+        de dígitos, y devuelve el resultado con la misma forma y tipo.
+
+        Args:
+            numeros: Arreglo de enteros o matriz de dígitos
+
+        Returns:
+            Arreglo NumPy con los números cifrados
+        """
+        return PLAN_POR_DEFECTO.cifrar_lote(numeros)
+
+    @staticmethod
+    def descifrar_lote(numeros):
+        """
+        Descifra un lote de números de 6 dígitos con operaciones vectorizadas.
+
+        Args:
+            numeros: Arreglo de enteros o matriz (N, 6) de dígitos cifrados
+
+        Returns:
+            Arreglo NumPy con los números originales
+        """
+        return PLAN_POR_DEFECTO.descifrar_lote(numeros)
+
+    @staticmethod
+    def cifrar_buffer(datos, separador: bytes = b"\n", validar: bool = True) -> bytearray:
+        """
+        Cifra un búfer de registros de ancho fijo sin crear objetos por registro.
+
+        Cada registro son 6 dígitos ASCII seguidos del separador. El paso
+        "sumar 7" se aplica con una sola traducción del búfer y los
+        intercambios con asignaciones por rebanadas con paso.
+
+        Args:
+            datos: bytes, bytearray o memoryview con registros completos
+            separador: Bytes que siguen a cada registro (b"" para registros contiguos)
+            validar: Comprobar que los registros solo contengan dígitos y separadores
+
+        Returns:
+            bytearray con los registros cifrados
+
+        Raises:
+            ValueError: Si el búfer no está formado por registros válidos
+        """
+        return PLAN_POR_DEFECTO.cifrar_buffer(datos, separador, validar)
+
+    @staticmethod
+    def descifrar_buffer(datos, separador: bytes = b"\n", validar: bool = True) -> bytearray:
+        """
+        Descifra un búfer de registros de ancho fijo sin crear objetos por registro.
+
+        Args:
+            datos: bytes, bytearray o memoryview con registros cifrados completos
+            separador: Bytes que siguen a cada registro (b"" para registros contiguos)
+            validar: Comprobar que los registros solo contengan dígitos y separadores
+
+        Returns:
+            bytearray con los registros originales
+
+        Raises:
+            ValueError: Si el búfer no está formado por registros válidos
+        """
+        return PLAN_POR_DEFECTO.descifrar_buffer(datos, separador, validar)
+
+    @staticmethod
+    def cifrar_empaquetado(datos, formato: str) -> bytes:
+        """
+        Cifra códigos empaquetados en formato "bcd" o "bits20" sin pasarlos a texto.
+
+        Args:
+            datos: Códigos empaquetados (ver src/logic/empaquetado.py), sin cabecera
+            formato: "bcd" o "bits20"
+
+        Returns:
+            Códigos cifrados en el mismo formato
+
+        Raises:
+            ValueError: Si los datos no forman códigos válidos
+        """
+        from src.logic.empaquetado import cifrar_empaquetado
+        return cifrar_empaquetado(datos, formato, PLAN_POR_DEFECTO)
+
+    @staticmethod
+    def descifrar_empaquetado(datos, formato: str) -> bytes:
+        """Descifra códigos empaquetados en formato "bcd" o "bits20" sin pasarlos a texto."""
+        from src.logic.empaquetado import descifrar_empaquetado
+        return descifrar_empaquetado(datos, formato, PLAN_POR_DEFECTO)
@@ -0,0 +1,277 @@
+"""
+Módulo de transformación de una columna de archivos CSV en flujo.
+Cifra o descifra los códigos de una sola columna y copia todo lo demás
+(otras columnas, comillas, delimitadores y finales de línea) sin cambios.
+
+El archivo se procesa en bloques de filas de tamaño fijo, de modo que la
+memoria usada no depende del tamaño del archivo. Los archivos deben abrirse
+con newline="" para conservar los finales de línea originales.
+"""
+
+from typing import Iterator, List, Optional, TextIO, Tuple, Union
+
+from src.logic.flujo import TAM_BLOQUE, transformar_en_bloques
+from src.utils.validators import Validator
+
+# Qué hacer con las filas cuyo código es inválido
+RECHAZO_ERROR = "error"          # Detener el proceso con ValueError
+RECHAZO_OMITIR = "omitir"        # No escribir la fila
+RECHAZO_CONSERVAR = "conservar"  # Escribir la fila sin cambios
+MODOS_RECHAZO = (RECHAZO_ERROR, RECHAZO_OMITIR, RECHAZO_CONSERVAR)
+
+MENSAJE_SIN_COLUMNA = "La fila no tiene la columna indicada"
+
+# Marcas de posición para las filas que no tienen un campo que transformar
+_SIN_COLUMNA = -1
+_EN_BLANCO = -2
+
+
+def _leer_registros(entrada: TextIO, comilla: str) -> Iterator[Tuple[int, str]]:
+    """
+    Agrupa las líneas físicas en registros CSV completos.
+
+    Un campo entre comillas puede contener saltos de línea; el registro sigue
+    abierto mientras el número de comillas sea impar (las comillas escapadas
+    como "" no alteran la paridad).
+
+    Yields:
+        Tupla (numero_linea, registro) con el número de su primera línea
+    """
+    numero_linea = 0
+    pendiente: List[str] = []
+    comillas = 0
+    for linea in entrada:
+        numero_linea += 1
+        if not pendiente:
+            # Caso común: una línea completa sin comillas abiertas
+            comillas = linea.count(comilla)
+            if comillas % 2 == 0:
+                yield numero_linea, linea
+                continue
+            inicio = numero_linea
+            pendiente.append(linea)
+            continue
+        pendiente.append(linea)
+        comillas += linea.count(comilla)
+        if comillas % 2 == 0:
+            yield inicio, "".join(pendiente)
+            pendiente = []
+    if pendiente:
+        yield inicio, "".join(pendiente)
+
+
+def _limites_campos(
+    registro: str, delimitador: str, comilla: str, hasta: Optional[int] = None
+) -> List[Tuple[int, int]]:
+    """
+    Calcula las posiciones (inicio, fin) de los campos de un registro.
+
+    Args:
+        registro: Registro completo, sin el final de línea
+        delimitador: Separador de campos
+        comilla: Carácter de comillas
+        hasta: Índice del último campo necesario (None = todos)
+
+    Returns:
+        Lista de posiciones de cada campo (con sus comillas, si las tiene)
+    """
+    limites = []
+    inicio = 0
+    longitud = len(registro)
+    if comilla not in registro:
+        # Ruta rápida: sin comillas, cada delimitador separa un campo
+        while hasta is None or len(limites) <= hasta:
+            fin = registro.find(delimitador, inicio)
+            if fin < 0:
+                limites.append((inicio, longitud))
+                break
+            limites.append((inicio, fin))
+            inicio = fin + len(delimitador)
+        return limites
+
+    posicion = 0
+    entre_comillas = False
+    while posicion < longitud:
+        if registro[posicion] == comilla:
+            entre_comillas = not entre_comillas
+        elif not entre_comillas and registro.startswith(delimitador, posicion):
+            limites.append((inicio, posicion))
+            if hasta is not None and len(limites) > hasta:
+                return limites
+            posicion += len(delimitador)
+            inicio = posicion
+            continue
+        posicion += 1
+    limites.append((inicio, longitud))
+    return limites
+
+
+def _separar_final(registro: str) -> Tuple[str, str]:
+    """Separa el final de línea (\\n, \\r\\n o \\r) del cuerpo del registro."""
+    cuerpo = registro.rstrip("\r\n")
+    return cuerpo, registro[len(cuerpo):]
+
+
+def _quitar_comillas(campo: str, comilla: str) -> Tuple[str, bool]:
+    """Devuelve el valor de un campo sin comillas y si estaba entre comillas."""
+    if len(campo) >= 2 and campo[0] == comilla and campo[-1] == comilla:
+        return campo[1:-1].replace(comilla * 2, comilla), True
+    return campo, False
+
+
+def _resolver_columna(columna: Union[int, str], encabezado: Optional[str], delimitador: str, comilla: str) -> int:
+    """
+    Convierte un nombre de columna en su índice usando la fila de encabezado.
+
+    Raises:
+        ValueError: Si la columna no existe
+    """
+    if isinstance(columna, int):
+        if columna < 0:
+            raise ValueError("El índice de columna no puede ser negativo")
+        return columna
+    if encabezado is None:
+        raise ValueError("Para indicar la columna por nombre el archivo debe tener encabezado")
+
+    cuerpo, _ = _separar_final(encabezado)
+    nombres = [_quitar_comillas(cuerpo[inicio:fin], comilla)[0]
+               for inicio, fin in _limites_campos(cuerpo, delimitador, comilla)]
+    if columna not in nombres:
+        raise ValueError(f"No existe la columna {columna!r}; columnas disponibles: {', '.join(nombres)}")
+    return nombres.index(columna)
+
+
+def transformar_columna_csv(
+    entrada: TextIO,
+    salida: TextIO,
+    columna: Union[int, str],
+    operacion: str,
+    delimitador: str = ",",
+    comilla: str = '"',
+    encabezado: bool = True,
+    rechazo: str = RECHAZO_CONSERVAR,
+    errores: Optional[TextIO] = None,
+    tam_bloque: int = TAM_BLOQUE,
+) -> int:
+    """
+    Cifra o descifra una columna de un CSV en flujo, por bloques de filas.
+
+    Solo se reescribe el contenido de la columna indicada; si el campo estaba
+    entre comillas, el resultado también lo está. El resto de cada fila se
+    copia tal cual.
+
+    Args:
+        entrada: Archivo CSV de texto abierto con newline=""
+        salida: Archivo de texto abierto con newline=""
+        columna: Nombre de la columna (requiere encabezado) o índice desde 0
+        operacion: "cifrar" o "descifrar"
+        delimitador: Separador de campos
+        comilla: Carácter de comillas
+        encabezado: Si la primera fila es un encabezado (se copia sin cambios)
+        rechazo: "error", "omitir" o "conservar" para las filas inválidas
+        errores: Archivo de texto donde reportar las filas inválidas (opcional)
+        tam_bloque: Número de filas que se validan y transforman juntas
+
+    Returns:
+        Número de filas rechazadas
+
+    Raises:
+        ValueError: Si la columna no existe, el modo de rechazo es desconocido
+            o hay una fila inválida con rechazo="error"
+    """
+    if rechazo not in MODOS_RECHAZO:
+        raise ValueError(f"Modo de rechazo desconocido: {rechazo} (use {', '.join(MODOS_RECHAZO)})")
+    if tam_bloque <= 0:
+        raise ValueError("El tamaño de bloque debe ser positivo")
+
+    registros = _leer_registros(entrada, comilla)
+    fila_encabezado = None
+    if encabezado:
+        primero = next(registros, None)
+        if primero is None:
+            return 0
+        fila_encabezado = primero[1]
+    indice_columna = _resolver_columna(columna, fila_encabezado, delimitador, comilla)
+    if fila_encabezado is not None:
+        salida.write(fila_encabezado)
+
+    num_rechazos = 0
+    bloque: List[Tuple[int, str, int, int, bool]] = []
+    valores: List[str] = []
+
+    # Filas del bloque en blanco, sin la columna o con el campo entre comillas
+    especiales = 0
+
+    def procesar_bloque():
+        nonlocal num_rechazos, especiales
+        _, resultados, fallidos = next(transformar_en_bloques(valores, operacion, len(valores)))
+        if not fallidos and not especiales:
+            # Bloque sin filas especiales: reconstruir cada fila de una vez
+            partes = [registro[:inicio] + nuevo + registro[fin:]
+                      for (_, registro, inicio, fin, _), nuevo in zip(bloque, resultados)]
+        else:
+            partes = []
+            mensajes = {indice: Validator.mensaje_error(codigo_error) for indice, codigo_error in fallidos}
+            for indice, (numero_linea, registro, inicio, fin, con_comillas) in enumerate(bloque):
+                if inicio == _EN_BLANCO:
+                    partes.append(registro)
+                    continue
+                mensaje = MENSAJE_SIN_COLUMNA if inicio == _SIN_COLUMNA else mensajes.get(indice)
+                if mensaje is not None:
+                    if rechazo == RECHAZO_ERROR:
+                        raise ValueError(f"Línea {numero_linea}: {mensaje}")
+                    num_rechazos += 1
+                    if errores is not None:
+                        errores.write(f"Línea {numero_linea}: {mensaje}\n")
+                    if rechazo == RECHAZO_CONSERVAR:
+                        partes.append(registro)
+                    continue
+                nuevo = resultados[indice]
+                if con_comillas:
+                    nuevo = comilla + nuevo + comilla
+                partes.append(registro[:inicio])
+                partes.append(nuevo)
+                partes.append(registro[fin:])
+        salida.write("".join(partes))
+        bloque.clear()
+        valores.clear()
+        especiales = 0
+
+    ancho_delimitador = len(delimitador)
+    for numero_linea, registro in registros:
+        if comilla not in registro:
+            # Ruta rápida: sin comillas basta con dividir hasta la columna
+            campos = registro.split(delimitador, indice_columna + 1)
+            if len(campos) == 1 and not campos[0].rstrip("\r\n"):
+                inicio = _EN_BLANCO
+                especiales += 1
+            elif len(campos) > indice_columna:
+                valor = campos[indice_columna]
+                if len(campos) == indice_columna + 1:
+                    valor = valor.rstrip("\r\n")
+                inicio = sum(map(len, campos[:indice_columna])) + indice_columna * ancho_delimitador
+                fin = inicio + len(valor)
+                con_comillas = False
+            else:
+                inicio = _SIN_COLUMNA
+                especiales += 1
+        else:
+            cuerpo, _ = _separar_final(registro)
+            limites = _limites_campos(cuerpo, delimitador, comilla, indice_columna)
+            if len(limites) > indice_columna:
+                inicio, fin = limites[indice_columna]
+                valor, con_comillas = _quitar_comillas(cuerpo[inicio:fin], comilla)
+            else:
+                inicio = _SIN_COLUMNA
+            especiales += 1
+        if inicio < 0:
+            # Las líneas en blanco se copian; las filas cortas se rechazan
+            fin, valor, con_comillas = inicio, "", False
+        bloque.append((numero_linea, registro, inicio, fin, con_comillas))
+        valores.append(valor)
+        if len(bloque) >= tam_bloque:
+            procesar_bloque()
+
+    if bloque:
+        procesar_bloque()
+    return num_rechazos
@@ -0,0 +1,455 @@
+"""
+Módulo de almacenamiento compacto de códigos de 6 dígitos.
+
+Un contenedor empaquetado es una cabecera de 16 bytes seguida de los códigos
+en uno de dos formatos:
+
+    bcd     3 bytes por código, dos dígitos por byte (123456 -> 12 34 56)
+    bits20  enteros de 20 bits; cada par de códigos ocupa 5 bytes
+
+Frente a una línea de texto de 7 bytes, bcd ocupa el 43 % y bits20 el 36 %.
+Ambos formatos se cifran sin pasar por texto: bcd traduce columnas de bytes
+con tablas de 256 entradas y bits20 opera sobre los enteros.
+"""
+
+import os
+import struct
+from functools import lru_cache
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+from src.logic.cipher import PLAN_POR_DEFECTO
+from src.logic.plan import PlanCifrado
+
+MAGIA = b"CIFPAQ"
+VERSION = 1
+# Cabecera: magia, versión, formato y cantidad de códigos (little-endian)
+CABECERA = struct.Struct("<6sBBQ")
+
+FORMATO_BCD = "bcd"
+FORMATO_BITS20 = "bits20"
+FORMATOS = (FORMATO_BCD, FORMATO_BITS20)
+_CODIGOS_FORMATO = {FORMATO_BCD: 1, FORMATO_BITS20: 2}
+
+NUM_DIGITOS_EMPAQUETADO = 6
+LIMITE_CODIGO = 10 ** NUM_DIGITOS_EMPAQUETADO
+_MASCARA_20 = (1 << 20) - 1
+# Bytes de un grupo completo: 1 código en bcd, 2 códigos en bits20
+_BYTES_GRUPO = {FORMATO_BCD: 3, FORMATO_BITS20: 5}
+_CODIGOS_GRUPO = {FORMATO_BCD: 1, FORMATO_BITS20: 2}
+# Códigos por bloque al transformar contenedores en flujo
+TAM_BLOQUE_EMPAQUETADO = 1 << 18
+
+# Bytes con sus dos mitades entre 0 y 9
+_BYTES_BCD_VALIDOS = bytes(valor for valor in range(256) if valor >> 4 <= 9 and valor & 15 <= 9)
+
+
+def _numpy():
+    """Devuelve el módulo numpy, o None si no está instalado."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _comprobar_formato(formato: str):
+    if formato not in _CODIGOS_FORMATO:
+        raise ValueError(f"Formato desconocido: {formato} (use {' o '.join(FORMATOS)})")
+
+
+def _comprobar_plan(plan: PlanCifrado):
+    if plan.num_digitos != NUM_DIGITOS_EMPAQUETADO:
+        raise ValueError(f"El formato empaquetado requiere un plan de {NUM_DIGITOS_EMPAQUETADO} dígitos")
+
+
+def tam_empaquetado(cantidad: int, formato: str) -> int:
+    """Bytes que ocupan `cantidad` códigos en el formato dado (sin cabecera)."""
+    _comprobar_formato(formato)
+    if formato == FORMATO_BCD:
+        return 3 * cantidad
+    return 5 * (cantidad // 2) + 3 * (cantidad % 2)
+
+
+def contar_codigos(datos, formato: str) -> int:
+    """
+    Deduce la cantidad de códigos a partir del tamaño de los datos empaquetados.
+
+    Raises:
+        ValueError: Si el tamaño no corresponde a códigos completos
+    """
+    _comprobar_formato(formato)
+    longitud = len(datos)
+    if formato == FORMATO_BCD and longitud % 3 == 0:
+        return longitud // 3
+    if formato == FORMATO_BITS20 and longitud % 5 in (0, 3):
+        return 2 * (longitud // 5) + (longitud % 5 == 3)
+    raise ValueError(f"{longitud} bytes no forman códigos completos en formato {formato}")
+
+
+# ==================== Empaquetar y desempaquetar ====================
+
+def empaquetar(numeros, formato: str) -> bytes:
+    """
+    Empaqueta códigos representados como enteros entre 0 y 999999.
+
+    Args:
+        numeros: Arreglo NumPy, array.array o iterable de enteros
+        formato: "bcd" o "bits20"
+
+    Raises:
+        ValueError: Si algún número está fuera de rango
+    """
+    _comprobar_formato(formato)
+    np = _numpy()
+    if np is not None and isinstance(numeros, np.ndarray):
+        return _empaquetar_numpy(np, numeros, formato)
+
+    numeros = list(numeros)
+    if numeros and not 0 <= min(numeros) <= max(numeros) < LIMITE_CODIGO:
+        raise ValueError(f"Los números deben estar entre 0 y {LIMITE_CODIGO - 1}")
+    if formato == FORMATO_BCD:
+        # Los dígitos decimales de cada código son, literalmente, su BCD en hexadecimal
+        return bytes.fromhex(("%06d" * len(numeros)) % tuple(numeros))
+
+    pares = [(a | b << 20).to_bytes(5, "little") for a, b in zip(numeros[0::2], numeros[1::2])]
+    if len(numeros) % 2:
+        pares.append(numeros[-1].to_bytes(3, "little"))
+    return b"".join(pares)
+
+
+def _empaquetar_numpy(np, numeros, formato: str) -> bytes:
+    valores = numeros.astype(np.int64).ravel()
+    if valores.size and (valores.min() < 0 or valores.max() >= LIMITE_CODIGO):
+        raise ValueError(f"Los números deben estar entre 0 y {LIMITE_CODIGO - 1}")
+    if formato == FORMATO_BCD:
+        digitos = (valores[:, None] // 10 ** np.arange(5, -1, -1)) % 10
+        return (digitos[:, 0::2] << 4 | digitos[:, 1::2]).astype(np.uint8).tobytes()
+
+    impar = valores.size % 2
+    pares = valores[:valores.size - impar]
+    grupos = (pares[0::2] | pares[1::2] << 20).astype("<u8").view(np.uint8).reshape(-1, 8)[:, :5]
+    cola = int(valores[-1]).to_bytes(3, "little") if impar else b""
+    return grupos.tobytes() + cola
+
+
+def desempaquetar(datos, formato: str) -> List[int]:
+    """
+    Desempaqueta códigos a una lista de enteros.
+
+    Raises:
+        ValueError: Si los datos no forman códigos completos o hay dígitos BCD inválidos
+    """
+    cantidad = contar_codigos(datos, formato)
+    datos = bytes(datos)
+    if formato == FORMATO_BCD:
+        _validar_bcd(datos)
+        texto = datos.hex()
+        return [int(texto[inicio:inicio + 6]) for inicio in range(0, len(texto), 6)]
+
+    numeros = []
+    for inicio in range(0, len(datos) - 4, 5):
+        par = int.from_bytes(datos[inicio:inicio + 5], "little")
+        numeros.append(par & _MASCARA_20)
+        numeros.append(par >> 20)
+    if cantidad % 2:
+        numeros.append(int.from_bytes(datos[-3:], "little"))
+    _validar_rango(numeros)
+    return numeros
+
+
+def _validar_bcd(datos: bytes):
+    """Comprueba que todas las mitades de byte sean dígitos e indica el primer código inválido."""
+    if datos.translate(None, _BYTES_BCD_VALIDOS):
+        for inicio in range(0, len(datos), 3):
+            if datos[inicio:inicio + 3].translate(None, _BYTES_BCD_VALIDOS):
+                raise ValueError(f"Código {inicio // 3} inválido: {datos[inicio:inicio + 3].hex()} no es BCD")
+
+
+def _validar_rango(numeros):
+    for indice, numero in enumerate(numeros):
+        if numero >= LIMITE_CODIGO:
+            raise ValueError(f"Código {indice} inválido: {numero} tiene más de {NUM_DIGITOS_EMPAQUETADO} dígitos")
+
+
+# ==================== Cifrado en el dominio empaquetado ====================
+
+@lru_cache(maxsize=None)
+def _tablas_bcd(desplazamiento: int, origenes: Tuple[int, ...]) -> List[List[Tuple[int, bytes]]]:
+    """
+    Para cada byte de salida, lista de (byte de origen, tabla de traducción).
+
+    Cada tabla toma un byte de entrada, extrae el dígito (o los dos dígitos)
+    que van al byte de salida, les suma el desplazamiento y los coloca en su
+    mitad. Si ambos dígitos vienen del mismo byte basta con una tabla.
+    """
+    bytes_salida = []
+    for destino in range(0, NUM_DIGITOS_EMPAQUETADO, 2):
+        contribuciones = {}
+        for mitad, origen in ((4, origenes[destino]), (0, origenes[destino + 1])):
+            desplazar_origen = 4 if origen % 2 == 0 else 0
+            tabla = contribuciones.setdefault(origen // 2, [0] * 256)
+            for valor in range(256):
+                digito = (valor >> desplazar_origen) & 15
+                if digito <= 9:
+                    tabla[valor] |= ((digito + desplazamiento) % 10) << mitad
+        bytes_salida.append([(byte_origen, bytes(tabla)) for byte_origen, tabla in sorted(contribuciones.items())])
+    return bytes_salida
+
+
+def _transformar_bcd(datos: bytes, desplazamiento: int, origenes: Tuple[int, ...]) -> bytes:
+    _validar_bcd(datos)
+    resultado = bytearray(len(datos))
+    for destino, contribuciones in enumerate(_tablas_bcd(desplazamiento % 10, origenes)):
+        columnas = [datos[origen::3].translate(tabla) for origen, tabla in contribuciones]
+        if len(columnas) == 1:
+            resultado[destino::3] = columnas[0]
+        else:
+            # Las dos mitades no se solapan: un OR entre enteros grandes las combina de una vez
+            combinado = int.from_bytes(columnas[0], "big") | int.from_bytes(columnas[1], "big")
+            resultado[destino::3] = combinado.to_bytes(len(columnas[0]), "big")
+    return bytes(resultado)
+
+
+def _transformar_bits20(datos: bytes, funcion_lote, funcion_entero) -> bytes:
+    np = _numpy()
+    if np is None:
+        return empaquetar([funcion_entero(numero) for numero in desempaquetar(datos, FORMATO_BITS20)],
+                          FORMATO_BITS20)
+
+    cantidad = contar_codigos(datos, FORMATO_BITS20)
+    completos = len(datos) // 5 * 5
+    grupos = np.zeros((completos // 5, 8), dtype=np.uint8)
+    grupos[:, :5] = np.frombuffer(datos, dtype=np.uint8, count=completos).reshape(-1, 5)
+    pares = grupos.view("<u8").ravel()
+    numeros = np.empty(cantidad, dtype=np.int64)
+    numeros[0:completos // 5 * 2:2] = pares & _MASCARA_20
+    numeros[1:completos // 5 * 2:2] = pares >> 20
+    if cantidad % 2:
+        numeros[-1] = int.from_bytes(datos[-3:], "little")
+    if numeros.size and numeros.max() >= LIMITE_CODIGO:
+        _validar_rango(numeros.tolist())
+    return _empaquetar_numpy(np, funcion_lote(numeros), FORMATO_BITS20)
+
+
+def cifrar_empaquetado(datos, formato: str, plan: PlanCifrado = PLAN_POR_DEFECTO) -> bytes:
+    """
+    Cifra códigos empaquetados sin pasarlos a texto.
+
+    Args:
+        datos: Códigos empaquetados (sin cabecera)
+        formato: "bcd" o "bits20"
+        plan: Plan de cifrado de 6 dígitos
+
+    Returns:
+        Códigos cifrados en el mismo formato
+
+    Raises:
+        ValueError: Si los datos no forman códigos válidos
+    """
+    _comprobar_formato(formato)
+    _comprobar_plan(plan)
+    datos = bytes(datos)
+    if formato == FORMATO_BCD:
+        return _transformar_bcd(datos, plan.desplazamiento, plan.permutacion)
+    return _transformar_bits20(datos, plan.cifrar_lote, plan.cifrar_entero)
+
+
+def descifrar_empaquetado(datos, formato: str, plan: PlanCifrado = PLAN_POR_DEFECTO) -> bytes:
+    """Descifra códigos empaquetados sin pasarlos a texto (ver cifrar_empaquetado)."""
+    _comprobar_formato(formato)
+    _comprobar_plan(plan)
+    datos = bytes(datos)
+    if formato == FORMATO_BCD:
+        return _transformar_bcd(datos, -plan.desplazamiento, plan.permutacion_inversa)
+    return _transformar_bits20(datos, plan.descifrar_lote, plan.descifrar_entero)
+
+
+# ==================== Contenedores ====================
+
+class EscritorEmpaquetado:
+    """Escribe un contenedor empaquetado en flujo; la cantidad se fija al cerrar."""
+
+    def __init__(self, archivo: BinaryIO, formato: str):
+        """
+        Args:
+            archivo: Archivo binario de escritura con posicionamiento (seek)
+            formato: "bcd" o "bits20"
+        """
+        _comprobar_formato(formato)
+        self.archivo = archivo
+        self.formato = formato
+        self.cantidad = 0
+        self._inicio = archivo.tell()
+        self._pendiente: Optional[int] = None
+        # En bits20 la cola de 3 bytes de un número impar de códigos solo puede ir al final
+        self._cola_escrita = False
+        # La magia se escribe al cerrar: un contenedor a medias no se puede leer como válido
+        archivo.write(CABECERA.pack(bytes(len(MAGIA)), VERSION, _CODIGOS_FORMATO[formato], 0))
+
+    def __enter__(self) -> "EscritorEmpaquetado":
+        return self
+
+    def __exit__(self, *exc):
+        if exc[0] is None:
+            self.cerrar()
+
+    def escribir(self, numeros):
+        """Agrega códigos (enteros entre 0 y 999999) al contenedor."""
+        self._comprobar_abierto()
+        numeros = list(numeros)
+        if self._pendiente is not None:
+            # En bits20 un código impar espera a su pareja
+            numeros.insert(0, self._pendiente)
+            self._pendiente = None
+        if self.formato == FORMATO_BITS20 and len(numeros) % 2:
+            self._pendiente = numeros.pop()
+        self.archivo.write(empaquetar(numeros, self.formato))
+        self.cantidad += len(numeros)
+
+    def escribir_empaquetado(self, datos):
+        """
+        Agrega códigos ya empaquetados en el formato del contenedor.
+
+        Raises:
+            ValueError: Si los datos están incompletos o no pueden ir tras lo ya escrito
+        """
+        self._comprobar_abierto()
+        if self._pendiente is not None:
+            raise ValueError("No se pueden agregar datos empaquetados tras un número impar de códigos")
+        cantidad = contar_codigos(datos, self.formato)
+        self.archivo.write(datos)
+        self.cantidad += cantidad
+        self._cola_escrita = self.formato == FORMATO_BITS20 and cantidad % 2 == 1
+
+    def _comprobar_abierto(self):
+        if self._cola_escrita:
+            raise ValueError("El contenedor ya terminó con un número impar de códigos")
+
+    def cerrar(self):
+        """Escribe el código pendiente y la cabecera definitiva (magia y cantidad)."""
+        if self._pendiente is not None:
+            self.archivo.write(empaquetar([self._pendiente], self.formato))
+            self.cantidad += 1
+            self._pendiente = None
+            self._cola_escrita = self.formato == FORMATO_BITS20
+        final = self.archivo.tell()
+        self.archivo.seek(self._inicio)
+        self.archivo.write(CABECERA.pack(MAGIA, VERSION, _CODIGOS_FORMATO[self.formato], self.cantidad))
+        self.archivo.seek(final)
+
+
+def _leer_completo(archivo: BinaryIO, tam: int) -> bytes:
+    """Lee `tam` bytes aunque el archivo los entregue en varias partes (tuberías); menos solo al final."""
+    datos = archivo.read(tam)
+    while len(datos) < tam:
+        resto = archivo.read(tam - len(datos))
+        if not resto:
+            break
+        datos += resto
+    return datos
+
+
+class LectorEmpaquetado:
+    """Lee un contenedor empaquetado por bloques."""
+
+    def __init__(self, archivo: BinaryIO):
+        """
+        Raises:
+            ValueError: Si el archivo no es un contenedor empaquetado
+        """
+        cabecera = _leer_completo(archivo, CABECERA.size)
+        if len(cabecera) != CABECERA.size:
+            raise ValueError("El archivo no tiene una cabecera de contenedor empaquetado")
+        magia, version, codigo_formato, cantidad = CABECERA.unpack(cabecera)
+        formatos = {codigo: formato for formato, codigo in _CODIGOS_FORMATO.items()}
+        if magia != MAGIA or version != VERSION or codigo_formato not in formatos:
+            raise ValueError("El archivo no es un contenedor empaquetado compatible")
+        self.archivo = archivo
+        self.formato = formatos[codigo_formato]
+        self.cantidad = cantidad
+
+    def bloques_empaquetados(self, tam_bloque: int = TAM_BLOQUE_EMPAQUETADO) -> Iterator[bytes]:
+        """
+        Devuelve los datos empaquetados en bloques de unos `tam_bloque` códigos.
+
+        Raises:
+            ValueError: Si el archivo está truncado
+        """
+        grupos = max(tam_bloque // _CODIGOS_GRUPO[self.formato], 1)
+        restantes = tam_empaquetado(self.cantidad, self.formato)
+        while restantes:
+            tam = min(grupos * _BYTES_GRUPO[self.formato], restantes)
+            datos = _leer_completo(self.archivo, tam)
+            if len(datos) < tam:
+                raise ValueError("El contenedor está truncado")
+            restantes -= len(datos)
+            yield datos
+
+    def bloques(self, tam_bloque: int = TAM_BLOQUE_EMPAQUETADO) -> Iterator[List[int]]:
+        """Devuelve los códigos como listas de enteros, por bloques."""
+        for datos in self.bloques_empaquetados(tam_bloque):
+            yield desempaquetar(datos, self.formato)
+
+    def leer_todo(self) -> List[int]:
+        """Devuelve todos los códigos restantes como enteros."""
+        return [numero for bloque in self.bloques() for numero in bloque]
+
+
+def escribir_contenedor(ruta: str, numeros: Iterable[int], formato: str = FORMATO_BITS20) -> int:
+    """
+    Guarda códigos en un contenedor empaquetado.
+
+    Returns:
+        Número de códigos escritos
+
+    Raises:
+        ValueError: Si algún código está fuera de rango (no se deja el archivo a medias)
+    """
+    try:
+        with open(ruta, "wb") as archivo, EscritorEmpaquetado(archivo, formato) as escritor:
+            escritor.escribir(numeros)
+    except ValueError:
+        os.remove(ruta)
+        raise
+    return escritor.cantidad
+
+
+def leer_contenedor(ruta: str) -> Tuple[str, List[int]]:
+    """Devuelve (formato, códigos) de un contenedor empaquetado."""
+    with open(ruta, "rb") as archivo:
+        lector = LectorEmpaquetado(archivo)
+        return lector.formato, lector.leer_todo()
+
+
+def transformar_contenedor(entrada: BinaryIO, salida: BinaryIO, operacion: str,
+                           plan: PlanCifrado = PLAN_POR_DEFECTO,
+                           tam_bloque: int = TAM_BLOQUE_EMPAQUETADO) -> int:
+    """
+    Cifra o descifra un contenedor completo, bloque a bloque y sin desempaquetar.
+
+    Args:
+        entrada: Contenedor de origen (binario)
+        salida: Archivo binario de escritura con posicionamiento (seek)
+        operacion: "cifrar" o "descifrar"
+
+    Returns:
+        Número de códigos transformados
+    """
+    if operacion == "cifrar":
+        funcion = cifrar_empaquetado
+    elif operacion == "descifrar":
+        funcion = descifrar_empaquetado
+    else:
+        raise ValueError(f"Operación desconocida: {operacion}")
+    _comprobar_plan(plan)
+
+    lector = LectorEmpaquetado(entrada)
+    with EscritorEmpaquetado(salida, lector.formato) as escritor:
+        procesados = 0
+        for datos in lector.bloques_empaquetados(tam_bloque):
+            try:
+                escritor.escribir_empaquetado(funcion(datos, lector.formato, plan))
+            except ValueError as error:
+                raise ValueError(f"{error} (bloque que empieza en el código {procesados})") from None
+            procesados += contar_codigos(datos, lector.formato)
+    return escritor.cantidad
@@ -0,0 +1,218 @@
+"""
+Módulo de procesamiento en flujo.
+Transforma secuencias de códigos línea a línea con memoria constante,
+sin depender de la interfaz gráfica.
+"""
+
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from src.logic.cipher import CipherLogic
+from src.utils.validators import Validator
+
+# Tamaño de los búferes de lectura y escritura (1 MiB)
+TAM_BUFFER = 1 << 20
+# Número de resultados que se acumulan antes de cada escritura
+TAM_LOTE_ESCRITURA = 8192
+# Número de códigos que se validan y transforman juntos
+TAM_BLOQUE = 8192
+
+# Operación -> método de CipherLogic (se busca en cada llamada para respetar la instrumentación)
+OPERACIONES: Dict[str, str] = {
+    "cifrar": "cifrar",
+    "descifrar": "descifrar",
+}
+
+OPERACIONES_BUFFER: Dict[str, str] = {
+    "cifrar": "cifrar_buffer",
+    "descifrar": "descifrar_buffer",
+}
+
+
+def transformar_lista(codigos: Sequence[str], operacion: str) -> List[str]:
+    """
+    Transforma una lista de códigos ya validados con una sola pasada por búfer.
+
+    Args:
+        codigos: Códigos de 6 dígitos (validados previamente)
+        operacion: "cifrar" o "descifrar"
+
+    Returns:
+        Lista de códigos transformados, en el mismo orden
+    """
+    if not codigos:
+        return []
+    datos = ("\n".join(codigos) + "\n").encode("ascii")
+    resultado = getattr(CipherLogic, OPERACIONES_BUFFER[operacion])(datos)
+    return resultado.decode("ascii").split("\n")[:-1]
+
+
+def transformar_en_bloques(
+    codigos: Sequence[str], operacion: str, tam_bloque: int = TAM_BLOQUE
+) -> Iterator[Tuple[int, List[str], List[Tuple[int, int]]]]:
+    """
+    Valida y transforma una secuencia de códigos por bloques.
+
+    Args:
+        codigos: Códigos a procesar
+        operacion: "cifrar" o "descifrar"
+        tam_bloque: Número de códigos por bloque
+
+    Yields:
+        Tupla (inicio, resultados, fallidos) por cada bloque
+        - inicio: Índice del primer código del bloque
+        - resultados: Código transformado de cada fila ("" si es inválida)
+        - fallidos: Tuplas (indice, codigo_error) con índices absolutos
+    """
+    for inicio in range(0, len(codigos), tam_bloque):
+        bloque = codigos[inicio:inicio + tam_bloque]
+        indices_fallidos, codigos_error = Validator.validar_lote(bloque)
+        if indices_fallidos:
+            invalidos = set(indices_fallidos)
+            validos = [codigo for indice, codigo in enumerate(bloque) if indice not in invalidos]
+            transformados = iter(transformar_lista(validos, operacion))
+            resultados = ["" if indice in invalidos else next(transformados) for indice in range(len(bloque))]
+        else:
+            resultados = transformar_lista(bloque, operacion)
+        fallidos = [(inicio + indice, codigo) for indice, codigo in zip(indices_fallidos, codigos_error)]
+        yield inicio, resultados, fallidos
+
+
+def _iter_transformar(
+    codigos: Iterable[str], operacion: str, tam_bloque: int, incluir_errores: bool
+) -> Iterator[Union[str, Tuple[int, str]]]:
+    """Agrupa un iterable en bloques y entrega los resultados de uno en uno."""
+    iterador = iter(codigos)
+    inicio = 0
+    while True:
+        bloque = list(islice(iterador, tam_bloque))
+        if not bloque:
+            return
+        _, resultados, fallidos = next(transformar_en_bloques(bloque, operacion, len(bloque)))
+        if not fallidos:
+            yield from resultados
+        else:
+            errores = dict(fallidos)
+            for indice, resultado in enumerate(resultados):
+                codigo_error = errores.get(indice)
+                if codigo_error is None:
+                    yield resultado
+                    continue
+                mensaje = Validator.mensaje_error(codigo_error)
+                if not incluir_errores:
+                    raise ValueError(f"Código {inicio + indice} inválido ({bloque[indice]!r}): {mensaje}")
+                yield inicio + indice, mensaje
+        inicio += len(bloque)
+
+
+def _comprobar_tam_bloque(tam_bloque: int):
+    """Valida el tamaño de bloque al llamar, antes de crear el generador."""
+    if tam_bloque <= 0:
+        raise ValueError("El tamaño de bloque debe ser positivo")
+
+
+def iter_cifrar(
+    codigos: Iterable[str], tam_bloque: int = TAM_BLOQUE, incluir_errores: bool = False
+) -> Iterator[Union[str, Tuple[int, str]]]:
+    """
+    Cifra un iterable de códigos de forma perezosa, por bloques.
+
+    Internamente toma tam_bloque códigos a la vez y los procesa con la ruta
+    por búfer, de modo que la memoria no depende de la longitud del iterable.
+
+    Args:
+        codigos: Iterable (posiblemente infinito) de códigos de 6 dígitos
+        tam_bloque: Número de códigos que se procesan juntos
+        incluir_errores: Si es True, entrega (indice, mensaje_error) en lugar
+            de cada código inválido; si es False, lanza ValueError
+
+    Yields:
+        Cada código cifrado, en el orden de la entrada
+
+    Raises:
+        ValueError: Si tam_bloque no es positivo (al llamar a la función) o ante
+            el primer código inválido, si incluir_errores es False (al iterar)
+    """
+    _comprobar_tam_bloque(tam_bloque)
+    return _iter_transformar(codigos, "cifrar", tam_bloque, incluir_errores)
+
+
+def iter_descifrar(
+    codigos: Iterable[str], tam_bloque: int = TAM_BLOQUE, incluir_errores: bool = False
+) -> Iterator[Union[str, Tuple[int, str]]]:
+    """
+    Descifra un iterable de códigos de forma perezosa, por bloques.
+
+    Args, Yields y Raises: igual que iter_cifrar
+    """
+    _comprobar_tam_bloque(tam_bloque)
+    return _iter_transformar(codigos, "descifrar", tam_bloque, incluir_errores)
+
+
+def transformar_lineas(
+    lineas: Iterable[str], operacion: str, inicio: int = 1
+) -> Iterator[Tuple[int, Optional[str], str]]:
+    """
+    Valida y transforma cada línea de la entrada.
+
+    Las líneas en blanco se ignoran; el resto se valida con
+    Validator.validar_numero_6_digitos antes de cifrar o descifrar. Una
+    línea que no se puede transformar se entrega como inválida.
+
+    Args:
+        lineas: Iterable de líneas de texto
+        operacion: "cifrar" o "descifrar"
+        inicio: Número de la primera línea (para los mensajes de error)
+
+    Yields:
+        Tupla (numero_linea, resultado, mensaje_error)
+        - resultado: Código transformado, o None si la línea es inválida
+        - mensaje_error: Mensaje del validador (vacío si es válida)
+    """
+    funcion = getattr(CipherLogic, OPERACIONES[operacion])
+    validar = Validator.validar_numero_6_digitos
+    for numero_linea, linea in enumerate(lineas, inicio):
+        codigo = linea.strip()
+        if not codigo:
+            continue
+        es_valido, mensaje_error = validar(codigo)
+        if not es_valido:
+            yield numero_linea, None, mensaje_error
+            continue
+        try:
+            resultado = funcion(codigo)
+        except ValueError as error:
+            # La línea se reporta como inválida y el flujo continúa
+            yield numero_linea, None, f"No se pudo {operacion}: {error}"
+            continue
+        yield numero_linea, resultado, ""
+
+
+def escribir_resultados(resultados: Iterable[Tuple[int, Optional[str], str]], salida, errores) -> int:
+    """
+    Escribe los resultados en lotes y reporta las líneas inválidas.
+
+    Args:
+        resultados: Tuplas producidas por transformar_lineas
+        salida: Archivo de texto para los códigos transformados
+        errores: Archivo de texto para los mensajes de error
+
+    Returns:
+        Número de líneas inválidas
+    """
+    lote = []
+    num_errores = 0
+    for numero_linea, resultado, mensaje_error in resultados:
+        if resultado is None:
+            num_errores += 1
+            errores.write(f"Línea {numero_linea}: {mensaje_error}\n")
+            continue
+        lote.append(resultado)
+        if len(lote) >= TAM_LOTE_ESCRITURA:
+            lote.append("")
+            salida.write("\n".join(lote))
+            lote = []
+    if lote:
+        lote.append("")
+        salida.write("\n".join(lote))
+    return num_errores
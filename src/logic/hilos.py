@@ -0,0 +1,233 @@
+"""
+Módulo de ejecución por lotes en un grupo de hilos.
+Divide arreglos de NumPy o búferes de registros en fragmentos y los cifra en
+paralelo dentro del mismo proceso, combinando los fragmentos en un único
+resultado y reportando el rendimiento de cada hilo.
+
+Solo hay paralelismo real cuando el trabajo de cada fragmento libera el GIL:
+las operaciones de NumPy lo hacen, mientras que bytes.translate y las
+rebanadas de bytes no. Por eso los búferes se procesan con NumPy cuando está
+instalado y con la ruta por búfer de PlanCifrado (sin paralelismo) si no.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from src.logic.cipher import PLAN_POR_DEFECTO
+from src.logic.plan import PlanCifrado
+
+# Registros (o enteros) por fragmento
+TAM_FRAGMENTO_HILOS = 1 << 18
+
+
+class EstadisticaHilo:
+    """Trabajo realizado por un hilo del grupo."""
+
+    def __init__(self, nombre: str):
+        self.nombre = nombre
+        self.fragmentos = 0
+        self.elementos = 0
+        self.segundos = 0.0
+
+    @property
+    def elementos_por_segundo(self) -> float:
+        return self.elementos / self.segundos if self.segundos > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (f"EstadisticaHilo({self.nombre!r}, fragmentos={self.fragmentos}, "
+                f"elementos={self.elementos}, {self.elementos_por_segundo:,.0f}/s)")
+
+
+class ResultadoHilos:
+    """Resultado combinado de una ejecución y estadísticas por hilo."""
+
+    def __init__(self, resultado, estadisticas: List[EstadisticaHilo], segundos: float, elementos: int):
+        self.resultado = resultado
+        self.estadisticas = estadisticas
+        self.segundos = segundos
+        self.elementos = elementos
+
+    @property
+    def elementos_por_segundo(self) -> float:
+        return self.elementos / self.segundos if self.segundos > 0 else 0.0
+
+
+def _numpy():
+    """Devuelve el módulo numpy, o None si no está instalado."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class EjecutorLotes:
+    """
+    Grupo de hilos reutilizable para cifrar lotes grandes.
+
+    Pensado para crearse una vez por proceso (por ejemplo, en cada trabajador
+    de un servidor web) y usarse desde varios hilos a la vez.
+    """
+
+    def __init__(self, hilos: Optional[int] = None, tam_fragmento: int = TAM_FRAGMENTO_HILOS,
+                 plan: PlanCifrado = PLAN_POR_DEFECTO):
+        """
+        Args:
+            hilos: Número de hilos (None = núcleos disponibles)
+            tam_fragmento: Registros o enteros por fragmento
+            plan: Plan de cifrado a aplicar
+        """
+        if tam_fragmento <= 0:
+            raise ValueError("El tamaño de fragmento debe ser positivo")
+        self.hilos = hilos or os.cpu_count() or 1
+        self.tam_fragmento = tam_fragmento
+        self.plan = plan
+        self._ejecutor = ThreadPoolExecutor(max_workers=self.hilos, thread_name_prefix="cifrado")
+
+    def __enter__(self) -> "EjecutorLotes":
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def cerrar(self):
+        """Detiene los hilos del grupo."""
+        self._ejecutor.shutdown(wait=True)
+
+    def cifrar(self, datos, separador: bytes = b"\n", validar: bool = True) -> ResultadoHilos:
+        """
+        Cifra un arreglo de NumPy (ver PlanCifrado.cifrar_lote) o un búfer de
+        registros (ver PlanCifrado.cifrar_buffer) repartiéndolo entre los hilos.
+
+        Returns:
+            ResultadoHilos cuyo resultado es un arreglo de NumPy o un bytearray,
+            según la entrada
+
+        Raises:
+            ValueError: Si algún registro o número es inválido
+        """
+        return self._ejecutar(datos, separador, validar, cifrar=True)
+
+    def descifrar(self, datos, separador: bytes = b"\n", validar: bool = True) -> ResultadoHilos:
+        """Descifra un arreglo o un búfer repartiéndolo entre los hilos (ver cifrar)."""
+        return self._ejecutar(datos, separador, validar, cifrar=False)
+
+    def _ejecutar(self, datos, separador: bytes, validar: bool, cifrar: bool) -> ResultadoHilos:
+        np = _numpy()
+        inicio = time.perf_counter()
+        if np is not None and isinstance(datos, np.ndarray):
+            resultado, tareas, elementos = self._preparar_lote(np, datos, cifrar)
+        else:
+            resultado, tareas, elementos = self._preparar_buffer(np, datos, separador, validar, cifrar)
+
+        estadisticas: Dict[str, EstadisticaHilo] = {}
+        candado = threading.Lock()
+
+        def ejecutar_tarea(tarea, num_elementos):
+            comienzo = time.perf_counter()
+            tarea()
+            duracion = time.perf_counter() - comienzo
+            nombre = threading.current_thread().name
+            with candado:
+                estadistica = estadisticas.setdefault(nombre, EstadisticaHilo(nombre))
+                estadistica.fragmentos += 1
+                estadistica.elementos += num_elementos
+                estadistica.segundos += duracion
+
+        futuros = [self._ejecutor.submit(ejecutar_tarea, tarea, num_elementos) for tarea, num_elementos in tareas]
+        for futuro in futuros:
+            futuro.result()
+
+        return ResultadoHilos(resultado, sorted(estadisticas.values(), key=lambda estadistica: estadistica.nombre),
+                              time.perf_counter() - inicio, elementos)
+
+    def _preparar_lote(self, np, arreglo, cifrar: bool):
+        """Prepara las tareas para un arreglo de enteros o una matriz de dígitos."""
+        funcion = self.plan.cifrar_lote if cifrar else self.plan.descifrar_lote
+        resultado = np.empty_like(arreglo)
+        total = len(arreglo)
+
+        def tarea(inicio):
+            def ejecutar():
+                fin = inicio + self.tam_fragmento
+                resultado[inicio:fin] = funcion(arreglo[inicio:fin])
+            return ejecutar
+
+        tareas = [(tarea(inicio), min(self.tam_fragmento, total - inicio))
+                  for inicio in range(0, total, self.tam_fragmento)]
+        return resultado, tareas, total
+
+    def _preparar_buffer(self, np, datos, separador: bytes, validar: bool, cifrar: bool):
+        """Prepara las tareas para un búfer de registros de ancho fijo."""
+        plan = self.plan
+        ancho = plan.num_digitos + len(separador)
+        vista = memoryview(datos).cast("B")
+        if len(vista) % ancho:
+            raise ValueError(f"El búfer debe contener registros completos de {ancho} bytes")
+        total = len(vista) // ancho
+        paso = self.tam_fragmento * ancho
+        resultado = bytearray(len(vista))
+
+        if np is None:
+            # Sin NumPy cada fragmento retiene el GIL: el resultado es correcto pero no escala
+            funcion = plan.cifrar_buffer if cifrar else plan.descifrar_buffer
+
+            def tarea(inicio):
+                def ejecutar():
+                    resultado[inicio:inicio + paso] = funcion(vista[inicio:inicio + paso], separador, validar)
+                return ejecutar
+        else:
+            origen = np.frombuffer(vista, dtype=np.uint8).reshape(-1, ancho)
+            destino = np.frombuffer(resultado, dtype=np.uint8).reshape(-1, ancho)
+            traduccion = np.frombuffer(plan.traduccion_cifrar if cifrar else plan.traduccion_descifrar, dtype=np.uint8)
+            columnas = list(plan.permutacion if cifrar else plan.permutacion_inversa)
+            bytes_separador = np.frombuffer(separador, dtype=np.uint8)
+            num_digitos = plan.num_digitos
+
+            def tarea(inicio):
+                def ejecutar():
+                    primero = inicio // ancho
+                    filas = slice(primero, primero + self.tam_fragmento)
+                    bloque = origen[filas]
+                    if validar and (((bloque[:, :num_digitos] - 48) > 9).any()
+                                    or (bloque[:, num_digitos:] != bytes_separador).any()):
+                        try:
+                            plan.validar_buffer(bloque.tobytes(), separador)
+                        except ValueError as error:
+                            raise ValueError(f"{error} (fragmento que empieza en el registro {primero})") from None
+                    # Columna a columna: cada una es una sola indexación con tabla
+                    for columna_destino, columna_origen in enumerate(columnas):
+                        destino[filas, columna_destino] = traduccion[bloque[:, columna_origen]]
+                    destino[filas, num_digitos:] = bloque[:, num_digitos:]
+                return ejecutar
+
+        tareas = [(tarea(inicio), min(self.tam_fragmento, total - inicio // ancho))
+                  for inicio in range(0, len(vista), paso)]
+        return resultado, tareas, total
+
+
+def transformar_en_hilos(datos, operacion: str = "cifrar", hilos: Optional[int] = None,
+                         tam_fragmento: int = TAM_FRAGMENTO_HILOS, plan: PlanCifrado = PLAN_POR_DEFECTO,
+                         separador: bytes = b"\n") -> ResultadoHilos:
+    """
+    Cifra o descifra un lote con un grupo de hilos temporal.
+
+    Para llamadas repetidas conviene crear un EjecutorLotes y reutilizarlo.
+
+    Args:
+        datos: Arreglo de NumPy o búfer de registros
+        operacion: "cifrar" o "descifrar"
+        hilos: Número de hilos (None = núcleos disponibles)
+        tam_fragmento: Registros o enteros por fragmento
+        plan: Plan de cifrado a aplicar
+        separador: Separador de registros (solo para búferes)
+    """
+    if operacion not in ("cifrar", "descifrar"):
+        raise ValueError(f"Operación desconocida: {operacion}")
+    with EjecutorLotes(hilos, tam_fragmento, plan) as ejecutor:
+        if operacion == "cifrar":
+            return ejecutor.cifrar(datos, separador)
+        return ejecutor.descifrar(datos, separador)
@@ -0,0 +1,139 @@
+"""
+Módulo de procesamiento paralelo de archivos.
+Divide la entrada en fragmentos alineados a fin de línea, los procesa en
+varios procesos y une las salidas en el orden original.
+"""
+
+import io
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from src.logic.flujo import transformar_lineas
+
+# Tamaño por defecto de cada fragmento (16 MiB)
+TAM_FRAGMENTO = 16 << 20
+
+
+def dividir_en_fragmentos(ruta: str, tam_fragmento: int = TAM_FRAGMENTO) -> List[Tuple[int, int]]:
+    """
+    Divide un archivo en rangos de bytes que terminan en un salto de línea.
+
+    Args:
+        ruta: Archivo a dividir
+        tam_fragmento: Tamaño aproximado de cada fragmento en bytes
+
+    Returns:
+        Lista de tuplas (inicio, fin) que cubren todo el archivo
+    """
+    if tam_fragmento <= 0:
+        raise ValueError("El tamaño de fragmento debe ser positivo")
+
+    tamano = os.path.getsize(ruta)
+    fragmentos = []
+    with open(ruta, "rb") as archivo:
+        inicio = 0
+        while inicio < tamano:
+            fin = inicio + tam_fragmento
+            if fin < tamano:
+                # Avanzar hasta el final de la línea en curso
+                archivo.seek(fin)
+                archivo.readline()
+                fin = archivo.tell()
+            else:
+                fin = tamano
+            fragmentos.append((inicio, fin))
+            inicio = fin
+    return fragmentos
+
+
+def _procesar_fragmento(ruta: str, inicio: int, fin: int, operacion: str) -> Tuple[bytes, List[Tuple[int, str]], int]:
+    """
+    Procesa un fragmento del archivo dentro de un proceso trabajador.
+
+    Returns:
+        Tupla (salida, errores, num_lineas)
+        - salida: Códigos transformados, codificados en UTF-8
+        - errores: Tuplas (linea_local, mensaje_error) de las líneas inválidas
+        - num_lineas: Líneas leídas en el fragmento
+    """
+    with open(ruta, "rb") as archivo:
+        archivo.seek(inicio)
+        datos = archivo.read(fin - inicio)
+
+    # Leer con el mismo envoltorio de texto que la ruta secuencial
+    texto = io.TextIOWrapper(io.BytesIO(datos), encoding="utf-8", errors="replace")
+    lineas = []
+    errores = []
+    num_lineas = 0
+
+    def contar(fuente):
+        nonlocal num_lineas
+        for linea in fuente:
+            num_lineas += 1
+            yield linea
+
+    for numero_linea, resultado, mensaje_error in transformar_lineas(contar(texto), operacion):
+        if resultado is None:
+            errores.append((numero_linea, mensaje_error))
+        else:
+            lineas.append(resultado)
+
+    if lineas:
+        lineas.append("")
+    return "\n".join(lineas).encode("utf-8"), errores, num_lineas
+
+
+def procesar_archivo_paralelo(
+    entrada: str,
+    salida: str,
+    operacion: str,
+    procesos: Optional[int] = None,
+    tam_fragmento: int = TAM_FRAGMENTO,
+    errores=None,
+) -> int:
+    """
+    Cifra o descifra un archivo usando varios procesos.
+
+    El resultado es idéntico byte a byte al de la ruta secuencial.
+
+    Args:
+        entrada: Archivo de entrada, un código por línea
+        salida: Archivo de salida
+        operacion: "cifrar" o "descifrar"
+        procesos: Número de procesos trabajadores (None = núcleos disponibles)
+        tam_fragmento: Tamaño aproximado de cada fragmento en bytes
+        errores: Archivo de texto donde reportar las líneas inválidas (opcional)
+
+    Returns:
+        Número de líneas inválidas
+    """
+    fragmentos = dividir_en_fragmentos(entrada, tam_fragmento)
+    procesos = procesos or os.cpu_count() or 1
+    num_errores = 0
+    lineas_previas = 0
+
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor, open(salida, "wb") as archivo_salida:
+        # Limitar los fragmentos en vuelo para que la memoria no crezca con el archivo
+        pendientes = deque()
+        restantes = iter(fragmentos)
+        for inicio, fin in restantes:
+            pendientes.append(ejecutor.submit(_procesar_fragmento, entrada, inicio, fin, operacion))
+            if len(pendientes) >= 2 * procesos:
+                break
+
+        while pendientes:
+            datos, errores_fragmento, num_lineas = pendientes.popleft().result()
+            siguiente = next(restantes, None)
+            if siguiente is not None:
+                pendientes.append(ejecutor.submit(_procesar_fragmento, entrada, *siguiente, operacion))
+
+            archivo_salida.write(datos)
+            num_errores += len(errores_fragmento)
+            if errores is not None:
+                for numero_linea, mensaje_error in errores_fragmento:
+                    errores.write(f"Línea {lineas_previas + numero_linea}: {mensaje_error}\n")
+            lineas_previas += num_lineas
+
+    return num_errores
@@ -0,0 +1,423 @@
+"""
+Módulo de planes de cifrado.
+Generaliza el algoritmo a N dígitos con desplazamiento y permutación
+configurables. La configuración se compila una sola vez en un plan con los
+índices y las tablas de traducción ya calculados.
+"""
+
+import linecache
+from array import array
+from functools import lru_cache
+from typing import Callable, Iterable, List, Sequence, Tuple
+
+DIGITOS_ASCII = b"0123456789"
+# Mayor número de dígitos que cabe en un entero de 64 bits con signo
+MAX_DIGITOS_ENTERO = 18
+# Dígitos por bloque en la ruta entera (tablas de 10^3 contribuciones)
+DIGITOS_POR_BLOQUE = 3
+_BASE_BLOQUE = 10 ** DIGITOS_POR_BLOQUE
+
+
+def intercambios_a_permutacion(intercambios: Iterable[Tuple[int, int]], num_digitos: int) -> Tuple[int, ...]:
+    """
+    Convierte una lista de intercambios de posiciones en una permutación.
+
+    Args:
+        intercambios: Pares (i, j) de posiciones (base 0) que se intercambian, en orden
+        num_digitos: Número de dígitos del código
+
+    Returns:
+        Tupla con la posición de origen de cada dígito de salida
+
+    Ejemplo:
+        intercambios_a_permutacion([(0, 2), (1, 3), (4, 5)], 6) == (2, 3, 0, 1, 5, 4)
+    """
+    posiciones = list(range(num_digitos))
+    for i, j in intercambios:
+        posiciones[i], posiciones[j] = posiciones[j], posiciones[i]
+    return tuple(posiciones)
+
+
+def generar_fuente(nombre: str, desplazamiento: int, origenes: Sequence[int]) -> str:
+    """
+    Genera el código fuente de una función en línea recta (sin bucles ni listas).
+
+    La función generada recibe un código de dígitos ASCII ya validado y
+    devuelve el resultado tomando cada dígito de su posición de origen y
+    traduciéndolo con la tabla T (dígito -> dígito desplazado).
+
+    Args:
+        nombre: Nombre de la función
+        desplazamiento: Valor que se suma (módulo 10) a cada dígito
+        origenes: Posición de entrada de cada dígito de salida
+
+    Ejemplo:
+        generar_fuente("f", 7, (1, 0)) genera una función f(s) cuyo cuerpo es
+        return ''.join((T[s[1]], T[s[0]]))
+    """
+    terminos = ", ".join(f"T[s[{origen}]]" for origen in origenes)
+    return (f"def {nombre}(s):\n"
+            f'    """Suma {desplazamiento % 10} (módulo 10) y toma las posiciones {tuple(origenes)}. '
+            f'Código generado."""\n'
+            f"    return ''.join(({terminos},))\n")
+
+
+@lru_cache(maxsize=None)
+def _generar_funcion(desplazamiento: int, origenes: Tuple[int, ...], operacion: str) -> Tuple[Callable[[str], str], str]:
+    """
+    Compila (o recupera de la caché) la función generada para una configuración.
+
+    Returns:
+        Tupla (función, código fuente)
+    """
+    nombre = f"{operacion}_{desplazamiento}_" + "_".join(map(str, origenes))
+    fuente = generar_fuente(nombre, desplazamiento, origenes)
+    archivo = f"<plan {nombre}>"
+    # Registrar la fuente para que inspect.getsource y las trazas de error la muestren
+    linecache.cache[archivo] = (len(fuente), None, fuente.splitlines(True), archivo)
+    espacio = {"T": {str(digito): str((digito + desplazamiento) % 10) for digito in range(10)}}
+    exec(compile(fuente, archivo, "exec"), espacio)
+    return espacio[nombre], fuente
+
+
+class PlanCifrado:
+    """Plan compilado: suma un desplazamiento a cada dígito y luego los permuta."""
+
+    def __init__(self, desplazamiento: int, num_digitos: int, permutacion: Sequence[int]):
+        """
+        Args:
+            desplazamiento: Valor que se suma (módulo 10) a cada dígito
+            num_digitos: Número de dígitos de cada código
+            permutacion: Posición de origen de cada dígito de salida
+
+        Raises:
+            ValueError: Si la permutación no corresponde al número de dígitos
+        """
+        permutacion = tuple(permutacion)
+        if num_digitos < 1:
+            raise ValueError("El número de dígitos debe ser positivo")
+        if sorted(permutacion) != list(range(num_digitos)):
+            raise ValueError(f"La permutación debe reordenar las posiciones 0 a {num_digitos - 1}")
+
+        self.desplazamiento = desplazamiento % 10
+        self.num_digitos = num_digitos
+        self.permutacion = permutacion
+        self.permutacion_inversa = tuple(permutacion.index(i) for i in range(num_digitos))
+
+        # Tablas de traducción del paso "sumar el desplazamiento módulo 10"
+        desplazados = DIGITOS_ASCII[self.desplazamiento:] + DIGITOS_ASCII[:self.desplazamiento]
+        self.traduccion_cifrar = bytes.maketrans(DIGITOS_ASCII, desplazados)
+        self.traduccion_descifrar = bytes.maketrans(desplazados, DIGITOS_ASCII)
+        # Funciones generadas para la ruta escalar; la fuente queda disponible para depurar
+        self.cifrar_generado, self.fuente_cifrar = _generar_funcion(self.desplazamiento, permutacion, "cifrar")
+        self.descifrar_generado, self.fuente_descifrar = _generar_funcion(
+            -self.desplazamiento % 10, self.permutacion_inversa, "descifrar")
+
+        # Ruta entera: cada bloque de 3 dígitos aporta un sumando independiente
+        self.limite_entero = 10 ** num_digitos
+        self._bloques_cifrar = self._tablas_bloques(self.desplazamiento, self.permutacion_inversa)
+        self._bloques_descifrar = self._tablas_bloques(-self.desplazamiento, self.permutacion)
+
+    def _tablas_bloques(self, desplazamiento: int, destinos: Sequence[int]) -> List[Tuple[int, ...]]:
+        """
+        Precalcula, por cada bloque de 3 dígitos (del menos significativo al
+        más significativo), la contribución al resultado de cada valor del bloque.
+
+        Args:
+            desplazamiento: Valor sumado a cada dígito
+            destinos: Posición de salida de cada posición de entrada
+        """
+        n = self.num_digitos
+        tablas = []
+        for exponente_base in range(0, n, DIGITOS_POR_BLOQUE):
+            exponentes = range(exponente_base, min(exponente_base + DIGITOS_POR_BLOQUE, n))
+            tabla = []
+            for valor in range(10 ** len(exponentes)):
+                contribucion = 0
+                for i, exponente in enumerate(exponentes):
+                    digito = (valor // 10 ** i) % 10
+                    destino = destinos[n - 1 - exponente]
+                    contribucion += ((digito + desplazamiento) % 10) * 10 ** (n - 1 - destino)
+                tabla.append(contribucion)
+            tablas.append(tuple(tabla))
+        return tablas
+
+    def __repr__(self) -> str:
+        return (f"PlanCifrado(desplazamiento={self.desplazamiento}, num_digitos={self.num_digitos}, "
+                f"permutacion={self.permutacion})")
+
+    # ==================== Ruta escalar ====================
+
+    def cifrar(self, numero_str: str) -> str:
+        """
+        Cifra un código de num_digitos dígitos ASCII.
+
+        Raises:
+            ValueError: Si el código no tiene el número de dígitos del plan
+        """
+        self._comprobar_codigo(numero_str)
+        return self.cifrar_generado(numero_str)
+
+    def descifrar(self, numero_str: str) -> str:
+        """
+        Descifra un código de num_digitos dígitos ASCII.
+
+        Raises:
+            ValueError: Si el código no tiene el número de dígitos del plan
+        """
+        self._comprobar_codigo(numero_str)
+        return self.descifrar_generado(numero_str)
+
+    def _comprobar_codigo(self, numero_str: str):
+        if len(numero_str) != self.num_digitos or not (numero_str.isascii() and numero_str.isdigit()):
+            raise ValueError(f"Se esperaba un número de {self.num_digitos} dígitos: {numero_str!r}")
+
+    # ==================== Ruta entera ====================
+
+    def cifrar_entero(self, numero: int) -> int:
+        """
+        Cifra un código representado como entero (los ceros a la izquierda son implícitos).
+
+        Args:
+            numero: Entero entre 0 y 10^num_digitos - 1
+
+        Raises:
+            ValueError: Si el número está fuera de rango
+        """
+        return self._aplicar_entero(numero, self._bloques_cifrar)
+
+    def descifrar_entero(self, numero: int) -> int:
+        """
+        Descifra un código representado como entero.
+
+        Raises:
+            ValueError: Si el número está fuera de rango
+        """
+        return self._aplicar_entero(numero, self._bloques_descifrar)
+
+    def _aplicar_entero(self, numero: int, bloques) -> int:
+        if not 0 <= numero < self.limite_entero:
+            raise ValueError(f"El número debe estar entre 0 y {self.limite_entero - 1}: {numero}")
+        if len(bloques) == 2:
+            # Caso habitual (4 a 6 dígitos): una sola división
+            alto, bajo = divmod(numero, _BASE_BLOQUE)
+            return bloques[0][bajo] + bloques[1][alto]
+        resultado = 0
+        for tabla in bloques:
+            numero, bloque = divmod(numero, _BASE_BLOQUE)
+            resultado += tabla[bloque]
+        return resultado
+
+    def cifrar_enteros(self, numeros):
+        """
+        Cifra una columna de enteros.
+
+        Args:
+            numeros: Arreglo NumPy, array.array o iterable de enteros
+
+        Returns:
+            Arreglo NumPy o array.array del mismo tipo de la entrada; lista en otro caso
+        """
+        return self._aplicar_enteros(numeros, self.cifrar_lote, self._bloques_cifrar)
+
+    def descifrar_enteros(self, numeros):
+        """Descifra una columna de enteros (ver cifrar_enteros)."""
+        return self._aplicar_enteros(numeros, self.descifrar_lote, self._bloques_descifrar)
+
+    def _aplicar_enteros(self, numeros, funcion_lote, bloques):
+        if type(numeros).__module__ == "numpy":
+            return funcion_lote(numeros)
+        resultados = [self._aplicar_entero(numero, bloques) for numero in numeros]
+        if isinstance(numeros, array):
+            return array(numeros.typecode, resultados)
+        return resultados
+
+    # ==================== Ruta por búfer ====================
+
+    def cifrar_buffer(self, datos, separador: bytes = b"\n", validar: bool = True) -> bytearray:
+        """
+        Cifra un búfer de registros de ancho fijo sin crear objetos por registro.
+
+        Cada registro son num_digitos dígitos ASCII seguidos del separador. El
+        desplazamiento se aplica con una sola traducción del búfer y la
+        permutación con asignaciones por rebanadas con paso.
+
+        Args:
+            datos: bytes, bytearray o memoryview con registros completos
+            separador: Bytes que siguen a cada registro (b"" para registros contiguos)
+            validar: Comprobar que los registros solo contengan dígitos y separadores
+
+        Returns:
+            bytearray con los registros cifrados
+
+        Raises:
+            ValueError: Si el búfer no está formado por registros válidos
+        """
+        return self._aplicar_buffer(datos, separador, validar, self.permutacion, self.traduccion_cifrar)
+
+    def descifrar_buffer(self, datos, separador: bytes = b"\n", validar: bool = True) -> bytearray:
+        """
+        Descifra un búfer de registros de ancho fijo sin crear objetos por registro.
+
+        Args:
+            datos: bytes, bytearray o memoryview con registros cifrados completos
+            separador: Bytes que siguen a cada registro (b"" para registros contiguos)
+            validar: Comprobar que los registros solo contengan dígitos y separadores
+
+        Returns:
+            bytearray con los registros originales
+
+        Raises:
+            ValueError: Si el búfer no está formado por registros válidos
+        """
+        return self._aplicar_buffer(datos, separador, validar, self.permutacion_inversa, self.traduccion_descifrar)
+
+    def validar_buffer(self, datos, separador: bytes = b"\n"):
+        """
+        Comprueba que un búfer esté formado por registros completos y válidos.
+
+        Raises:
+            ValueError: Indicando el primer registro inválido
+        """
+        fuente = self._como_bytes(datos)
+        ancho = self._ancho_registro(fuente, separador)
+        num_registros = len(fuente) // ancho
+        valido = all(
+            not fuente[posicion::ancho].translate(None, DIGITOS_ASCII) for posicion in range(self.num_digitos)
+        ) and all(
+            fuente[posicion::ancho] == bytes((byte,)) * num_registros
+            for posicion, byte in enumerate(separador, self.num_digitos)
+        )
+        if not valido:
+            self._ubicar_registro_invalido(fuente, separador, ancho)
+
+    @staticmethod
+    def _como_bytes(datos):
+        if isinstance(datos, (bytes, bytearray)):
+            return datos
+        # Las rebanadas con paso sobre memoryview son mucho más lentas que
+        # sobre bytes; una copia contigua previa sale más barata
+        return memoryview(datos).cast("B").tobytes()
+
+    def _ancho_registro(self, fuente, separador: bytes) -> int:
+        ancho = self.num_digitos + len(separador)
+        if len(fuente) % ancho:
+            raise ValueError(f"El búfer debe contener registros completos de {ancho} bytes")
+        return ancho
+
+    def _aplicar_buffer(self, datos, separador: bytes, validar: bool, permutacion, traduccion: bytes) -> bytearray:
+        """Reordena los dígitos de cada registro por rebanadas y traduce el búfer."""
+        fuente = self._como_bytes(datos)
+        ancho = self._ancho_registro(fuente, separador)
+        num_registros = len(fuente) // ancho
+
+        # Los dígitos no cambian de valor al reordenarse, así que se puede
+        # reordenar primero y traducir después sobre el búfer de salida
+        resultado = bytearray(len(fuente))
+        valido = True
+        for destino, origen in enumerate(permutacion):
+            columna = fuente[origen::ancho]
+            if validar and columna.translate(None, DIGITOS_ASCII):
+                valido = False
+            resultado[destino::ancho] = columna
+        for posicion, byte in enumerate(separador, self.num_digitos):
+            relleno = bytes((byte,)) * num_registros
+            if validar and fuente[posicion::ancho] != relleno:
+                valido = False
+            resultado[posicion::ancho] = relleno
+
+        if not valido:
+            self._ubicar_registro_invalido(fuente, separador, ancho)
+
+        return resultado.translate(traduccion)
+
+    def _ubicar_registro_invalido(self, fuente, separador: bytes, ancho: int):
+        """Recorre los registros hasta encontrar el primero inválido y lo reporta."""
+        for indice in range(len(fuente) // ancho):
+            registro = bytes(fuente[indice * ancho:(indice + 1) * ancho])
+            digitos = registro[:self.num_digitos]
+            if registro[self.num_digitos:] != separador or digitos.translate(None, DIGITOS_ASCII):
+                raise ValueError(f"Registro {indice} inválido: {registro!r}")
+
+    # ==================== Ruta vectorizada (NumPy) ====================
+
+    def cifrar_lote(self, numeros):
+        """
+        Cifra un lote con operaciones vectorizadas de NumPy.
+
+        Acepta un arreglo 1-D de enteros (0 a 10^num_digitos - 1) o una matriz
+        (N, num_digitos) de dígitos, y devuelve el resultado con la misma forma y tipo.
+
+        Raises:
+            TypeError: Si el lote no es de enteros, o es 1-D y su tipo no admite
+                10^num_digitos - 1 (por ejemplo uint16 con 6 dígitos)
+            ValueError: Si algún número o dígito está fuera de rango
+        """
+        return self._aplicar_lote(numeros, self.desplazamiento, self.permutacion, self._bloques_cifrar)
+
+    def descifrar_lote(self, numeros):
+        """Descifra un lote de enteros o una matriz de dígitos con operaciones vectorizadas."""
+        return self._aplicar_lote(numeros, -self.desplazamiento, self.permutacion_inversa, self._bloques_descifrar)
+
+    def _aplicar_lote(self, numeros, desplazamiento: int, permutacion, bloques):
+        """Suma el desplazamiento (mod 10) y reordena los dígitos del lote."""
+        import numpy as np
+
+        num_digitos = self.num_digitos
+        arreglo = np.asarray(numeros)
+        if not np.issubdtype(arreglo.dtype, np.integer):
+            raise TypeError("El lote debe contener enteros")
+
+        if arreglo.ndim == 2:
+            if arreglo.shape[1] != num_digitos:
+                raise ValueError(f"La matriz de dígitos debe tener {num_digitos} columnas")
+            if arreglo.size and (arreglo.min() < 0 or arreglo.max() > 9):
+                raise ValueError("Los dígitos de la matriz deben estar entre 0 y 9")
+            digitos = (arreglo.astype(np.int16) + desplazamiento) % 10
+            return digitos[:, permutacion].astype(arreglo.dtype)
+
+        if arreglo.ndim != 1:
+            raise ValueError(f"El lote debe ser un arreglo 1-D de enteros o una matriz (N, {num_digitos})")
+        if num_digitos > MAX_DIGITOS_ENTERO:
+            raise ValueError(f"Con más de {MAX_DIGITOS_ENTERO} dígitos use una matriz de dígitos")
+        # El resultado conserva el tipo de la entrada: debe caber cualquier número del dominio
+        if np.iinfo(arreglo.dtype).max < 10 ** num_digitos - 1:
+            raise TypeError(f"El tipo {arreglo.dtype} no admite números de {num_digitos} dígitos "
+                            f"(use uint32 o int64)")
+
+        valores = arreglo.astype(np.int64)
+        if valores.size and (valores.min() < 0 or valores.max() >= 10 ** num_digitos):
+            raise ValueError(f"Los números deben estar entre 0 y {10 ** num_digitos - 1}")
+
+        if len(bloques) == 2:
+            # Caso habitual (4 a 6 dígitos): dos consultas vectorizadas a las tablas de bloques
+            alto, bajo = np.divmod(valores, _BASE_BLOQUE)
+            resultado = np.asarray(bloques[0], dtype=np.int64)[bajo] + np.asarray(bloques[1], dtype=np.int64)[alto]
+            return resultado.astype(arreglo.dtype)
+
+        # Descomponer en dígitos (columna 0 = dígito más significativo)
+        potencias = 10 ** np.arange(num_digitos - 1, -1, -1, dtype=np.int64)
+        digitos = (valores[:, None] // potencias) % 10
+        digitos = (digitos + desplazamiento) % 10
+        resultado = digitos[:, permutacion] @ potencias
+        return resultado.astype(arreglo.dtype)
+
+
+@lru_cache(maxsize=None)
+def _compilar(desplazamiento: int, num_digitos: int, permutacion: Tuple[int, ...]) -> PlanCifrado:
+    return PlanCifrado(desplazamiento, num_digitos, permutacion)
+
+
+def compilar_plan(desplazamiento: int, num_digitos: int, permutacion: Sequence[int]) -> PlanCifrado:
+    """
+    Compila (o recupera de la caché) el plan para una configuración.
+
+    Args:
+        desplazamiento: Valor que se suma (módulo 10) a cada dígito
+        num_digitos: Número de dígitos de cada código
+        permutacion: Posición de origen de cada dígito de salida
+
+    Returns:
+        PlanCifrado reutilizable; la misma configuración devuelve el mismo objeto
+    """
+    return _compilar(desplazamiento % 10, num_digitos, tuple(permutacion))
@@ -0,0 +1,259 @@
+"""
+Módulo de archivos de registros con acceso directo.
+
+Un archivo indexado guarda los códigos cifrados con paso fijo, en BCD de
+3 bytes (ver src/logic/empaquetado.py), así que el registro N está siempre en
+el desplazamiento CABECERA.size + 3·N y se lee sin recorrer el archivo.
+
+    cabecera (32 bytes)   magia, versión, opciones, registros por bloque, cantidad
+    registros             3 bytes por código
+    sumas (opcional)      crc32 de cada bloque de registros, 4 bytes little-endian
+
+Las sumas permiten comprobar solo los bloques que se consultan.
+"""
+
+import mmap
+import struct
+import zlib
+from typing import BinaryIO, Iterable, List, Set
+
+from src.logic.cipher import PLAN_POR_DEFECTO
+from src.logic.empaquetado import descifrar_empaquetado
+from src.logic.plan import PlanCifrado
+
+MAGIA = b"CIFIDX"
+VERSION = 1
+# Cabecera: magia, versión, opciones, registros por bloque y cantidad (little-endian)
+CABECERA = struct.Struct("<6sBBIQ12x")
+OPCION_SUMAS = 1
+
+BYTES_REGISTRO = 3
+NUM_DIGITOS_INDEXADO = 2 * BYTES_REGISTRO
+# Registros por bloque de suma de verificación
+TAM_BLOQUE_INDICE = 4096
+_SUMA = struct.Struct("<I")
+
+
+class EscritorIndexado:
+    """Escribe un archivo indexado en flujo; la cabecera y las sumas se completan al cerrar."""
+
+    def __init__(self, archivo: BinaryIO, tam_bloque: int = TAM_BLOQUE_INDICE, sumas: bool = True):
+        """
+        Args:
+            archivo: Archivo binario de escritura con posicionamiento (seek)
+            tam_bloque: Registros por bloque de suma de verificación
+            sumas: Guardar un crc32 por bloque
+        """
+        if tam_bloque <= 0:
+            raise ValueError("El tamaño de bloque debe ser positivo")
+        self.archivo = archivo
+        self.tam_bloque = tam_bloque
+        self.sumas = sumas
+        self.cantidad = 0
+        self._inicio = archivo.tell()
+        self._sumas_bloques: List[int] = []
+        self._suma_actual = 0
+        archivo.write(self._cabecera())
+
+    def _cabecera(self) -> bytes:
+        return CABECERA.pack(MAGIA, VERSION, OPCION_SUMAS if self.sumas else 0, self.tam_bloque, self.cantidad)
+
+    def __enter__(self) -> "EscritorIndexado":
+        return self
+
+    def __exit__(self, *exc):
+        # Ante un error la cabecera conserva cantidad 0 y el archivo no se puede abrir como válido
+        if exc[0] is None:
+            self.cerrar()
+
+    def escribir(self, codigos: Iterable[str]):
+        """
+        Agrega códigos cifrados de 6 dígitos ASCII.
+
+        Raises:
+            ValueError: Si algún código no tiene exactamente 6 dígitos
+        """
+        codigos = list(codigos)
+        for indice, codigo in enumerate(codigos):
+            if len(codigo) != NUM_DIGITOS_INDEXADO or not (codigo.isascii() and codigo.isdigit()):
+                raise ValueError(f"Código {self.cantidad + indice} inválido: {codigo!r}")
+        # Los dígitos decimales de cada código son, literalmente, su BCD en hexadecimal
+        self.escribir_bcd(bytes.fromhex("".join(codigos)))
+
+    def escribir_bcd(self, datos: bytes):
+        """
+        Agrega registros ya empaquetados en BCD, sin volver a validarlos.
+
+        Args:
+            datos: Registros completos de 3 bytes (ver src/logic/empaquetado.py)
+        """
+        self.archivo.write(datos)
+        if self.sumas:
+            vista = memoryview(datos)
+            while vista:
+                en_bloque = self.cantidad % self.tam_bloque
+                tomar = min(len(vista), (self.tam_bloque - en_bloque) * BYTES_REGISTRO)
+                self._suma_actual = zlib.crc32(vista[:tomar], self._suma_actual)
+                self.cantidad += tomar // BYTES_REGISTRO
+                vista = vista[tomar:]
+                if self.cantidad % self.tam_bloque == 0:
+                    self._sumas_bloques.append(self._suma_actual)
+                    self._suma_actual = 0
+        else:
+            self.cantidad += len(datos) // BYTES_REGISTRO
+
+    def cerrar(self):
+        """Escribe las sumas de verificación y la cantidad definitiva en la cabecera."""
+        if self.sumas:
+            if self.cantidad % self.tam_bloque:
+                self._sumas_bloques.append(self._suma_actual)
+                self._suma_actual = 0
+            self.archivo.write(b"".join(_SUMA.pack(suma) for suma in self._sumas_bloques))
+            self._sumas_bloques = []
+        final = self.archivo.tell()
+        self.archivo.seek(self._inicio)
+        self.archivo.write(self._cabecera())
+        self.archivo.seek(final)
+
+
+class LectorIndexado:
+    """Lee registros de un archivo indexado por posición, mediante mmap."""
+
+    def __init__(self, ruta: str, plan: PlanCifrado = PLAN_POR_DEFECTO, verificar: bool = True):
+        """
+        Args:
+            ruta: Archivo indexado
+            plan: Plan con el que están cifrados los registros
+            verificar: Comprobar la suma de cada bloque la primera vez que se lee
+
+        Raises:
+            ValueError: Si el archivo no es un archivo indexado o está truncado
+        """
+        self._archivo = open(ruta, "rb")
+        try:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._archivo.close()
+            raise ValueError(f"{ruta} no es un archivo indexado") from None
+        try:
+            self._leer_cabecera(ruta)
+        except ValueError:
+            self.cerrar()
+            raise
+        self.plan = plan
+        self.verificar = verificar and self.con_sumas
+        self._bloques_verificados: Set[int] = set()
+
+    def _leer_cabecera(self, ruta: str):
+        if len(self._mapa) < CABECERA.size:
+            raise ValueError(f"{ruta} no es un archivo indexado")
+        magia, version, opciones, tam_bloque, cantidad = CABECERA.unpack_from(self._mapa)
+        if magia != MAGIA or version != VERSION or tam_bloque == 0:
+            raise ValueError(f"{ruta} no es un archivo indexado compatible")
+        self.cantidad = cantidad
+        self.tam_bloque = tam_bloque
+        self.con_sumas = bool(opciones & OPCION_SUMAS)
+        self.num_bloques = -(-cantidad // tam_bloque)
+        self._inicio_sumas = CABECERA.size + cantidad * BYTES_REGISTRO
+        esperado = self._inicio_sumas + (self.num_bloques * _SUMA.size if self.con_sumas else 0)
+        if len(self._mapa) != esperado:
+            raise ValueError(f"{ruta} está truncado o tiene datos de más ({len(self._mapa)} de {esperado} bytes)")
+
+    def __enter__(self) -> "LectorIndexado":
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def __len__(self) -> int:
+        return self.cantidad
+
+    def cerrar(self):
+        """Libera el mapeo y el archivo."""
+        self._mapa.close()
+        self._archivo.close()
+
+    def cifrados(self, inicio: int, fin: int) -> List[str]:
+        """
+        Devuelve los códigos cifrados de los registros [inicio, fin).
+
+        Raises:
+            IndexError: Si el rango no está dentro del archivo
+            ValueError: Si un bloque leído no coincide con su suma de verificación
+        """
+        return self._codigos(self._leer(inicio, fin))
+
+    def descifrar_rango(self, inicio: int, fin: int) -> List[str]:
+        """
+        Descifra los registros [inicio, fin) sin recorrer el resto del archivo.
+
+        Raises:
+            IndexError: Si el rango no está dentro del archivo
+            ValueError: Si un bloque leído no coincide con su suma de verificación
+        """
+        return self._codigos(descifrar_empaquetado(self._leer(inicio, fin), "bcd", self.plan))
+
+    def descifrar(self, numero: int) -> str:
+        """Descifra el registro `numero` (base 0; se admiten índices negativos)."""
+        if numero < 0:
+            numero += self.cantidad
+        return self.descifrar_rango(numero, numero + 1)[0]
+
+    def comprobar(self) -> List[int]:
+        """Comprueba todos los bloques y devuelve los que no coinciden con su suma."""
+        if not self.con_sumas:
+            return []
+        return [bloque for bloque in range(self.num_bloques) if not self._bloque_valido(bloque)]
+
+    def _leer(self, inicio: int, fin: int) -> bytes:
+        if not 0 <= inicio <= fin <= self.cantidad:
+            raise IndexError(f"Rango [{inicio}, {fin}) fuera del archivo ({self.cantidad} registros)")
+        if self.verificar and inicio < fin:
+            for bloque in range(inicio // self.tam_bloque, (fin - 1) // self.tam_bloque + 1):
+                if bloque not in self._bloques_verificados:
+                    if not self._bloque_valido(bloque):
+                        raise ValueError(f"El bloque {bloque} (registros desde {bloque * self.tam_bloque}) "
+                                         f"no coincide con su suma de verificación")
+                    self._bloques_verificados.add(bloque)
+        return self._mapa[CABECERA.size + inicio * BYTES_REGISTRO:CABECERA.size + fin * BYTES_REGISTRO]
+
+    def _bloque_valido(self, bloque: int) -> bool:
+        inicio = CABECERA.size + bloque * self.tam_bloque * BYTES_REGISTRO
+        fin = min(inicio + self.tam_bloque * BYTES_REGISTRO, self._inicio_sumas)
+        esperado, = _SUMA.unpack_from(self._mapa, self._inicio_sumas + bloque * _SUMA.size)
+        return zlib.crc32(self._mapa[inicio:fin]) == esperado
+
+    @staticmethod
+    def _codigos(datos: bytes) -> List[str]:
+        texto = datos.hex()
+        return [texto[inicio:inicio + NUM_DIGITOS_INDEXADO] for inicio in range(0, len(texto), NUM_DIGITOS_INDEXADO)]
+
+
+def crear_indexado(lineas: Iterable[str], salida: BinaryIO, tam_bloque: int = TAM_BLOQUE_INDICE,
+                   sumas: bool = True, tam_lote: int = 1 << 16) -> int:
+    """
+    Crea un archivo indexado a partir de códigos cifrados, uno por línea.
+
+    Las líneas en blanco se ignoran, igual que en la consola.
+
+    Returns:
+        Número de registros escritos
+
+    Raises:
+        ValueError: Indicando la primera línea que no es un código de 6 dígitos
+    """
+    with EscritorIndexado(salida, tam_bloque, sumas) as escritor:
+        lote: List[str] = []
+        for numero_linea, linea in enumerate(lineas, 1):
+            codigo = linea.strip()
+            if not codigo:
+                continue
+            if len(codigo) != NUM_DIGITOS_INDEXADO or not (codigo.isascii() and codigo.isdigit()):
+                raise ValueError(f"Línea {numero_linea}: se esperaba un código cifrado de "
+                                 f"{NUM_DIGITOS_INDEXADO} dígitos: {codigo!r}")
+            lote.append(codigo)
+            if len(lote) >= tam_lote:
+                escritor.escribir_bcd(bytes.fromhex("".join(lote)))
+                lote = []
+        escritor.escribir_bcd(bytes.fromhex("".join(lote)))
+    return escritor.cantidad
@@ -0,0 +1,150 @@
+"""
+Módulo de cifrado por tablas precalculadas.
+Como el cifrado es una biyección fija sobre los 10^6 valores 000000-999999,
+una tabla directa y su inversa resuelven cualquier entrada con una consulta.
+"""
+
+import os
+import sys
+from array import array
+from typing import Optional
+
+from src.logic.cipher import NUM_DIGITOS, DESPLAZAMIENTO, PERMUTACION
+
+TAM_DOMINIO = 10 ** NUM_DIGITOS
+# Cabecera del archivo de tablas persistido
+MAGIA = b"CIFTAB01"
+
+
+def _construir_tabla(desplazamiento: int) -> array:
+    """
+    Construye la tabla completa sumando la contribución de cada dígito.
+
+    El dígito de la posición k de la entrada termina en la posición i de la
+    salida (PERMUTACION[i] == k), ya desplazado, así que cada número es la
+    suma de seis contribuciones independientes.
+    """
+    valores = [0]
+    for k in range(NUM_DIGITOS):
+        destino = PERMUTACION.index(k)
+        peso = 10 ** (NUM_DIGITOS - 1 - destino)
+        contribuciones = [((d + desplazamiento) % 10) * peso for d in range(10)]
+        valores = [v + c for v in valores for c in contribuciones]
+    return array("I", valores)
+
+
+class TablaCifrado:
+    """Motor de cifrado respaldado por una tabla directa y su inversa."""
+
+    def __init__(self, directa, inversa):
+        """
+        Args:
+            directa: Secuencia indexable con el cifrado de cada valor
+            inversa: Secuencia indexable con el descifrado de cada valor
+        """
+        if len(directa) != TAM_DOMINIO or len(inversa) != TAM_DOMINIO:
+            raise ValueError("Las tablas deben cubrir los 10^6 valores del dominio")
+        self.directa = directa
+        self.inversa = inversa
+
+    @classmethod
+    def construir(cls) -> "TablaCifrado":
+        """Construye ambas tablas en memoria."""
+        return cls(_construir_tabla(DESPLAZAMIENTO), _construir_tabla(-DESPLAZAMIENTO))
+
+    @classmethod
+    def cargar(cls, ruta: str) -> "TablaCifrado":
+        """
+        Carga las tablas desde un archivo creado con guardar().
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado
+        """
+        with open(ruta, "rb") as archivo:
+            if archivo.read(len(MAGIA)) != MAGIA:
+                raise ValueError(f"{ruta} no es un archivo de tablas de cifrado")
+            directa = array("I")
+            inversa = array("I")
+            try:
+                directa.fromfile(archivo, TAM_DOMINIO)
+                inversa.fromfile(archivo, TAM_DOMINIO)
+            except EOFError as error:
+                raise ValueError(f"{ruta} está incompleto") from error
+        if sys.byteorder != "little":
+            directa.byteswap()
+            inversa.byteswap()
+        return cls(directa, inversa)
+
+    @classmethod
+    def cargar_o_construir(cls, ruta: Optional[str] = None) -> "TablaCifrado":
+        """
+        Carga las tablas de disco si existen; si no, las construye y las guarda.
+
+        Args:
+            ruta: Archivo de caché (None para no persistir)
+        """
+        if ruta and os.path.exists(ruta):
+            return cls.cargar(ruta)
+        tabla = cls.construir()
+        if ruta:
+            tabla.guardar(ruta)
+        return tabla
+
+    def guardar(self, ruta: str):
+        """Persiste ambas tablas como enteros de 32 bits little-endian."""
+        directa = array("I", self.directa)
+        inversa = array("I", self.inversa)
+        if sys.byteorder != "little":
+            directa.byteswap()
+            inversa.byteswap()
+        with open(ruta, "wb") as archivo:
+            archivo.write(MAGIA)
+            directa.tofile(archivo)
+            inversa.tofile(archivo)
+
+    def cifrar(self, numero_str: str) -> str:
+        """Cifra un número de 6 dígitos con una consulta a la tabla directa."""
+        return "%06d" % self.directa[int(numero_str)]
+
+    def descifrar(self, numero_str: str) -> str:
+        """Descifra un número de 6 dígitos con una consulta a la tabla inversa."""
+        return "%06d" % self.inversa[int(numero_str)]
+
+    def cifrar_lote(self, numeros):
+        """
+        Cifra un arreglo NumPy de enteros mediante indexación avanzada.
+
+        Args:
+            numeros: Arreglo de enteros entre 0 y 999999
+
+        Returns:
+            Arreglo NumPy uint32 con los números cifrados
+
+        Raises:
+            TypeError: Si el arreglo no es de enteros
+            ValueError: Si algún número está fuera de rango
+        """
+        return self._vista(self.directa)[self._validar_lote(numeros)]
+
+    def descifrar_lote(self, numeros):
+        """Descifra un arreglo NumPy de enteros mediante indexación avanzada."""
+        return self._vista(self.inversa)[self._validar_lote(numeros)]
+
+    @staticmethod
+    def _validar_lote(numeros):
+        """Comprueba que el lote sean enteros del dominio, sin índices negativos que NumPy aceptaría."""
+        import numpy as np
+
+        arreglo = np.asarray(numeros)
+        if not np.issubdtype(arreglo.dtype, np.integer):
+            raise TypeError("El lote debe contener enteros")
+        if arreglo.size and (arreglo.min() < 0 or arreglo.max() >= TAM_DOMINIO):
+            raise ValueError(f"Los números deben estar entre 0 y {TAM_DOMINIO - 1}")
+        return arreglo
+
+    @staticmethod
+    def _vista(tabla):
+        """Expone la tabla como arreglo NumPy sin copiarla."""
+        import numpy as np
+
+        return np.frombuffer(tabla, dtype=np.uint32)
@@ -0,0 +1,156 @@
+"""
+Módulo de tablas de cifrado en memoria compartida.
+
+El proceso dueño publica la tabla directa y la inversa una sola vez en un
+segmento de multiprocessing.shared_memory. Los trabajadores se adjuntan por
+nombre y consultan los enteros directamente sobre el segmento, sin copiarlos
+ni reconstruirlos.
+
+El segmento se elimina cuando el dueño llama a cerrar() o termina: al
+recolectarse el objeto o al salir el intérprete (weakref.finalize) y, si el
+proceso muere sin limpiar, mediante el resource_tracker de multiprocessing.
+"""
+
+import sys
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional
+
+from src.logic.cipher import CipherLogic
+from src.logic.tabla import MAGIA, TAM_DOMINIO, TablaCifrado
+
+# Bytes de cada tabla (enteros sin signo de 32 bits en el orden nativo)
+TAM_TABLA = 4 * TAM_DOMINIO
+TAM_SEGMENTO = len(MAGIA) + 2 * TAM_TABLA
+
+# Tabla adjuntada por usar_tabla_compartida() en este proceso
+_tabla_proceso: Optional["TablaCompartida"] = None
+
+
+def _abrir_segmento(nombre: str) -> shared_memory.SharedMemory:
+    """Abre un segmento existente sin que este proceso pase a ser responsable de eliminarlo."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=nombre, track=False)
+    # Antes de 3.13 abrir un segmento lo registra en el resource_tracker, que lo
+    # eliminaría al salir cualquier proceso adjunto; se anula ese registro
+    segmento = shared_memory.SharedMemory(name=nombre)
+    resource_tracker.unregister(segmento._name, "shared_memory")
+    return segmento
+
+
+def _liberar(segmento: shared_memory.SharedMemory, vistas: list, eliminar: bool):
+    """Suelta las vistas, cierra el segmento y, si es del dueño, lo elimina."""
+    for vista in vistas:
+        vista.release()
+    vistas.clear()
+    try:
+        segmento.close()
+    except BufferError:
+        # Alguien conserva una vista derivada: el mapeo se libera al terminar el proceso
+        pass
+    if eliminar:
+        if sys.version_info < (3, 13):
+            # Un proceso adjunto que comparte el resource_tracker del dueño (un
+            # trabajador hijo) anuló también su registro; unlink() lo espera presente
+            resource_tracker.register(segmento._name, "shared_memory")
+        try:
+            segmento.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class TablaCompartida(TablaCifrado):
+    """TablaCifrado cuyas tablas viven en un segmento de memoria compartida."""
+
+    def __init__(self, segmento: shared_memory.SharedMemory, propietario: bool):
+        """
+        Usar publicar() o adjuntar() en lugar de este constructor.
+
+        Raises:
+            ValueError: Si el segmento no contiene tablas de cifrado
+        """
+        if segmento.size < TAM_SEGMENTO or bytes(segmento.buf[:len(MAGIA)]) != MAGIA:
+            segmento.close()
+            raise ValueError(f"El segmento {segmento.name} no contiene tablas de cifrado")
+        inicio = len(MAGIA)
+        directa = segmento.buf[inicio:inicio + TAM_TABLA].cast("I")
+        inversa = segmento.buf[inicio + TAM_TABLA:inicio + 2 * TAM_TABLA].cast("I")
+        if not propietario:
+            directa = directa.toreadonly()
+            inversa = inversa.toreadonly()
+        super().__init__(directa, inversa)
+
+        self.nombre = segmento.name
+        self.propietario = propietario
+        self._segmento = segmento
+        self._finalizador = weakref.finalize(self, _liberar, segmento, [directa, inversa], propietario)
+
+    @classmethod
+    def publicar(cls, tabla: Optional[TablaCifrado] = None, nombre: Optional[str] = None) -> "TablaCompartida":
+        """
+        Copia las tablas a un segmento nuevo del que este proceso es dueño.
+
+        Args:
+            tabla: Tablas a publicar (None = TablaCifrado.construir())
+            nombre: Nombre del segmento (None = uno aleatorio)
+
+        Raises:
+            FileExistsError: Si ya existe un segmento con ese nombre
+        """
+        if tabla is None:
+            tabla = TablaCifrado.construir()
+        segmento = shared_memory.SharedMemory(name=nombre, create=True, size=TAM_SEGMENTO)
+        try:
+            inicio = len(MAGIA)
+            destino = segmento.buf[inicio:inicio + 2 * TAM_TABLA].cast("I")
+            destino[:TAM_DOMINIO] = memoryview(tabla.directa).cast("B").cast("I")
+            destino[TAM_DOMINIO:] = memoryview(tabla.inversa).cast("B").cast("I")
+            destino.release()
+            # La cabecera se escribe al final: un segmento sin ella nunca se adjunta
+            segmento.buf[:inicio] = MAGIA
+        except BaseException:
+            segmento.close()
+            segmento.unlink()
+            raise
+        return cls(segmento, propietario=True)
+
+    @classmethod
+    def adjuntar(cls, nombre: str) -> "TablaCompartida":
+        """
+        Se adjunta, en solo lectura, a las tablas publicadas con ese nombre.
+
+        Raises:
+            FileNotFoundError: Si no existe el segmento
+            ValueError: Si el segmento no contiene tablas de cifrado
+        """
+        return cls(_abrir_segmento(nombre), propietario=False)
+
+    def cerrar(self):
+        """Deja de usar el segmento; si este proceso es el dueño, además lo elimina."""
+        self._finalizador()
+
+    def __enter__(self) -> "TablaCompartida":
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def usar_tabla_compartida(nombre: str):
+    """
+    Adjunta las tablas publicadas y las activa en CipherLogic.
+
+    Pensada como initializer de ProcessPoolExecutor o como arranque de cada
+    trabajador de un servidor:
+
+        with TablaCompartida.publicar() as tabla:
+            with ProcessPoolExecutor(initializer=usar_tabla_compartida,
+                                     initargs=(tabla.nombre,)) as ejecutor:
+                ...
+    """
+    global _tabla_proceso
+    tabla = TablaCompartida.adjuntar(nombre)
+    CipherLogic.usar_tabla(tabla)
+    if _tabla_proceso is not None:
+        _tabla_proceso.cerrar()
+    _tabla_proceso = tabla
@@ -0,0 +1,125 @@
+"""
+Módulo de rotación de parámetros de cifrado.
+
+Para pasar datos cifrados con un plan anterior a un plan nuevo no hace falta
+descifrar y volver a cifrar: ambos pasos se componen en un único PlanCifrado.
+Si el plan anterior suma d1 y toma la permutación p1, y el nuevo suma d2 y
+toma p2, el plan compuesto suma d2 - d1 y toma q[i] = p1⁻¹[p2[i]]. Así cada
+registro se transforma en una sola pasada y el texto en claro nunca llega a
+existir en ningún búfer intermedio.
+"""
+
+from typing import BinaryIO
+
+from src.logic.plan import PlanCifrado, compilar_plan
+
+# Tamaño aproximado de cada bloque leído (se redondea a registros completos)
+TAM_BLOQUE_TRANSCODIFICACION = 4 << 20
+
+
+def componer_planes(anterior: PlanCifrado, nuevo: PlanCifrado) -> PlanCifrado:
+    """
+    Compila el plan equivalente a descifrar con `anterior` y cifrar con `nuevo`.
+
+    Raises:
+        ValueError: Si los planes no tienen el mismo número de dígitos
+    """
+    if anterior.num_digitos != nuevo.num_digitos:
+        raise ValueError(f"Los planes deben tener el mismo número de dígitos "
+                         f"({anterior.num_digitos} y {nuevo.num_digitos})")
+    permutacion = tuple(anterior.permutacion_inversa[origen] for origen in nuevo.permutacion)
+    return compilar_plan(nuevo.desplazamiento - anterior.desplazamiento, nuevo.num_digitos, permutacion)
+
+
+def leer_plan(texto: str) -> PlanCifrado:
+    """
+    Interpreta un plan escrito como "DESPLAZAMIENTO:P0,P1,...".
+
+    Ejemplo:
+        leer_plan("7:2,3,0,1,5,4") es el plan por defecto
+
+    Raises:
+        ValueError: Si el texto no tiene ese formato o la permutación es inválida
+    """
+    desplazamiento, separador, permutacion = texto.partition(":")
+    try:
+        posiciones = tuple(int(posicion) for posicion in permutacion.split(","))
+        valor = int(desplazamiento)
+    except ValueError:
+        posiciones = ()
+    if not separador or not posiciones:
+        raise ValueError(f"Plan inválido {texto!r}: se esperaba DESPLAZAMIENTO:P0,P1,... (p. ej. 7:2,3,0,1,5,4)")
+    return compilar_plan(valor, len(posiciones), posiciones)
+
+
+def transcodificar_enteros(numeros, anterior: PlanCifrado, nuevo: PlanCifrado):
+    """
+    Pasa una columna de enteros cifrados con `anterior` al plan `nuevo`.
+
+    Args:
+        numeros: Arreglo NumPy, array.array o iterable de enteros
+
+    Returns:
+        Resultado del mismo tipo que la entrada (ver PlanCifrado.cifrar_enteros)
+    """
+    return componer_planes(anterior, nuevo).cifrar_enteros(numeros)
+
+
+def transcodificar_archivo(
+    entrada: BinaryIO,
+    salida: BinaryIO,
+    anterior: PlanCifrado,
+    nuevo: PlanCifrado,
+    separador: bytes = b"\n",
+    tam_bloque: int = TAM_BLOQUE_TRANSCODIFICACION,
+) -> int:
+    """
+    Pasa un flujo de registros de ancho fijo del plan `anterior` al `nuevo`.
+
+    Cada registro son num_digitos dígitos ASCII seguidos del separador; el
+    último puede no llevarlo. Los bloques se escriben a medida que se leen, así
+    que ante un registro inválido la salida queda con los bloques anteriores.
+    Para rotar un archivo en sitio (y poder reanudar) basta con
+    transformar_en_sitio(ruta, "cifrar", componer_planes(anterior, nuevo)).
+
+    Args:
+        entrada: Archivo binario de lectura
+        salida: Archivo binario de escritura
+        anterior: Plan con el que están cifrados los datos
+        nuevo: Plan con el que deben quedar cifrados
+        separador: Bytes que terminan cada registro
+        tam_bloque: Tamaño aproximado en bytes de cada bloque leído
+
+    Returns:
+        Número de registros transformados
+
+    Raises:
+        ValueError: Si algún registro es inválido o los planes no son compatibles
+    """
+    compuesto = componer_planes(anterior, nuevo)
+    ancho = compuesto.num_digitos + len(separador)
+    tam_bloque = max(tam_bloque // ancho, 1) * ancho
+
+    num_registros = 0
+    while True:
+        bloque = entrada.read(tam_bloque)
+        if not bloque:
+            break
+        # Completar el bloque si la lectura devolvió menos bytes (tuberías)
+        while len(bloque) % ancho:
+            resto = entrada.read(ancho - len(bloque) % ancho)
+            if not resto:
+                break
+            bloque += resto
+
+        # El último registro puede no llevar separador
+        sin_separador = len(bloque) % ancho == compuesto.num_digitos and len(separador) > 0
+        if sin_separador:
+            bloque += separador
+        try:
+            transformado = compuesto.cifrar_buffer(bloque, separador)
+        except ValueError as error:
+            raise ValueError(f"{error} (bloque que empieza en el registro {num_registros})") from None
+        salida.write(transformado[:-len(separador)] if sin_separador else transformado)
+        num_registros += len(bloque) // ancho
+    return num_registros
@@ -0,0 +1,324 @@
+"""
+Módulo de verificación exhaustiva del cifrado.
+Recorre todo el dominio de códigos (10**6 para el plan por defecto) y
+comprueba, para cada ruta de implementación, que descifrar(cifrar(x)) == x,
+que cifrar es una biyección sin colisiones y que todas las rutas coinciden.
+Además contrasta cada ruta con el algoritmo original dígito a dígito (y, para
+el plan por defecto, con pares conocidos), de modo que un error común a todas
+las rutas generadas no pase inadvertido.
+
+Pensado para ejecutarse como control cada vez que cambie el cifrado o alguna
+de sus rutas rápidas:
+    python -m src.cli verificar
+"""
+
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from src.logic.cipher import CipherLogic, PLAN_POR_DEFECTO
+from src.logic.plan import DIGITOS_ASCII, PlanCifrado, compilar_plan
+
+# Rutas que se pueden verificar
+RUTA_BUFFER = "buffer"      # PlanCifrado.cifrar_buffer sobre el dominio completo
+RUTA_ENTERO = "entero"      # PlanCifrado.cifrar_entero, código a código
+RUTA_LOTE = "lote"          # PlanCifrado.cifrar_lote (requiere NumPy)
+RUTA_TABLA = "tabla"        # TablaCifrado (solo el plan por defecto)
+RUTA_ESCALAR = "escalar"    # CipherLogic.cifrar (solo el plan por defecto)
+RUTAS = (RUTA_BUFFER, RUTA_ENTERO, RUTA_LOTE, RUTA_TABLA, RUTA_ESCALAR)
+RUTAS_RAPIDAS = (RUTA_BUFFER, RUTA_ENTERO, RUTA_LOTE, RUTA_TABLA)
+
+# Dominios mayores tardarían demasiado en recorrerse completos
+MAX_DIGITOS_VERIFICABLES = 7
+
+# Diferencias que se informan como máximo por cada comprobación
+MAX_DIFERENCIAS = 5
+
+# Paso con que se muestrea el dominio al contrastar con el algoritmo original
+PASO_MUESTRA = 97
+
+# Pares (código, cifrado) del plan por defecto, calculados a mano
+PARES_CONOCIDOS = (
+    ("000000", "777777"),
+    ("000001", "777787"),
+    ("123456", "018932"),
+    ("654321", "103289"),
+    ("999999", "666666"),
+)
+
+
+class ResultadoVerificacion:
+    """Resultado de una verificación: tiempos por ruta y fallos encontrados."""
+
+    def __init__(self, num_codigos: int):
+        self.num_codigos = num_codigos
+        self.tiempos: Dict[str, float] = {}
+        self.omitidas: Dict[str, str] = {}
+        self.fallos: List[str] = []
+
+    @property
+    def exitoso(self) -> bool:
+        """True si ninguna ruta presentó fallos."""
+        return not self.fallos
+
+    def resumen(self) -> str:
+        """Texto legible con el resultado de cada ruta."""
+        lineas = [f"Dominio: {self.num_codigos} códigos"]
+        for ruta, segundos in self.tiempos.items():
+            lineas.append(f"  {ruta}: {segundos * 1000:.0f} ms")
+        for ruta, motivo in self.omitidas.items():
+            lineas.append(f"  {ruta}: omitida ({motivo})")
+        lineas.extend(f"FALLO {fallo}" for fallo in self.fallos)
+        lineas.append("Verificación correcta" if self.exitoso else f"{len(self.fallos)} fallos")
+        return "\n".join(lineas)
+
+
+def dominio_buffer(num_digitos: int, separador: bytes = b"\n") -> bytearray:
+    """
+    Construye el búfer con todos los códigos de num_digitos dígitos, en orden.
+
+    Cada columna de dígitos es un patrón periódico, así que se asigna por
+    rebanadas con paso en lugar de formatear los códigos uno a uno.
+    """
+    total = 10 ** num_digitos
+    ancho = num_digitos + len(separador)
+    datos = bytearray(total * ancho)
+    for posicion in range(num_digitos):
+        repeticiones = 10 ** (num_digitos - 1 - posicion)
+        periodo = b"".join(bytes((digito,)) * repeticiones for digito in DIGITOS_ASCII)
+        datos[posicion::ancho] = periodo * (total // len(periodo))
+    for posicion, byte in enumerate(separador, num_digitos):
+        datos[posicion::ancho] = bytes((byte,)) * total
+    return datos
+
+
+def _buffer_a_enteros(datos, num_digitos: int):
+    """Convierte un búfer de códigos separados por saltos de línea en enteros."""
+    try:
+        import numpy as np
+    except ImportError:
+        return array("q", map(int, bytes(datos).split()))
+    matriz = np.frombuffer(datos, dtype=np.uint8).reshape(-1, num_digitos + 1)[:, :num_digitos]
+    pesos = 10 ** np.arange(num_digitos - 1, -1, -1, dtype=np.int64)
+    return (matriz.astype(np.int64) - 48) @ pesos
+
+
+def _evaluar_rango(ruta: str, desplazamiento: int, num_digitos: int, permutacion: Sequence[int],
+                   inicio: int, fin: int):
+    """
+    Cifra y descifra los códigos [inicio, fin) por una ruta código a código.
+
+    Se ejecuta también en procesos trabajadores, por eso recibe los
+    parámetros del plan en lugar del plan.
+
+    Returns:
+        Tupla (cifrados, descifrados) como arreglos array('q')
+    """
+    if ruta == RUTA_ESCALAR:
+        formato = "%0{}d".format(num_digitos)
+        cifrar, descifrar = CipherLogic.cifrar, CipherLogic.descifrar
+        cifrados = array("q", [int(cifrar(formato % numero)) for numero in range(inicio, fin)])
+        descifrados = array("q", [int(descifrar(formato % numero)) for numero in cifrados])
+    else:
+        plan = compilar_plan(desplazamiento, num_digitos, permutacion)
+        cifrados = array("q", map(plan.cifrar_entero, range(inicio, fin)))
+        descifrados = array("q", map(plan.descifrar_entero, cifrados))
+    return cifrados, descifrados
+
+
+def _evaluar_por_codigo(ruta: str, plan: PlanCifrado, procesos: int):
+    """Evalúa una ruta código a código, repartiendo el dominio entre procesos."""
+    total = 10 ** plan.num_digitos
+    parametros = (plan.desplazamiento, plan.num_digitos, plan.permutacion)
+    if procesos <= 1:
+        return _evaluar_rango(ruta, *parametros, 0, total)
+
+    tam_rango = -(-total // procesos)
+    rangos = [(inicio, min(inicio + tam_rango, total)) for inicio in range(0, total, tam_rango)]
+    cifrados, descifrados = array("q"), array("q")
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        futuros = [ejecutor.submit(_evaluar_rango, ruta, *parametros, inicio, fin) for inicio, fin in rangos]
+        for futuro in futuros:
+            parte_cifrados, parte_descifrados = futuro.result()
+            cifrados.extend(parte_cifrados)
+            descifrados.extend(parte_descifrados)
+    return cifrados, descifrados
+
+
+def _evaluar(ruta: str, plan: PlanCifrado, procesos: int):
+    """
+    Obtiene, para todo el dominio, el cifrado de cada código y el descifrado de cada cifrado.
+
+    Returns:
+        Tupla (cifrados, descifrados) indexada por código
+    """
+    if ruta == RUTA_BUFFER:
+        dominio = dominio_buffer(plan.num_digitos)
+        cifrado = plan.cifrar_buffer(dominio)
+        descifrado = plan.descifrar_buffer(cifrado)
+        return _buffer_a_enteros(cifrado, plan.num_digitos), _buffer_a_enteros(descifrado, plan.num_digitos)
+    if ruta == RUTA_LOTE:
+        import numpy as np
+        cifrados = plan.cifrar_lote(np.arange(10 ** plan.num_digitos, dtype=np.int64))
+        return cifrados, plan.descifrar_lote(cifrados)
+    if ruta == RUTA_TABLA:
+        from src.logic.tabla import TablaCifrado
+        tabla = TablaCifrado.construir()
+        try:
+            import numpy as np
+        except ImportError:
+            return tabla.directa, array("I", [tabla.inversa[cifrado] for cifrado in tabla.directa])
+        cifrados = tabla.cifrar_lote(np.arange(len(tabla.directa)))
+        return cifrados, tabla.descifrar_lote(cifrados)
+    return _evaluar_por_codigo(ruta, plan, procesos)
+
+
+def cifrar_por_digitos(plan: PlanCifrado, numero: int) -> int:
+    """
+    Cifra un código con el algoritmo original, dígito a dígito.
+
+    No usa código generado ni tablas: sirve de referencia independiente de
+    las rutas que se verifican.
+    """
+    sumados = [(int(digito) + plan.desplazamiento) % 10 for digito in f"{numero:0{plan.num_digitos}d}"]
+    return int("".join(str(sumados[origen]) for origen in plan.permutacion))
+
+
+def _comprobar_original(ruta: str, cifrados, plan: PlanCifrado, resultado: ResultadoVerificacion, ancho: int):
+    """Registra las diferencias con el algoritmo original y con los pares conocidos."""
+    total = resultado.num_codigos
+    diferencias = []
+    for codigo in [*range(0, total, PASO_MUESTRA), total - 1]:
+        esperado = cifrar_por_digitos(plan, codigo)
+        if int(cifrados[codigo]) != esperado:
+            diferencias.append((codigo, esperado, "el algoritmo original"))
+    if plan is PLAN_POR_DEFECTO:
+        for codigo, cifrado in PARES_CONOCIDOS:
+            if int(cifrados[int(codigo)]) != int(cifrado):
+                diferencias.append((int(codigo), int(cifrado), "el par conocido"))
+    for codigo, esperado, origen in diferencias[:MAX_DIFERENCIAS]:
+        resultado.fallos.append(
+            f"{ruta}: cifrar({codigo:0{ancho}d}) = {int(cifrados[codigo]):0{ancho}d}, "
+            f"{origen} da {esperado:0{ancho}d}"
+        )
+
+
+def _primeras_diferencias(obtenidos, esperados) -> List[int]:
+    """Índices de los primeros elementos distintos entre dos secuencias."""
+    diferencias = []
+    for indice, (obtenido, esperado) in enumerate(zip(obtenidos, esperados)):
+        if obtenido != esperado:
+            diferencias.append(indice)
+            if len(diferencias) >= MAX_DIFERENCIAS:
+                break
+    return diferencias
+
+
+def _iguales(obtenidos, esperados) -> bool:
+    try:
+        import numpy as np
+    except ImportError:
+        return len(obtenidos) == len(esperados) and all(map(int.__eq__, map(int, obtenidos), map(int, esperados)))
+    if isinstance(esperados, range):
+        esperados = np.arange(esperados.start, esperados.stop, dtype=np.int64)
+    return np.array_equal(np.asarray(obtenidos, dtype=np.int64), np.asarray(esperados, dtype=np.int64))
+
+
+def _colisiones(cifrados, total: int) -> List[int]:
+    """Valores cifrados fuera de rango o repetidos (vacío si es una biyección)."""
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        valores = np.asarray(cifrados, dtype=np.int64)
+        en_rango = (valores >= 0) & (valores < total)
+        cuentas = np.bincount(valores[en_rango], minlength=total)
+        malos = np.concatenate([valores[~en_rango], np.flatnonzero(cuentas > 1)])
+        return [int(valor) for valor in malos[:MAX_DIFERENCIAS]]
+
+    vistos = bytearray(total)
+    repetidos = []
+    for valor in map(int, cifrados):
+        if not 0 <= valor < total or vistos[valor]:
+            repetidos.append(valor)
+            if len(repetidos) >= MAX_DIFERENCIAS:
+                break
+        else:
+            vistos[valor] = 1
+    return repetidos
+
+
+def _comprobar(ruta: str, cifrados, descifrados, referencia, resultado: ResultadoVerificacion, ancho: int):
+    """Registra en el resultado los fallos de ida y vuelta, biyección y coincidencia."""
+    total = resultado.num_codigos
+    dominio = range(total)
+
+    if not _iguales(descifrados, dominio):
+        for codigo in _primeras_diferencias(descifrados, dominio):
+            resultado.fallos.append(
+                f"{ruta}: descifrar(cifrar({codigo:0{ancho}d})) = {int(descifrados[codigo]):0{ancho}d}"
+            )
+    for valor in _colisiones(cifrados, total):
+        resultado.fallos.append(f"{ruta}: el cifrado {valor} se repite o está fuera del dominio")
+    if referencia is not None and not _iguales(cifrados, referencia):
+        for codigo in _primeras_diferencias(cifrados, referencia):
+            resultado.fallos.append(
+                f"{ruta}: cifrar({codigo:0{ancho}d}) = {int(cifrados[codigo]):0{ancho}d}, "
+                f"la ruta de referencia da {int(referencia[codigo]):0{ancho}d}"
+            )
+
+
+def verificar(
+    rutas: Sequence[str] = RUTAS_RAPIDAS,
+    plan: PlanCifrado = PLAN_POR_DEFECTO,
+    procesos: Optional[int] = None,
+) -> ResultadoVerificacion:
+    """
+    Verifica exhaustivamente el cifrado sobre todo el dominio del plan.
+
+    La primera ruta indicada sirve de referencia para las demás, y todas se
+    contrastan además con el algoritmo original sobre una muestra. Las rutas
+    que no aplican (NumPy ausente, plan distinto del por defecto) se omiten.
+
+    Args:
+        rutas: Rutas a verificar (ver RUTAS)
+        plan: Plan de cifrado a verificar
+        procesos: Procesos para las rutas código a código (None = núcleos disponibles)
+
+    Returns:
+        ResultadoVerificacion con los tiempos y los fallos encontrados
+
+    Raises:
+        ValueError: Si alguna ruta no existe o el dominio es demasiado grande
+    """
+    desconocidas = [ruta for ruta in rutas if ruta not in RUTAS]
+    if desconocidas:
+        raise ValueError(f"Rutas desconocidas: {', '.join(desconocidas)} (use {', '.join(RUTAS)})")
+    if plan.num_digitos > MAX_DIGITOS_VERIFICABLES:
+        raise ValueError(f"Solo se verifican planes de hasta {MAX_DIGITOS_VERIFICABLES} dígitos")
+
+    procesos = procesos or os.cpu_count() or 1
+    resultado = ResultadoVerificacion(10 ** plan.num_digitos)
+    referencia = None
+    for ruta in rutas:
+        if ruta in (RUTA_TABLA, RUTA_ESCALAR) and plan is not PLAN_POR_DEFECTO:
+            resultado.omitidas[ruta] = "solo aplica al plan por defecto"
+            continue
+        if ruta == RUTA_LOTE:
+            try:
+                import numpy  # noqa: F401
+            except ImportError:
+                resultado.omitidas[ruta] = "NumPy no está instalado"
+                continue
+
+        inicio = time.perf_counter()
+        cifrados, descifrados = _evaluar(ruta, plan, procesos)
+        _comprobar(ruta, cifrados, descifrados, referencia, resultado, plan.num_digitos)
+        _comprobar_original(ruta, cifrados, plan, resultado, plan.num_digitos)
+        resultado.tiempos[ruta] = time.perf_counter() - inicio
+        if referencia is None:
+            referencia = cifrados
+    return resultado
@@ -0,0 +1,161 @@
+"""
+Cliente mínimo del demonio local de cifrado (ver src.servicio.demonio).
+
+Mantiene una conexión persistente y envía las peticiones por ventanas sin
+esperar cada respuesta, de modo que el costo por código se reduce al de un
+viaje de ida y vuelta por el socket repartido entre toda la ventana.
+
+Uso:
+    python -m src.servicio.cliente cifrar|descifrar [--socket RUTA] < codigos.txt
+"""
+
+import argparse
+import socket
+import sys
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from src.servicio.demonio import ruta_socket_por_defecto
+
+# Peticiones enviadas antes de leer sus respuestas
+VENTANA = 1024
+
+COMANDOS = {
+    "cifrar": b"C ",
+    "descifrar": b"D ",
+}
+
+
+class ClienteCifrado:
+    """Conexión persistente con el demonio de cifrado."""
+
+    def __init__(self, ruta_socket: Optional[str] = None, tiempo_espera: Optional[float] = 10.0):
+        """
+        Args:
+            ruta_socket: Ruta del socket (None = ruta_socket_por_defecto())
+            tiempo_espera: Segundos máximos de espera por cada operación del socket
+
+        Raises:
+            OSError: Si el demonio no está escuchando
+        """
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(tiempo_espera)
+        try:
+            self._socket.connect(ruta_socket or ruta_socket_por_defecto())
+        except OSError:
+            self._socket.close()
+            raise
+        self._lector = self._socket.makefile("rb")
+
+    def __enter__(self) -> "ClienteCifrado":
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def cerrar(self):
+        """Cierra la conexión."""
+        self._lector.close()
+        self._socket.close()
+
+    def cifrar(self, codigo: str) -> str:
+        """
+        Cifra un código en el demonio.
+
+        Raises:
+            ValueError: Si el demonio rechaza el código
+        """
+        return self._unico("cifrar", codigo)
+
+    def descifrar(self, codigo: str) -> str:
+        """Descifra un código en el demonio (ver cifrar)."""
+        return self._unico("descifrar", codigo)
+
+    def _unico(self, operacion: str, codigo: str) -> str:
+        resultado, mensaje_error = next(self.transformar(operacion, [codigo]))
+        if resultado is None:
+            raise ValueError(mensaje_error)
+        return resultado
+
+    def transformar(self, operacion: str, codigos: Iterable[str],
+                    ventana: int = VENTANA) -> Iterator[Tuple[Optional[str], str]]:
+        """
+        Envía los códigos por ventanas y devuelve las respuestas en orden.
+
+        Args:
+            operacion: "cifrar" o "descifrar"
+            codigos: Códigos a transformar (sin saltos de línea)
+            ventana: Peticiones enviadas antes de leer sus respuestas
+
+        Yields:
+            Tuplas (resultado, "") o (None, mensaje_error) por cada código
+        """
+        prefijo = COMANDOS.get(operacion)
+        if prefijo is None:
+            raise ValueError(f"Operación desconocida: {operacion}")
+
+        pendientes: List[bytes] = []
+        for codigo in codigos:
+            pendientes.append(prefijo + codigo.encode("utf-8") + b"\n")
+            if len(pendientes) >= ventana:
+                yield from self._enviar(pendientes)
+                pendientes = []
+        if pendientes:
+            yield from self._enviar(pendientes)
+
+    def _enviar(self, peticiones: List[bytes]) -> List[Tuple[Optional[str], str]]:
+        """Envía una ventana de peticiones y lee exactamente una respuesta por cada una."""
+        self._socket.sendall(b"".join(peticiones))
+        respuestas = []
+        for _ in peticiones:
+            linea = self._lector.readline()
+            if not linea:
+                raise ConnectionError("El demonio cerró la conexión")
+            estado, _, contenido = linea.rstrip(b"\n").decode("utf-8").partition(" ")
+            respuestas.append((contenido, "") if estado == "OK" else (None, contenido))
+        return respuestas
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Pasa la entrada estándar por el demonio, un código por línea.
+
+    Returns:
+        0 si todos los códigos fueron válidos, 1 si hubo errores, 2 si no hay demonio
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.servicio.cliente",
+                                     description="Cliente del demonio local de cifrado.")
+    parser.add_argument("operacion", choices=sorted(COMANDOS))
+    parser.add_argument("--socket", help="Ruta del socket (por defecto $CIFRADO_SOCKET o uno por usuario en /tmp)")
+    args = parser.parse_args(argv)
+
+    try:
+        cliente = ClienteCifrado(args.socket)
+    except OSError as error:
+        print(f"No se pudo conectar con el demonio: {error}", file=sys.stderr)
+        return 2
+
+    # Las líneas vacías se omiten, igual que en la consola
+    numeros_linea = deque()
+
+    def codigos():
+        for numero_linea, linea in enumerate(sys.stdin, start=1):
+            codigo = linea.strip()
+            if codigo:
+                numeros_linea.append(numero_linea)
+                yield codigo
+
+    errores = 0
+    with cliente:
+        for resultado, mensaje_error in cliente.transformar(args.operacion, codigos()):
+            numero_linea = numeros_linea.popleft()
+            if resultado is None:
+                errores += 1
+                print(f"Línea {numero_linea}: {mensaje_error}", file=sys.stderr)
+            else:
+                sys.stdout.write(resultado + "\n")
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
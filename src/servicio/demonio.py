@@ -0,0 +1,202 @@
+"""
+Demonio local de cifrado sobre un socket de dominio Unix.
+
+Mantiene el intérprete y las tablas de cifrado cargados para que los scripts
+de shell no paguen el arranque en cada código. Habla un protocolo de líneas:
+
+    Petición:   C <codigo>    (cifrar)
+                D <codigo>    (descifrar)
+    Respuesta:  OK <resultado>
+                ERR <mensaje>
+
+Las respuestas llegan en el mismo orden que las peticiones; un cliente puede
+enviar muchas peticiones seguidas sin esperar respuesta (pipelining).
+
+Uso:
+    python -m src.servicio.demonio [--socket RUTA] [--cache-tabla RUTA]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import tempfile
+from typing import List, Optional
+
+from src.logic.cipher import CipherLogic
+from src.utils.validators import Validator
+
+_log = logging.getLogger(__name__)
+
+# Bytes que se leen del socket de una vez (pueden contener muchas peticiones)
+TAM_LECTURA = 1 << 16
+# Tamaño máximo de una línea de petición
+LIMITE_LINEA = 8192
+
+# Respuesta ante un fallo inesperado (los detalles quedan en el registro del demonio)
+RESPUESTA_ERROR_INTERNO = "ERR Error interno al procesar el código\n".encode("utf-8")
+
+# Comando -> método de CipherLogic (se busca en cada lote para respetar la instrumentación)
+COMANDOS = {
+    b"C": "cifrar",
+    b"D": "descifrar",
+}
+
+
+def ruta_socket_por_defecto() -> str:
+    """Ruta del socket: CIFRADO_SOCKET o un archivo por usuario en el directorio temporal."""
+    ruta = os.environ.get("CIFRADO_SOCKET")
+    if ruta:
+        return ruta
+    usuario = os.getuid() if hasattr(os, "getuid") else os.getpid()
+    return os.path.join(tempfile.gettempdir(), f"cifrado-{usuario}.sock")
+
+
+def responder_lineas(lineas: List[bytes]) -> bytes:
+    """
+    Atiende un grupo de peticiones y devuelve todas las respuestas juntas.
+
+    Args:
+        lineas: Peticiones sin el salto de línea final
+
+    Returns:
+        Respuestas concatenadas, una línea por petición
+    """
+    funciones = {comando: getattr(CipherLogic, nombre) for comando, nombre in COMANDOS.items()}
+    respuestas = []
+    for linea in lineas:
+        comando, _, codigo = linea.rstrip(b"\r").partition(b" ")
+        funcion = funciones.get(comando)
+        if funcion is None:
+            respuestas.append(b"ERR Comando desconocido (use C o D)\n")
+            continue
+        codigo = codigo.strip()
+        try:
+            # Ruta rápida: bytes.isdigit solo acepta dígitos ASCII
+            if len(codigo) == 6 and codigo.isdigit():
+                respuestas.append(b"OK " + funcion(codigo.decode("ascii")).encode("ascii") + b"\n")
+                continue
+            texto = codigo.decode("utf-8", "replace")
+            es_valido, mensaje_error = Validator.validar_numero_6_digitos(texto)
+            if es_valido:
+                respuestas.append(("OK " + funcion(texto) + "\n").encode("utf-8"))
+            else:
+                respuestas.append(("ERR " + mensaje_error + "\n").encode("utf-8"))
+        except Exception:
+            # Un fallo inesperado responde solo a su línea; la conexión sigue atendiendo
+            _log.exception("Error al atender la petición %r", linea)
+            respuestas.append(RESPUESTA_ERROR_INTERNO)
+    return b"".join(respuestas)
+
+
+def _liberar_ruta(ruta: str):
+    """
+    Elimina un socket abandonado por un demonio anterior.
+
+    Raises:
+        OSError: Si otro demonio sigue escuchando en la ruta
+    """
+    if not os.path.exists(ruta):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sonda:
+        try:
+            sonda.connect(ruta)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(ruta)
+            return
+    raise OSError(f"Ya hay un demonio escuchando en {ruta}")
+
+
+class DemonioCifrado:
+    """Servidor de líneas sobre un socket Unix con las tablas de cifrado en memoria."""
+
+    def __init__(self, ruta_socket: Optional[str] = None, tabla=None, ruta_tabla: Optional[str] = None):
+        """
+        Args:
+            ruta_socket: Ruta del socket (None = ruta_socket_por_defecto())
+            tabla: TablaCifrado ya construida (opcional)
+            ruta_tabla: Archivo de caché de las tablas, si hay que construirlas
+        """
+        self.ruta_socket = ruta_socket or ruta_socket_por_defecto()
+        self.tabla = tabla
+        self.ruta_tabla = ruta_tabla
+        self._servidor: Optional[asyncio.AbstractServer] = None
+        self._tabla_previa = None
+
+    async def iniciar(self) -> "DemonioCifrado":
+        """Carga las tablas y abre el socket (solo accesible para el usuario actual)."""
+        if self.tabla is None:
+            from src.logic.tabla import TablaCifrado
+            self.tabla = TablaCifrado.cargar_o_construir(self.ruta_tabla)
+
+        _liberar_ruta(self.ruta_socket)
+        self._servidor = await asyncio.start_unix_server(self._atender_conexion, path=self.ruta_socket)
+        os.chmod(self.ruta_socket, 0o600)
+        self._tabla_previa = CipherLogic._tabla
+        CipherLogic.usar_tabla(self.tabla)
+        return self
+
+    async def detener(self):
+        """Cierra el socket, lo elimina y restaura la configuración de CipherLogic."""
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+            self._servidor = None
+            try:
+                os.unlink(self.ruta_socket)
+            except FileNotFoundError:
+                pass
+            CipherLogic.usar_tabla(self._tabla_previa)
+
+    async def servir_para_siempre(self):
+        """Atiende conexiones hasta que la tarea sea cancelada."""
+        await self.iniciar()
+        try:
+            await self._servidor.serve_forever()
+        finally:
+            await self.detener()
+
+    async def _atender_conexion(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """Responde todas las peticiones completas de cada lectura con una sola escritura."""
+        pendiente = b""
+        try:
+            while True:
+                datos = await lector.read(TAM_LECTURA)
+                if not datos:
+                    break
+                *lineas, pendiente = (pendiente + datos).split(b"\n")
+                if lineas:
+                    escritor.write(responder_lineas(lineas))
+                    await escritor.drain()
+                if len(pendiente) > LIMITE_LINEA:
+                    escritor.write(b"ERR Linea demasiado larga\n")
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+            try:
+                await escritor.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def main(argv: Optional[List[str]] = None):
+    """Arranca el demonio desde la línea de comandos."""
+    parser = argparse.ArgumentParser(prog="python -m src.servicio.demonio",
+                                     description="Demonio local de cifrado sobre un socket Unix.")
+    parser.add_argument("--socket", help="Ruta del socket (por defecto $CIFRADO_SOCKET o uno por usuario en /tmp)")
+    parser.add_argument("--cache-tabla", metavar="RUTA",
+                        help="Archivo donde cargar o guardar las tablas precalculadas")
+    args = parser.parse_args(argv)
+
+    demonio = DemonioCifrado(args.socket, ruta_tabla=args.cache_tabla)
+    try:
+        asyncio.run(demonio.servir_para_siempre())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
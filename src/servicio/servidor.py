@@ -0,0 +1,317 @@
+"""
+Servicio HTTP de cifrado sobre asyncio (solo biblioteca estándar).
+
+Las solicitudes concurrentes de un solo código que llegan dentro de una
+ventana corta se agrupan en una sola llamada por lotes y luego se reparten
+a cada cliente.
+
+Rutas:
+    GET  /cifrar/<codigo>       POST /cifrar      (código en el cuerpo)
+    GET  /descifrar/<codigo>    POST /descifrar   (código en el cuerpo)
+
+Uso:
+    python -m src.servicio.servidor --puerto 8080
+"""
+
+import argparse
+import asyncio
+import logging
+from typing import Callable, List, Optional, Sequence
+
+from src.logic.flujo import OPERACIONES, transformar_lista
+from src.utils.validators import Validator
+
+MAX_LOTE = 256
+MAX_ESPERA = 0.002
+MAX_COLA = 10000
+TIEMPO_INACTIVIDAD = 30.0
+# Tamaño máximo de una línea de la petición (línea inicial o cabecera)
+LIMITE_LINEA = 8192
+
+_log = logging.getLogger(__name__)
+
+RAZONES = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class ColaLlena(Exception):
+    """Se lanza cuando la cola de solicitudes pendientes está llena."""
+
+
+class AgrupadorLotes:
+    """Agrupa solicitudes concurrentes en una sola llamada por lotes."""
+
+    def __init__(
+        self,
+        funcion_lote: Callable[[Sequence[str]], List[str]],
+        max_lote: int = MAX_LOTE,
+        max_espera: float = MAX_ESPERA,
+        max_cola: int = MAX_COLA,
+    ):
+        """
+        Args:
+            funcion_lote: Función que transforma una lista de códigos
+            max_lote: Máximo de códigos por llamada
+            max_espera: Segundos que se espera para completar un lote
+            max_cola: Máximo de solicitudes pendientes antes de rechazar
+        """
+        if max_lote < 1 or max_cola < 1 or max_espera < 0:
+            raise ValueError("max_lote y max_cola deben ser positivos y max_espera no negativo")
+        self.funcion_lote = funcion_lote
+        self.max_lote = max_lote
+        self.max_espera = max_espera
+        self.cola: asyncio.Queue = asyncio.Queue(max_cola)
+        self.lotes_procesados = 0
+        self._tarea: Optional[asyncio.Task] = None
+
+    def iniciar(self):
+        """Inicia la tarea que consume la cola."""
+        if self._tarea is None:
+            self._tarea = asyncio.get_running_loop().create_task(self._consumir())
+
+    async def detener(self):
+        """Detiene la tarea consumidora y cancela las solicitudes pendientes."""
+        if self._tarea is not None:
+            self._tarea.cancel()
+            try:
+                await self._tarea
+            except asyncio.CancelledError:
+                pass
+            self._tarea = None
+        while not self.cola.empty():
+            _, futuro = self.cola.get_nowait()
+            futuro.cancel()
+
+    async def enviar(self, codigo: str) -> str:
+        """
+        Encola un código y espera su resultado.
+
+        Raises:
+            ColaLlena: Si hay demasiadas solicitudes pendientes
+        """
+        futuro = asyncio.get_running_loop().create_future()
+        try:
+            self.cola.put_nowait((codigo, futuro))
+        except asyncio.QueueFull:
+            raise ColaLlena("Demasiadas solicitudes pendientes") from None
+        return await futuro
+
+    async def _consumir(self):
+        """Forma lotes con lo que llega dentro de la ventana y los procesa."""
+        while True:
+            lote = [await self.cola.get()]
+            if self.max_espera and self.cola.qsize() < self.max_lote - 1:
+                await asyncio.sleep(self.max_espera)
+            while len(lote) < self.max_lote and not self.cola.empty():
+                lote.append(self.cola.get_nowait())
+
+            try:
+                resultados = self.funcion_lote([codigo for codigo, _ in lote])
+            except Exception:
+                # Repetir uno a uno para que solo falle la solicitud culpable
+                self._procesar_por_separado(lote)
+                continue
+
+            self.lotes_procesados += 1
+            for (_, futuro), resultado in zip(lote, resultados):
+                if not futuro.done():
+                    futuro.set_result(resultado)
+
+    def _procesar_por_separado(self, lote):
+        """Procesa cada solicitud de un lote fallido por separado."""
+        for codigo, futuro in lote:
+            try:
+                resultado, = self.funcion_lote([codigo])
+            except Exception as error:
+                if not futuro.done():
+                    futuro.set_exception(error)
+            else:
+                if not futuro.done():
+                    futuro.set_result(resultado)
+
+
+class ServidorCifrado:
+    """Servidor HTTP/1.1 con conexiones persistentes y agrupación de solicitudes."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        puerto: int = 8080,
+        max_lote: int = MAX_LOTE,
+        max_espera: float = MAX_ESPERA,
+        max_cola: int = MAX_COLA,
+        tiempo_inactividad: float = TIEMPO_INACTIVIDAD,
+    ):
+        self.host = host
+        self.puerto = puerto
+        self.tiempo_inactividad = tiempo_inactividad
+        self._parametros_lote = (max_lote, max_espera, max_cola)
+        self.agrupadores = {}
+        self._servidor: Optional[asyncio.AbstractServer] = None
+
+    async def iniciar(self) -> "ServidorCifrado":
+        """Abre el socket y arranca los agrupadores de lotes."""
+        for operacion in OPERACIONES:
+            agrupador = AgrupadorLotes(
+                lambda codigos, operacion=operacion: transformar_lista(codigos, operacion),
+                *self._parametros_lote,
+            )
+            agrupador.iniciar()
+            self.agrupadores[operacion] = agrupador
+
+        self._servidor = await asyncio.start_server(
+            self._atender_conexion, self.host, self.puerto, limit=LIMITE_LINEA,
+        )
+        # Con puerto 0 el sistema asigna uno libre
+        self.puerto = self._servidor.sockets[0].getsockname()[1]
+        return self
+
+    async def detener(self):
+        """Cierra el servidor y los agrupadores."""
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+            self._servidor = None
+        for agrupador in self.agrupadores.values():
+            await agrupador.detener()
+
+    async def servir_para_siempre(self):
+        """Atiende conexiones hasta que la tarea sea cancelada."""
+        await self.iniciar()
+        try:
+            await self._servidor.serve_forever()
+        finally:
+            await self.detener()
+
+    async def _atender_conexion(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """Atiende peticiones sucesivas sobre una conexión persistente."""
+        try:
+            while True:
+                try:
+                    peticion = await asyncio.wait_for(self._leer_peticion(lector), self.tiempo_inactividad)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except (ValueError, asyncio.LimitOverrunError):
+                    escritor.write(self._respuesta(400, "Petición mal formada", mantener=False))
+                    break
+                if peticion is None:
+                    break
+
+                metodo, ruta, cuerpo, mantener = peticion
+                estado, texto = await self._despachar(metodo, ruta, cuerpo)
+                escritor.write(self._respuesta(estado, texto, mantener))
+                await escritor.drain()
+                if not mantener:
+                    break
+        finally:
+            escritor.close()
+            try:
+                await escritor.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    async def _leer_peticion(lector: asyncio.StreamReader):
+        """
+        Lee una petición HTTP.
+
+        Returns:
+            Tupla (metodo, ruta, cuerpo, mantener_conexion), o None si el cliente cerró
+        """
+        linea = await lector.readline()
+        if not linea:
+            return None
+        partes = linea.decode("latin-1").split()
+        if len(partes) != 3 or not partes[2].startswith("HTTP/"):
+            raise ValueError("Línea de petición inválida")
+        metodo, ruta, version = partes
+
+        cabeceras = {}
+        while True:
+            linea = await lector.readline()
+            if linea in (b"\r\n", b"\n", b""):
+                break
+            nombre, _, valor = linea.decode("latin-1").partition(":")
+            cabeceras[nombre.strip().lower()] = valor.strip()
+
+        longitud = int(cabeceras.get("content-length", "0"))
+        if longitud < 0 or longitud > LIMITE_LINEA:
+            raise ValueError("Longitud de cuerpo inválida")
+        cuerpo = (await lector.readexactly(longitud)).decode("utf-8", "replace") if longitud else ""
+
+        conexion = cabeceras.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            mantener = conexion == "keep-alive"
+        else:
+            mantener = conexion != "close"
+        return metodo, ruta, cuerpo, mantener
+
+    async def _despachar(self, metodo: str, ruta: str, cuerpo: str):
+        """Resuelve la ruta y devuelve (estado, texto)."""
+        operacion, _, codigo = ruta.split("?", 1)[0].strip("/").partition("/")
+        agrupador = self.agrupadores.get(operacion)
+        if agrupador is None:
+            return 404, "Ruta no encontrada"
+
+        if metodo == "POST":
+            codigo = cuerpo
+        elif metodo != "GET":
+            return 405, "Método no permitido"
+
+        codigo = codigo.strip()
+        es_valido, mensaje_error = Validator.validar_numero_6_digitos(codigo)
+        if not es_valido:
+            return 400, mensaje_error
+
+        try:
+            return 200, await agrupador.enviar(codigo)
+        except ColaLlena:
+            return 503, "Servidor saturado, intente de nuevo"
+        except Exception:
+            _log.exception("Error al %s el código %r", operacion, codigo)
+            return 500, "Error interno del servidor"
+
+    @staticmethod
+    def _respuesta(estado: int, texto: str, mantener: bool) -> bytes:
+        """Construye una respuesta HTTP de texto plano."""
+        cuerpo = (texto + "\n").encode("utf-8")
+        cabeceras = [
+            f"HTTP/1.1 {estado} {RAZONES[estado]}",
+            "Content-Type: text/plain; charset=utf-8",
+            f"Content-Length: {len(cuerpo)}",
+            "Connection: keep-alive" if mantener else "Connection: close",
+        ]
+        if estado == 503:
+            cabeceras.append("Retry-After: 1")
+        return ("\r\n".join(cabeceras) + "\r\n\r\n").encode("latin-1") + cuerpo
+
+
+def main(argv: Optional[List[str]] = None):
+    """Arranca el servidor desde la línea de comandos."""
+    parser = argparse.ArgumentParser(prog="python -m src.servicio.servidor",
+                                     description="Servicio HTTP de cifrado y descifrado.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8080)
+    parser.add_argument("--max-lote", type=int, default=MAX_LOTE,
+                        help="Máximo de códigos por lote")
+    parser.add_argument("--max-espera", type=float, default=MAX_ESPERA * 1000,
+                        help="Milisegundos de espera para completar un lote")
+    parser.add_argument("--max-cola", type=int, default=MAX_COLA,
+                        help="Máximo de solicitudes pendientes antes de responder 503")
+    args = parser.parse_args(argv)
+
+    servidor = ServidorCifrado(args.host, args.puerto, args.max_lote, args.max_espera / 1000, args.max_cola)
+    try:
+        asyncio.run(servidor.servir_para_siempre())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -3,37 +3,85 @@ Módulo de la ventana principal de la aplicación.
 Gestiona la navegación entre las diferentes ventanas.
 """
 
-from PyQt6 import QtWidgets
+import importlib
+import time
+from typing import Callable, Optional
+
+from PyQt6 import QtCore, QtWidgets
 from src.ui.ventana_principal import VentanaPrincipal
-from src.ui.ventana_cifrado import VentanaCifrado
-from src.ui.ventana_descifrado import VentanaDescifrado
+
+# Ventanas que se construyen (e importan) al navegar a ellas por primera vez
+VENTANAS_DIFERIDAS = {
+    "cifrado": ("src.ui.ventana_cifrado", "VentanaCifrado"),
+    "descifrado": ("src.ui.ventana_descifrado", "VentanaDescifrado"),
+}
 
 
 class AplicacionCifrado(QtWidgets.QMainWindow):
     """Ventana principal de la aplicación que gestiona la navegación."""
 
-    def __init__(self):
+    def __init__(self, inicio: Optional[float] = None,
+                 al_primer_pintado: Optional[Callable[[float], None]] = None):
+        """
+        Args:
+            inicio: Instante (time.perf_counter) desde el que medir el primer pintado
+            al_primer_pintado: Función que recibe los segundos hasta el primer pintado
+        """
         super().__init__()
         self.setWindowTitle("Aplicación de Cifrado y Descifrado")
         self.setGeometry(100, 100, 600, 400)
 
+        self.inicio = inicio
+        self.al_primer_pintado = al_primer_pintado
+        self.tiempo_primer_pintado: Optional[float] = None
+
+        # Métricas en la barra de estado (ver mostrar_metricas)
+        self._registro_metricas = None
+        self._temporizador_metricas: Optional[QtCore.QTimer] = None
+        self._llamadas_previas = 0
+        self._instante_previo = 0.0
+
         # Widget principal con stack para cambiar entre ventanas
         self.stack = QtWidgets.QStackedWidget()
         self.setCentralWidget(self.stack)
 
-        # Crear las tres ventanas
+        # Solo la ventana principal se crea al arrancar; las demás al navegar
         self.ventana_principal = VentanaPrincipal(self.cambiar_ventana)
-        self.ventana_cifrado = VentanaCifrado(self.cambiar_ventana)
-        self.ventana_descifrado = VentanaDescifrado(self.cambiar_ventana)
-
-        # Agregar ventanas al stack
         self.stack.addWidget(self.ventana_principal)
-        self.stack.addWidget(self.ventana_cifrado)
-        self.stack.addWidget(self.ventana_descifrado)
+        self.ventanas = {"principal": self.ventana_principal}
 
         # Mostrar ventana principal
         self.stack.setCurrentWidget(self.ventana_principal)
 
+    @property
+    def ventana_cifrado(self):
+        """Ventana de cifrado (se construye al primer acceso)."""
+        return self.obtener_ventana("cifrado")
+
+    @property
+    def ventana_descifrado(self):
+        """Ventana de descifrado (se construye al primer acceso)."""
+        return self.obtener_ventana("descifrado")
+
+    def obtener_ventana(self, ventana_id: str) -> QtWidgets.QWidget:
+        """
+        Devuelve una ventana, construyéndola y agregándola al stack si aún no existe.
+
+        Args:
+            ventana_id: Identificador de la ventana ("principal", "cifrado", "descifrado")
+
+        Raises:
+            KeyError: Si el identificador no corresponde a ninguna ventana
+        """
+        ventana = self.ventanas.get(ventana_id)
+        if ventana is None:
+            nombre_modulo, nombre_clase = VENTANAS_DIFERIDAS[ventana_id]
+            clase = getattr(importlib.import_module(nombre_modulo), nombre_clase)
+            ventana = clase(self.cambiar_ventana)
+            self.stack.addWidget(ventana)
+            self.ventanas[ventana_id] = ventana
+        return ventana
+
     def cambiar_ventana(self, ventana_id: str):
         """
         Cambia entre las diferentes ventanas.
@@ -41,9 +89,38 @@ class AplicacionCifrado(QtWidgets.QMainWindow):
         Args:
             ventana_id: Identificador de la ventana ("principal", "cifrado", "descifrado")
         """
-        if ventana_id == "principal":
-            self.stack.setCurrentWidget(self.ventana_principal)
-        elif ventana_id == "cifrado":
-            self.stack.setCurrentWidget(self.ventana_cifrado)
-        elif ventana_id == "descifrado":
-            self.stack.setCurrentWidget(self.ventana_descifrado)
+        if ventana_id in self.ventanas or ventana_id in VENTANAS_DIFERIDAS:
+            self.stack.setCurrentWidget(self.obtener_ventana(ventana_id))
+
+    def mostrar_metricas(self, registro, intervalo_ms: int = 1000):
+        """
+        Muestra en la barra de estado las operaciones registradas y su ritmo.
+
+        Args:
+            registro: RegistroMetricas de src.utils.metricas
+            intervalo_ms: Periodo de actualización en milisegundos
+        """
+        self._registro_metricas = registro
+        self._llamadas_previas = registro.total_llamadas()
+        self._instante_previo = time.perf_counter()
+        self._temporizador_metricas = QtCore.QTimer(self)
+        self._temporizador_metricas.timeout.connect(self._actualizar_metricas)
+        self._temporizador_metricas.start(intervalo_ms)
+        self._actualizar_metricas()
+
+    def _actualizar_metricas(self):
+        llamadas = self._registro_metricas.total_llamadas()
+        instante = time.perf_counter()
+        transcurrido = instante - self._instante_previo
+        ritmo = (llamadas - self._llamadas_previas) / transcurrido if transcurrido > 0 else 0.0
+        self._llamadas_previas = llamadas
+        self._instante_previo = instante
+        self.statusBar().showMessage(f"Operaciones: {llamadas} ({ritmo:.1f}/s)")
+
+    def paintEvent(self, event):
+        """Registra el tiempo hasta el primer pintado de la ventana."""
+        super().paintEvent(event)
+        if self.tiempo_primer_pintado is None and self.inicio is not None:
+            self.tiempo_primer_pintado = time.perf_counter() - self.inicio
+            if self.al_primer_pintado is not None:
+                self.al_primer_pintado(self.tiempo_primer_pintado)
@@ -0,0 +1,78 @@
+"""
+Módulo del modelo de resultados por lotes.
+Expone resultados guardados en arreglos compactos a una QTableView; el
+texto de cada celda se genera solo cuando la fila se hace visible.
+"""
+
+from array import array
+from typing import Dict, Optional
+
+from PyQt6 import QtCore
+from src.utils.validators import MENSAJES_ERROR
+
+# Valor que marca una fila inválida en los arreglos de entradas y salidas
+SIN_VALOR = -1
+
+
+class ModeloResultados(QtCore.QAbstractTableModel):
+    """Modelo de tabla de solo lectura con columnas Entrada, Salida y Estado."""
+
+    ENCABEZADOS = ("Entrada", "Salida", "Estado")
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._entradas = array("i")
+        self._salidas = array("i")
+        self._invalidos: Dict[int, str] = {}
+        self._errores: Dict[int, int] = {}
+
+    def cargar(self, entradas: array, salidas: array, invalidos: Dict[int, str], errores: Dict[int, int]):
+        """
+        Reemplaza el contenido del modelo.
+
+        Args:
+            entradas: array('i') con el valor de cada entrada (SIN_VALOR si es inválida)
+            salidas: array('i') con el valor de cada salida (SIN_VALOR si es inválida)
+            invalidos: Texto original de las filas inválidas, por índice
+            errores: Código de error de las filas inválidas, por índice
+        """
+        self.beginResetModel()
+        self._entradas = entradas
+        self._salidas = salidas
+        self._invalidos = invalidos
+        self._errores = errores
+        self.endResetModel()
+
+    def limpiar(self):
+        """Vacía el modelo."""
+        self.cargar(array("i"), array("i"), {}, {})
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entradas)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.ENCABEZADOS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        """Genera el texto de la celda al momento de mostrarla."""
+        if role != QtCore.Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+
+        fila = index.row()
+        columna = index.column()
+        codigo_error = self._errores.get(fila)
+        if columna == 0:
+            if codigo_error is not None:
+                return self._invalidos.get(fila, "")
+            return "%06d" % self._entradas[fila]
+        if columna == 1:
+            return "" if codigo_error is not None else "%06d" % self._salidas[fila]
+        return "OK" if codigo_error is None else MENSAJES_ERROR[codigo_error]
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation,
+                   role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        if role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Orientation.Horizontal:
+            return self.ENCABEZADOS[section]
+        return section + 1
@@ -0,0 +1,276 @@
+"""
+Módulo del panel de procesamiento por lotes.
+Valida y transforma muchos códigos en un hilo de fondo para que la
+ventana siga respondiendo.
+"""
+
+import os
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PyQt6 import QtWidgets, QtCore
+from src.logic.flujo import TAM_BLOQUE, transformar_en_bloques
+from src.ui.modelo_resultados import ModeloResultados, SIN_VALOR
+from src.utils.validators import MENSAJES_ERROR
+
+# Filas con error que se listan en el resumen
+MAX_FALLIDOS_MOSTRADOS = 10
+
+
+class ResultadoLote:
+    """Resultado (completo o parcial) de un procesamiento por lotes, en arreglos compactos."""
+
+    def __init__(self):
+        # Valor numérico de cada entrada y salida (SIN_VALOR en las filas inválidas)
+        self.entradas = array("i")
+        self.salidas = array("i")
+        # Solo las filas inválidas guardan su texto original y su código de error
+        self.invalidos: Dict[int, str] = {}
+        self.errores: Dict[int, int] = {}
+        self.cancelado = False
+
+    def __len__(self) -> int:
+        return len(self.entradas)
+
+    def agregar_bloque(self, bloque: List[str], resultados: List[str], fallidos: List[Tuple[int, int]]):
+        """Agrega un bloque procesado por transformar_en_bloques (índices relativos al bloque)."""
+        desplazamiento = len(self.entradas)
+        for indice, codigo_error in fallidos:
+            self.invalidos[desplazamiento + indice] = bloque[indice]
+            self.errores[desplazamiento + indice] = codigo_error
+        if fallidos:
+            self.entradas.extend(SIN_VALOR if not salida else int(entrada)
+                                 for entrada, salida in zip(bloque, resultados))
+            self.salidas.extend(int(salida) if salida else SIN_VALOR for salida in resultados)
+        else:
+            self.entradas.extend(map(int, bloque))
+            self.salidas.extend(map(int, resultados))
+
+
+class TrabajadorLote(QtCore.QObject):
+    """Procesa un lote de códigos por bloques dentro de un QThread."""
+
+    progreso = QtCore.pyqtSignal(int, int)
+    terminado = QtCore.pyqtSignal(object)
+    error = QtCore.pyqtSignal(str)
+
+    def __init__(self, operacion: str, texto: Optional[str] = None, ruta: Optional[str] = None):
+        """
+        Args:
+            operacion: "cifrar" o "descifrar"
+            texto: Códigos pegados, uno por línea
+            ruta: Archivo con un código por línea (alternativa a texto)
+        """
+        super().__init__()
+        self.operacion = operacion
+        self.texto = texto
+        self.ruta = ruta
+        self._cancelar = threading.Event()
+
+    def cancelar(self):
+        """Solicita detener el procesamiento al terminar el bloque en curso."""
+        self._cancelar.set()
+
+    def ejecutar(self):
+        """
+        Lee la entrada en flujo y la procesa bloque a bloque, emitiendo el progreso.
+
+        Termina siempre emitiendo terminado (con el resultado) o error (con el mensaje).
+        """
+        resultado = ResultadoLote()
+        try:
+            if self.ruta is not None:
+                # El progreso de un archivo se mide en bytes leídos
+                with open(self.ruta, "rb") as archivo:
+                    self._procesar(archivo, os.path.getsize(self.ruta), resultado, en_bytes=True)
+            else:
+                lineas = (self.texto or "").splitlines()
+                self._procesar(lineas, len(lineas), resultado, en_bytes=False)
+        except OSError as error:
+            self.error.emit(f"No se pudo leer el archivo: {error}")
+            return
+        except Exception as error:
+            # Una excepción no puede escapar del slot del QThread: el panel quedaría ocupado
+            self.error.emit(f"Error al procesar el lote: {error}")
+            return
+
+        resultado.cancelado = self._cancelar.is_set()
+        self.terminado.emit(resultado)
+
+    def _procesar(self, lineas: Iterable, total: int, resultado: ResultadoLote, en_bytes: bool):
+        self.progreso.emit(0, total)
+        avance = 0
+        bloque: List[str] = []
+        for linea in lineas:
+            if en_bytes:
+                avance += len(linea)
+                linea = linea.decode("utf-8", "replace")
+            else:
+                avance += 1
+            codigo = linea.strip()
+            if codigo:
+                bloque.append(codigo)
+            if len(bloque) >= TAM_BLOQUE:
+                self._procesar_bloque(bloque, resultado)
+                bloque = []
+                self.progreso.emit(avance, total)
+                if self._cancelar.is_set():
+                    return
+        if bloque:
+            self._procesar_bloque(bloque, resultado)
+        self.progreso.emit(total, total)
+
+    def _procesar_bloque(self, bloque: List[str], resultado: ResultadoLote):
+        for _, resultados, fallidos in transformar_en_bloques(bloque, self.operacion, len(bloque)):
+            resultado.agregar_bloque(bloque, resultados, fallidos)
+
+
+class PanelLote(QtWidgets.QGroupBox):
+    """Panel para procesar códigos pegados o cargados desde un archivo."""
+
+    def __init__(self, operacion: str, titulo: str = "Procesamiento por lotes"):
+        super().__init__(titulo)
+        self.operacion = operacion
+        self.resultado: Optional[ResultadoLote] = None
+        self._hilo: Optional[QtCore.QThread] = None
+        self._trabajador: Optional[TrabajadorLote] = None
+
+        self.entrada = QtWidgets.QPlainTextEdit()
+        self.btn_archivo = QtWidgets.QPushButton("Cargar archivo...")
+        self.btn_procesar = QtWidgets.QPushButton(f"{operacion.capitalize()} lote")
+        self.btn_cancelar = QtWidgets.QPushButton("Cancelar")
+        self.barra_progreso = QtWidgets.QProgressBar()
+        self.resumen = QtWidgets.QLabel()
+        self.modelo = ModeloResultados(self)
+        self.tabla = QtWidgets.QTableView()
+        self.init_ui()
+
+        # No dejar el hilo corriendo si la aplicación se cierra a mitad de un lote
+        aplicacion = QtWidgets.QApplication.instance()
+        if aplicacion is not None:
+            aplicacion.aboutToQuit.connect(self.detener)
+
+    def init_ui(self):
+        """Inicializa la interfaz del panel."""
+        layout = QtWidgets.QVBoxLayout()
+
+        # Campo para pegar varios códigos
+        self.entrada.setPlaceholderText("Pegue un código por línea o cargue un archivo")
+        self.entrada.setMaximumHeight(100)
+        layout.addWidget(self.entrada)
+
+        # Botones de acción
+        botones_layout = QtWidgets.QHBoxLayout()
+        self.btn_archivo.clicked.connect(self.cargar_archivo)
+        botones_layout.addWidget(self.btn_archivo)
+        self.btn_procesar.clicked.connect(lambda: self.procesar())
+        botones_layout.addWidget(self.btn_procesar)
+        self.btn_cancelar.clicked.connect(self.cancelar)
+        self.btn_cancelar.setEnabled(False)
+        botones_layout.addWidget(self.btn_cancelar)
+        layout.addLayout(botones_layout)
+
+        # Progreso y resumen
+        self.barra_progreso.setValue(0)
+        layout.addWidget(self.barra_progreso)
+        self.resumen.setWordWrap(True)
+        layout.addWidget(self.resumen)
+
+        # Tabla de resultados: las celdas se generan solo al hacerse visibles
+        self.tabla.setModel(self.modelo)
+        self.tabla.setMinimumHeight(150)
+        encabezado_vertical = self.tabla.verticalHeader()
+        encabezado_vertical.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        encabezado_vertical.setDefaultSectionSize(22)
+        self.tabla.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.tabla)
+
+        self.setLayout(layout)
+
+    def cargar_archivo(self):
+        """Permite elegir un archivo de códigos y lo procesa."""
+        ruta, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self, "Seleccionar archivo de códigos", "", "Archivos de texto (*.txt);;Todos los archivos (*)",
+        )
+        if ruta:
+            self.procesar(ruta=ruta)
+
+    def procesar(self, ruta: Optional[str] = None):
+        """
+        Inicia el procesamiento en un hilo de fondo.
+
+        Args:
+            ruta: Archivo de códigos; si es None se usa el texto pegado
+        """
+        if self._hilo is not None:
+            return
+
+        texto = None if ruta is not None else self.entrada.toPlainText()
+        self._trabajador = TrabajadorLote(self.operacion, texto=texto, ruta=ruta)
+        self._hilo = QtCore.QThread(self)
+        self._trabajador.moveToThread(self._hilo)
+
+        self._hilo.started.connect(self._trabajador.ejecutar)
+        self._trabajador.progreso.connect(self._al_progresar)
+        self._trabajador.terminado.connect(self._al_terminar)
+        self._trabajador.error.connect(self._al_fallar)
+        self._trabajador.terminado.connect(self._hilo.quit)
+        self._trabajador.error.connect(self._hilo.quit)
+        self._hilo.finished.connect(self._al_finalizar_hilo)
+
+        self.btn_procesar.setEnabled(False)
+        self.btn_archivo.setEnabled(False)
+        self.btn_cancelar.setEnabled(True)
+        self.resumen.setText("Procesando...")
+        self.modelo.limpiar()
+        self._hilo.start()
+
+    def cancelar(self):
+        """Solicita la cancelación del procesamiento en curso."""
+        if self._trabajador is not None:
+            self._trabajador.cancelar()
+            self.btn_cancelar.setEnabled(False)
+
+    def detener(self):
+        """Cancela el procesamiento y espera a que el hilo termine."""
+        if self._hilo is not None:
+            self.cancelar()
+            self._hilo.quit()
+            self._hilo.wait()
+
+    def _al_progresar(self, procesados: int, total: int):
+        self.barra_progreso.setMaximum(max(total, 1))
+        self.barra_progreso.setValue(procesados)
+
+    def _al_terminar(self, resultado: ResultadoLote):
+        self.resultado = resultado
+        self.mostrar_resultado(resultado)
+
+    def _al_fallar(self, mensaje: str):
+        self.resumen.setText(mensaje)
+        QtWidgets.QMessageBox.warning(self, "Error", mensaje)
+
+    def _al_finalizar_hilo(self):
+        self._trabajador.deleteLater()
+        self._hilo.deleteLater()
+        self._trabajador = None
+        self._hilo = None
+        self.btn_procesar.setEnabled(True)
+        self.btn_archivo.setEnabled(True)
+        self.btn_cancelar.setEnabled(False)
+
+    def mostrar_resultado(self, resultado: ResultadoLote):
+        """Carga los resultados en la tabla y muestra un resumen de las filas con error."""
+        self.modelo.cargar(resultado.entradas, resultado.salidas, resultado.invalidos, resultado.errores)
+
+        num_errores = len(resultado.errores)
+        resumen = f"{len(resultado) - num_errores} procesados, {num_errores} con error"
+        if resultado.cancelado:
+            resumen = f"Cancelado: {resumen} de las primeras {len(resultado)} filas"
+        for indice in sorted(resultado.errores)[:MAX_FALLIDOS_MOSTRADOS]:
+            mensaje = MENSAJES_ERROR[resultado.errores[indice]]
+            resumen += f"\nFila {indice + 1} ({resultado.invalidos[indice]!r}): {mensaje}"
+        if num_errores > MAX_FALLIDOS_MOSTRADOS:
+            resumen += f"\n... y {num_errores - MAX_FALLIDOS_MOSTRADOS} filas más con error"
+        self.resumen.setText(resumen)
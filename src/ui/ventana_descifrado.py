@@ -5,6 +5,7 @@ Módulo de la ventana de descifrado.
 from PyQt6 import QtWidgets, QtCore, QtGui
 from src.logic.cipher import CipherLogic
 from src.utils.validators import Validator
+from src.ui.panel_lote import PanelLote
 
 
 class VentanaDescifrado(QtWidgets.QWidget):
@@ -19,6 +20,7 @@ class VentanaDescifrado(QtWidgets.QWidget):
         self.resultado_label = QtWidgets.QLabel("Número original:")
         self.resultado = QtWidgets.QLineEdit()
         self.btn_copiar = QtWidgets.QPushButton("Copiar resultado")
+        self.panel_lote = PanelLote("descifrar", "Descifrado por lotes")
         self.init_ui()
 
     def init_ui(self):
@@ -67,6 +69,9 @@ class VentanaDescifrado(QtWidgets.QWidget):
         self.btn_copiar.setEnabled(False)  # Deshabilitado hasta que haya resultado
         layout.addWidget(self.btn_copiar)
 
+        # Panel para descifrar muchos códigos en segundo plano
+        layout.addWidget(self.panel_lote)
+
         layout.addSpacing(20)
 
         # Botón de retorno
@@ -0,0 +1,377 @@
+"""
+Módulo de métricas de uso.
+Cuenta llamadas y errores y mide latencias de las operaciones de cifrado y
+validación, con exportación en formato de texto de Prometheus o JSON.
+
+La instrumentación se activa envolviendo los métodos estáticos de
+CipherLogic y Validator; mientras está desactivada los métodos originales
+quedan intactos y no hay ningún costo adicional. Las operaciones por lotes
+(búferes, arreglos y datos empaquetados) cuentan además los elementos que
+procesa cada llamada.
+"""
+
+import functools
+import json
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.logic.cipher import NUM_DIGITOS, CipherLogic
+from src.utils.validators import ERROR_LONGITUD, ERROR_NO_DIGITO, ERROR_VACIO, Validator
+
+# Bits de mantisa de cada cubeta del histograma: 2**(BITS_MANTISA - 1)
+# subcubetas por potencia de dos, con un error relativo máximo de 1/16
+BITS_MANTISA = 5
+_SUBCUBETAS = 1 << (BITS_MANTISA - 1)
+_NUM_CUBETAS = (64 - BITS_MANTISA) * _SUBCUBETAS + (1 << BITS_MANTISA)
+
+# Percentiles que se exportan
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+# Nombre de cada clase de error del validador
+CLASES_ERROR = {
+    ERROR_VACIO: "vacio",
+    ERROR_LONGITUD: "longitud",
+    ERROR_NO_DIGITO: "no_digito",
+}
+
+
+def _contar_buffer(resultado, args, kwargs) -> int:
+    """Registros de un búfer de ancho fijo (cifrar_buffer/descifrar_buffer)."""
+    separador = args[1] if len(args) > 1 else kwargs.get("separador", b"\n")
+    return len(resultado) // (NUM_DIGITOS + len(separador))
+
+
+def _contar_filas(resultado, args, kwargs) -> int:
+    """Elementos de una columna de enteros o filas de una matriz de dígitos."""
+    return len(resultado)
+
+
+def _contar_empaquetado(resultado, args, kwargs) -> int:
+    """Códigos de un bloque empaquetado en "bcd" o "bits20"."""
+    from src.logic.empaquetado import contar_codigos
+    return contar_codigos(resultado, args[1] if len(args) > 1 else kwargs["formato"])
+
+
+# Métodos que se instrumentan: (clase, método, operación, contar)
+# Los métodos por lotes registran además los elementos procesados en cada llamada
+METODOS_INSTRUMENTADOS = (
+    (CipherLogic, "cifrar", "cifrar", None),
+    (CipherLogic, "descifrar", "descifrar", None),
+    (Validator, "validar_numero_6_digitos", "validar", None),
+    (CipherLogic, "cifrar_buffer", "cifrar_buffer", _contar_buffer),
+    (CipherLogic, "descifrar_buffer", "descifrar_buffer", _contar_buffer),
+    (CipherLogic, "cifrar_lote", "cifrar_lote", _contar_filas),
+    (CipherLogic, "descifrar_lote", "descifrar_lote", _contar_filas),
+    (CipherLogic, "cifrar_enteros", "cifrar_enteros", _contar_filas),
+    (CipherLogic, "descifrar_enteros", "descifrar_enteros", _contar_filas),
+    (CipherLogic, "cifrar_empaquetado", "cifrar_empaquetado", _contar_empaquetado),
+    (CipherLogic, "descifrar_empaquetado", "descifrar_empaquetado", _contar_empaquetado),
+)
+
+
+class Histograma:
+    """
+    Histograma log-lineal de latencias en nanosegundos (al estilo HDR).
+
+    Los valores menores que 2**BITS_MANTISA se cuentan exactos; el resto se
+    agrupa en cubetas cuyo ancho crece con la magnitud del valor.
+    """
+
+    def __init__(self):
+        self.cuentas = [0] * _NUM_CUBETAS
+        self.total = 0
+        self.suma = 0
+        self.maximo = 0
+
+    @staticmethod
+    def _limite_superior(indice: int) -> int:
+        """Mayor valor que cae en la cubeta indicada."""
+        if indice < (1 << BITS_MANTISA):
+            return indice
+        exponente = indice // _SUBCUBETAS - 1
+        mantisa = indice - exponente * _SUBCUBETAS
+        return ((mantisa + 1) << exponente) - 1
+
+    def registrar(self, valor: int):
+        """Agrega un valor (en nanosegundos, no negativo)."""
+        exponente = valor.bit_length() - BITS_MANTISA
+        self.cuentas[valor if exponente <= 0 else exponente * _SUBCUBETAS + (valor >> exponente)] += 1
+        self.total += 1
+        self.suma += valor
+        if valor > self.maximo:
+            self.maximo = valor
+
+    def combinar(self, otro: "Histograma"):
+        """Suma a este histograma los valores de otro."""
+        self.cuentas = [propia + ajena for propia, ajena in zip(self.cuentas, otro.cuentas)]
+        self.total += otro.total
+        self.suma += otro.suma
+        self.maximo = max(self.maximo, otro.maximo)
+
+    def percentil(self, porcentaje: float) -> int:
+        """
+        Calcula un percentil del histograma.
+
+        Args:
+            porcentaje: Percentil entre 0 y 100
+
+        Returns:
+            Valor en nanosegundos (0 si el histograma está vacío)
+        """
+        if not self.total:
+            return 0
+        objetivo = max(1, -(-self.total * porcentaje // 100))
+        acumulado = 0
+        for indice, cuenta in enumerate(self.cuentas):
+            acumulado += cuenta
+            if acumulado >= objetivo:
+                return min(self._limite_superior(indice), self.maximo)
+        return self.maximo
+
+
+class RegistroMetricas:
+    """
+    Contadores, errores por clase e histogramas de latencia por operación.
+
+    Cada hilo escribe en sus propios histogramas, de modo que registrar una
+    llamada no requiere candados; las lecturas combinan los de todos los hilos.
+    """
+
+    def __init__(self):
+        self._candado = threading.Lock()
+        self._locales = threading.local()
+        self._histogramas: Dict[str, List[Histograma]] = defaultdict(list)
+        self._elementos: Dict[str, int] = defaultdict(int)
+        self.errores: Dict[Tuple[str, str], int] = defaultdict(int)
+
+    def histograma(self, operacion: str) -> Histograma:
+        """Histograma de una operación para el hilo actual (se crea al primer uso)."""
+        propios = getattr(self._locales, "histogramas", None)
+        if propios is None:
+            propios = self._locales.histogramas = {}
+        histograma = propios.get(operacion)
+        if histograma is None:
+            histograma = propios[operacion] = Histograma()
+            with self._candado:
+                self._histogramas[operacion].append(histograma)
+        return histograma
+
+    def registrar(self, operacion: str, duracion_ns: int, clase_error: Optional[str] = None):
+        """
+        Registra una llamada.
+
+        Args:
+            operacion: Nombre de la operación ("cifrar", "descifrar", "validar")
+            duracion_ns: Duración de la llamada en nanosegundos
+            clase_error: Clase de error de la llamada, o None si tuvo éxito
+        """
+        self.histograma(operacion).registrar(duracion_ns)
+        if clase_error is not None:
+            self.registrar_error(operacion, clase_error)
+
+    def registrar_error(self, operacion: str, clase_error: str):
+        """Cuenta un error de una llamada ya registrada."""
+        with self._candado:
+            self.errores[(operacion, clase_error)] += 1
+
+    def registrar_elementos(self, operacion: str, cantidad: int):
+        """Suma los elementos procesados por una llamada por lotes."""
+        with self._candado:
+            self._elementos[operacion] += cantidad
+
+    @property
+    def latencias(self) -> Dict[str, Histograma]:
+        """Histograma combinado de todos los hilos, por operación."""
+        with self._candado:
+            grupos = {operacion: list(histogramas) for operacion, histogramas in self._histogramas.items()}
+        combinados = {}
+        for operacion, histogramas in sorted(grupos.items()):
+            combinado = Histograma()
+            for histograma in histogramas:
+                combinado.combinar(histograma)
+            if combinado.total:
+                combinados[operacion] = combinado
+        return combinados
+
+    @property
+    def llamadas(self) -> Dict[str, int]:
+        """Número de llamadas por operación."""
+        return {operacion: histograma.total for operacion, histograma in self.latencias.items()}
+
+    @property
+    def elementos(self) -> Dict[str, int]:
+        """Elementos procesados por operación (en las operaciones escalares, uno por llamada)."""
+        llamadas = self.llamadas
+        with self._candado:
+            return {operacion: self._elementos.get(operacion, total) for operacion, total in llamadas.items()}
+
+    def total_llamadas(self) -> int:
+        """Número total de llamadas registradas en todas las operaciones."""
+        with self._candado:
+            return sum(histograma.total for histogramas in self._histogramas.values() for histograma in histogramas)
+
+    def reiniciar(self):
+        """Descarta todas las métricas registradas."""
+        with self._candado:
+            for histogramas in self._histogramas.values():
+                for histograma in histogramas:
+                    histograma.__init__()
+            self._elementos.clear()
+            self.errores.clear()
+
+    def instantanea(self) -> dict:
+        """
+        Devuelve una copia de las métricas como diccionario serializable.
+
+        Las latencias se expresan en segundos.
+        """
+        latencias = self.latencias
+        with self._candado:
+            errores = dict(self.errores)
+            elementos = dict(self._elementos)
+        operaciones = {}
+        for operacion, histograma in latencias.items():
+            operaciones[operacion] = {
+                "llamadas": histograma.total,
+                "elementos": elementos.get(operacion, histograma.total),
+                "errores": {clase: cuenta for (nombre, clase), cuenta in sorted(errores.items())
+                            if nombre == operacion},
+                "latencia": {
+                    "suma": histograma.suma / 1e9,
+                    "maximo": histograma.maximo / 1e9,
+                    "percentiles": {f"p{porcentaje:g}": histograma.percentil(porcentaje) / 1e9
+                                    for porcentaje in PERCENTILES},
+                },
+            }
+        return operaciones
+
+    def a_json(self) -> str:
+        """Exporta las métricas como texto JSON."""
+        return json.dumps(self.instantanea(), ensure_ascii=False, indent=2)
+
+    def a_prometheus(self, prefijo: str = "cifrado") -> str:
+        """
+        Exporta las métricas en el formato de texto de Prometheus.
+
+        Las latencias se exportan como un summary con los percentiles de
+        PERCENTILES.
+        """
+        datos = self.instantanea()
+        lineas = [
+            f"# HELP {prefijo}_llamadas_total Llamadas por operación",
+            f"# TYPE {prefijo}_llamadas_total counter",
+        ]
+        lineas += [f'{prefijo}_llamadas_total{{operacion="{operacion}"}} {valores["llamadas"]}'
+                   for operacion, valores in datos.items()]
+
+        lineas += [
+            f"# HELP {prefijo}_elementos_total Elementos procesados por operación",
+            f"# TYPE {prefijo}_elementos_total counter",
+        ]
+        lineas += [f'{prefijo}_elementos_total{{operacion="{operacion}"}} {valores["elementos"]}'
+                   for operacion, valores in datos.items()]
+
+        lineas += [
+            f"# HELP {prefijo}_errores_total Llamadas fallidas por operación y clase de error",
+            f"# TYPE {prefijo}_errores_total counter",
+        ]
+        for operacion, valores in datos.items():
+            lineas += [f'{prefijo}_errores_total{{operacion="{operacion}",clase="{clase}"}} {cuenta}'
+                       for clase, cuenta in valores["errores"].items()]
+
+        lineas += [
+            f"# HELP {prefijo}_latencia_segundos Latencia por operación",
+            f"# TYPE {prefijo}_latencia_segundos summary",
+        ]
+        for operacion, valores in datos.items():
+            latencia = valores["latencia"]
+            for porcentaje in PERCENTILES:
+                cuantil = porcentaje / 100
+                lineas.append(f'{prefijo}_latencia_segundos{{operacion="{operacion}",quantile="{cuantil:g}"}} '
+                              f'{latencia["percentiles"][f"p{porcentaje:g}"]:.9f}')
+            lineas.append(f'{prefijo}_latencia_segundos_sum{{operacion="{operacion}"}} {latencia["suma"]:.9f}')
+            lineas.append(f'{prefijo}_latencia_segundos_count{{operacion="{operacion}"}} {valores["llamadas"]}')
+        return "\n".join(lineas) + "\n"
+
+
+def _clasificar_validacion(resultado, args) -> Optional[str]:
+    """Clase de error de una llamada a validar_numero_6_digitos."""
+    if resultado[0]:
+        return None
+    return CLASES_ERROR.get(Validator.clasificar(args[0]), "invalido") if args else "invalido"
+
+
+def _instrumentar(funcion: Callable, operacion: str, registro: RegistroMetricas,
+                  clasificar: Optional[Callable] = None, contar: Optional[Callable] = None) -> Callable:
+    """Envuelve una función para registrar su latencia, sus errores y, si es por lotes, sus elementos."""
+    reloj = time.perf_counter_ns
+    locales = threading.local()
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        inicio = reloj()
+        try:
+            resultado = funcion(*args, **kwargs)
+        except Exception as error:
+            registro.registrar(operacion, reloj() - inicio, type(error).__name__)
+            raise
+        duracion = reloj() - inicio
+        try:
+            histograma = locales.histograma
+        except AttributeError:
+            histograma = locales.histograma = registro.histograma(operacion)
+        histograma.registrar(duracion)
+        if clasificar is not None:
+            clase_error = clasificar(resultado, args)
+            if clase_error is not None:
+                registro.registrar_error(operacion, clase_error)
+        if contar is not None:
+            registro.registrar_elementos(operacion, contar(resultado, args, kwargs))
+        return resultado
+
+    return envoltura
+
+
+# Métodos originales reemplazados mientras la instrumentación está activa
+_originales: Dict[Tuple[type, str], Callable] = {}
+_registro_activo: Optional[RegistroMetricas] = None
+
+
+def activar(registro: Optional[RegistroMetricas] = None) -> RegistroMetricas:
+    """
+    Activa la instrumentación de CipherLogic y Validator.
+
+    Args:
+        registro: Registro donde acumular las métricas (None = uno nuevo)
+
+    Returns:
+        Registro en uso (si ya estaba activa, el registro existente)
+    """
+    global _registro_activo
+    if _registro_activo is not None:
+        return _registro_activo
+
+    _registro_activo = registro if registro is not None else RegistroMetricas()
+    for clase, nombre, operacion, contar in METODOS_INSTRUMENTADOS:
+        original = clase.__dict__[nombre]
+        _originales[(clase, nombre)] = original
+        clasificar = _clasificar_validacion if clase is Validator else None
+        envoltura = _instrumentar(original.__func__, operacion, _registro_activo, clasificar, contar)
+        setattr(clase, nombre, staticmethod(envoltura))
+    return _registro_activo
+
+
+def desactivar():
+    """Restaura los métodos originales; las métricas ya registradas se conservan."""
+    global _registro_activo
+    for (clase, nombre), original in _originales.items():
+        setattr(clase, nombre, original)
+    _originales.clear()
+    _registro_activo = None
+
+
+def registro_activo() -> Optional[RegistroMetricas]:
+    """Registro en uso, o None si la instrumentación está desactivada."""
+    return _registro_activo
@@ -3,7 +3,20 @@ Módulo de validación de datos.
 Contiene funciones para validar entradas del usuario.
 """
 
-from typing import Tuple
+from array import array
+from typing import Iterable, List, Tuple
+
+# Códigos de error de la validación (0 = válido)
+VALIDO = 0
+ERROR_VACIO = 1
+ERROR_LONGITUD = 2
+ERROR_NO_DIGITO = 3
+
+MENSAJES_ERROR = {
+    ERROR_VACIO: "Por favor ingrese un número",
+    ERROR_LONGITUD: "El número debe tener exactamente 6 dígitos",
+    ERROR_NO_DIGITO: "Solo se aceptan dígitos numéricos",
+}
 
 
 class Validator:
@@ -22,16 +35,104 @@ class Validator:
             - es_valido: True si la validación pasa, False en caso contrario
             - mensaje_error: Mensaje descriptivo del error (vacío si es válido)
         """
+        return Validator.validar_numero_digitos(numero_str, 6)
+
+    @staticmethod
+    def validar_numero_digitos(numero_str: str, num_digitos: int) -> Tuple[bool, str]:
+        """
+        Valida que la entrada sea un número de exactamente num_digitos dígitos.
+
+        Args:
+            numero_str: Cadena a validar
+            num_digitos: Número de dígitos esperado
+
+        Returns:
+            Tupla (es_valido, mensaje_error), igual que validar_numero_6_digitos
+        """
+        codigo_error = Validator.clasificar(numero_str, num_digitos)
+        if codigo_error != VALIDO:
+            return False, Validator.mensaje_error(codigo_error, num_digitos)
+
+        return True, ""
+
+    @staticmethod
+    def clasificar(numero_str, num_digitos: int = 6) -> int:
+        """
+        Clasifica una entrada según el primer error que presenta.
+
+        Args:
+            numero_str: Cadena (o bytes) a validar
+            num_digitos: Número de dígitos esperado
+
+        Returns:
+            VALIDO, ERROR_VACIO, ERROR_LONGITUD o ERROR_NO_DIGITO
+        """
         # Validar que no esté vacío
         if not numero_str:
-            return False, "Por favor ingrese un número"
+            return ERROR_VACIO
 
         # Validar longitud
-        if len(numero_str) != 6:
-            return False, "El número debe tener exactamente 6 dígitos"
+        if len(numero_str) != num_digitos:
+            return ERROR_LONGITUD
 
-        # Validar que sean solo dígitos
-        if not numero_str.isdigit():
-            return False, "Solo se aceptan dígitos numéricos"
+        # Validar que sean solo dígitos ASCII (isdigit acepta también "¹²³" o "٣")
+        if not (numero_str.isascii() and numero_str.isdigit()):
+            return ERROR_NO_DIGITO
 
-        return True, ""
+        return VALIDO
+
+    @staticmethod
+    def validar_lote(codigos, num_digitos: int = 6) -> Tuple[array, array]:
+        """
+        Valida un lote de códigos sin construir mensajes por elemento.
+
+        Args:
+            codigos: Secuencia de cadenas o bytes, o un búfer de bytes con un
+                código por línea
+            num_digitos: Número de dígitos esperado
+
+        Returns:
+            Tupla (indices_fallidos, codigos_error)
+            - indices_fallidos: array('Q') con la posición de cada código inválido
+            - codigos_error: array('B') con el código de error de cada posición
+        """
+        if isinstance(codigos, (bytes, bytearray, memoryview)):
+            codigos = bytes(codigos).splitlines()
+
+        indices_fallidos = array("Q")
+        codigos_error = array("B")
+        clasificar = Validator.clasificar
+        for indice, codigo in enumerate(codigos):
+            # Ruta rápida para el caso común (código válido)
+            if len(codigo) == num_digitos and codigo.isascii() and codigo.isdigit():
+                continue
+            indices_fallidos.append(indice)
+            codigos_error.append(clasificar(codigo, num_digitos))
+        return indices_fallidos, codigos_error
+
+    @staticmethod
+    def mensaje_error(codigo_error: int, num_digitos: int = 6) -> str:
+        """
+        Devuelve el mensaje legible de un código de error.
+
+        Args:
+            codigo_error: Código devuelto por clasificar o validar_lote
+            num_digitos: Número de dígitos esperado (para el mensaje de longitud)
+        """
+        if codigo_error == ERROR_LONGITUD:
+            return f"El número debe tener exactamente {num_digitos} dígitos"
+        return MENSAJES_ERROR[codigo_error]
+
+    @staticmethod
+    def mensajes_error(codigos_error: Iterable[int], num_digitos: int = 6) -> List[str]:
+        """
+        Traduce códigos de error a mensajes legibles, solo para las filas que fallaron.
+
+        Args:
+            codigos_error: Códigos devueltos por validar_lote
+            num_digitos: Número de dígitos esperado (para el mensaje de longitud)
+
+        Returns:
+            Lista de mensajes en el mismo orden
+        """
+        return [Validator.mensaje_error(codigo, num_digitos) for codigo in codigos_error]
@@ -2,9 +2,20 @@
 Configuración de pytest para los tests del proyecto.
 """
 
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 # Agregar el directorio raíz al path de Python para permitir imports
 root_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(root_dir))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Fixture con la QApplication compartida, sin pantalla (plataforma offscreen)."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -0,0 +1,60 @@
+"""
+Tests unitarios para la ventana principal y su navegación diferida.
+"""
+
+import ast
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from src.ui.app_window import AplicacionCifrado  # noqa: E402
+
+
+class TestAplicacionCifrado:
+    """Clase de tests para la construcción diferida de ventanas y el primer pintado."""
+
+    def test_ventana_diferida(self, qapp, monkeypatch):
+        """Test que verifica que la ventana de cifrado se importa al navegar y se reutiliza."""
+        monkeypatch.delitem(sys.modules, "src.ui.ventana_cifrado", raising=False)
+        ventana = AplicacionCifrado()
+        assert "src.ui.ventana_cifrado" not in sys.modules
+        assert ventana.stack.count() == 1
+
+        ventana.cambiar_ventana("cifrado")
+        assert "src.ui.ventana_cifrado" in sys.modules
+        cifrado = ventana.stack.currentWidget()
+        assert cifrado is ventana.obtener_ventana("cifrado")
+
+        ventana.cambiar_ventana("principal")
+        ventana.cambiar_ventana("cifrado")
+        assert ventana.stack.currentWidget() is cifrado
+        assert ventana.stack.count() == 2
+        with pytest.raises(KeyError):
+            ventana.obtener_ventana("inexistente")
+
+    def test_primer_pintado_una_vez(self, qapp):
+        """Test que verifica que al_primer_pintado se llama una sola vez."""
+        tiempos = []
+        ventana = AplicacionCifrado(inicio=time.perf_counter(), al_primer_pintado=tiempos.append)
+        ventana.show()
+        try:
+            for _ in range(3):
+                ventana.repaint()
+                qapp.processEvents()
+        finally:
+            ventana.close()
+
+        assert len(tiempos) == 1
+        assert tiempos[0] == ventana.tiempo_primer_pintado > 0
+
+    def test_inicio_antes_de_importar_pyqt(self):
+        """Test que verifica que main.py toma el instante de arranque antes de importar PyQt6."""
+        modulo = ast.parse((Path(__file__).parent.parent / "main.py").read_text(encoding="utf-8"))
+        orden = [nodo.lineno for nodo in modulo.body
+                 if isinstance(nodo, ast.Assign) and nodo.targets[0].id == "INICIO"
+                 or isinstance(nodo, ast.ImportFrom) and nodo.module == "PyQt6"]
+        assert len(orden) == 2 and orden[0] < orden[1]
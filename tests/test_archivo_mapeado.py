@@ -0,0 +1,118 @@
+"""
+Tests unitarios para el cifrado en sitio de archivos de ancho fijo.
+"""
+
+import mmap
+import os
+
+import pytest
+from src.cli import main
+from src.logic.archivo_mapeado import SUFIJO_DIARIO, SUFIJO_PROGRESO, transformar_en_sitio
+from src.logic.cipher import CipherLogic, PLAN_POR_DEFECTO
+
+
+class Interrupcion(Exception):
+    """Excepción usada para simular una interrupción a mitad del proceso."""
+
+
+@pytest.fixture
+def archivo_registros(tmp_path):
+    """Fixture que crea un archivo de registros que ocupa varias páginas."""
+    # Suficientes registros para que haya al menos tres bloques de una página
+    num_registros = 3 * mmap.PAGESIZE + 11
+    datos = b"".join(b"%06d\n" % ((valor * 7919) % 1_000_000) for valor in range(num_registros))
+    ruta = tmp_path / "registros.txt"
+    ruta.write_bytes(datos)
+    return ruta
+
+
+class TestArchivoMapeado:
+    """Clase de tests para transformar_en_sitio."""
+
+    def test_cifrar_y_descifrar_en_sitio(self, archivo_registros):
+        """Test que verifica el resultado en sitio y la ausencia de archivos auxiliares."""
+        original = archivo_registros.read_bytes()
+        num_registros = transformar_en_sitio(str(archivo_registros), "cifrar", tam_bloque=1)
+
+        assert num_registros == len(original) // 7
+        assert archivo_registros.read_bytes() == bytes(PLAN_POR_DEFECTO.cifrar_buffer(original))
+        assert archivo_registros.read_bytes()[:7] == CipherLogic.cifrar(original[:6].decode()).encode() + b"\n"
+        assert not os.path.exists(str(archivo_registros) + SUFIJO_PROGRESO)
+        assert not os.path.exists(str(archivo_registros) + SUFIJO_DIARIO)
+
+        transformar_en_sitio(str(archivo_registros), "descifrar")
+        assert archivo_registros.read_bytes() == original
+
+    def test_archivo_no_alineado(self, archivo_registros):
+        """Test que verifica el rechazo de archivos con registros incompletos sin modificarlos."""
+        with open(archivo_registros, "ab") as archivo:
+            archivo.write(b"123")
+        original = archivo_registros.read_bytes()
+        with pytest.raises(ValueError, match="alineado"):
+            transformar_en_sitio(str(archivo_registros), "cifrar")
+        assert archivo_registros.read_bytes() == original
+
+    def test_registro_invalido_no_modifica(self, archivo_registros):
+        """Test que verifica que un registro inválido se detecta antes de escribir."""
+        datos = bytearray(archivo_registros.read_bytes())
+        datos[-5] = ord("x")
+        archivo_registros.write_bytes(datos)
+        with pytest.raises(ValueError, match="inválido"):
+            transformar_en_sitio(str(archivo_registros), "cifrar", tam_bloque=1)
+        assert archivo_registros.read_bytes() == datos
+
+    def test_reanudar_tras_interrupcion(self, archivo_registros):
+        """Test que verifica que una ejecución interrumpida continúa desde el punto de control."""
+        original = archivo_registros.read_bytes()
+
+        def interrumpir(procesados, total):
+            if procesados > 0:
+                raise Interrupcion()
+
+        with pytest.raises(Interrupcion):
+            transformar_en_sitio(str(archivo_registros), "cifrar", tam_bloque=1, al_avanzar=interrumpir)
+        assert os.path.exists(str(archivo_registros) + SUFIJO_PROGRESO)
+
+        # Otra operación no puede usar el punto de control pendiente
+        with pytest.raises(ValueError, match="punto de control"):
+            transformar_en_sitio(str(archivo_registros), "descifrar")
+
+        transformar_en_sitio(str(archivo_registros), "cifrar", tam_bloque=1)
+        assert archivo_registros.read_bytes() == bytes(PLAN_POR_DEFECTO.cifrar_buffer(original))
+
+    def test_restaura_bloque_a_medias(self, archivo_registros):
+        """Test que verifica que el diario deshace un bloque reescrito a medias."""
+        original = archivo_registros.read_bytes()
+        ancho_bloque = mmap.PAGESIZE * 7
+
+        def interrumpir(procesados, total):
+            if procesados > 0:
+                raise Interrupcion()
+
+        with pytest.raises(Interrupcion):
+            transformar_en_sitio(str(archivo_registros), "cifrar", tam_bloque=1, al_avanzar=interrumpir)
+
+        # Simular una caída a mitad del segundo bloque: el diario tiene la copia
+        # original y el archivo quedó con parte del bloque ya cifrado
+        segundo = original[ancho_bloque:2 * ancho_bloque]
+        (archivo_registros.parent / (archivo_registros.name + SUFIJO_DIARIO)).write_bytes(
+            ancho_bloque.to_bytes(8, "little") + segundo
+        )
+        mitad = bytes(PLAN_POR_DEFECTO.cifrar_buffer(segundo[:7 * 100]))
+        with open(archivo_registros, "r+b") as archivo:
+            archivo.seek(ancho_bloque)
+            archivo.write(mitad)
+
+        transformar_en_sitio(str(archivo_registros), "cifrar", tam_bloque=1)
+        assert archivo_registros.read_bytes() == bytes(PLAN_POR_DEFECTO.cifrar_buffer(original))
+
+    def test_cli_en_sitio(self, archivo_registros, capsys):
+        """Test que verifica la opción --en-sitio de la consola."""
+        original = archivo_registros.read_bytes()
+        assert main(["cifrar", "-i", str(archivo_registros), "--en-sitio"]) == 0
+        assert main(["descifrar", "-i", str(archivo_registros), "--en-sitio"]) == 0
+        assert archivo_registros.read_bytes() == original
+
+        with pytest.raises(SystemExit):
+            main(["cifrar", "--en-sitio"])
+        capsys.readouterr()
@@ -0,0 +1,42 @@
+"""
+Tests unitarios para el banco de pruebas de rendimiento.
+"""
+
+import pytest
+from benchmarks.bench import comparar_con_base, ejecutar_casos, pico_rss_mb
+
+
+class TestBenchmarks:
+    """Clase de tests para la medición y la comparación con la línea base."""
+
+    def test_ejecutar_casos_pequenos(self):
+        """Test que ejecuta casos pequeños y verifica las métricas reportadas."""
+        resultados = ejecutar_casos([100], ["cifrar_escalar", "cifrar_buffer"], repeticiones=1)
+        assert set(resultados) == {"cifrar_escalar@100", "cifrar_buffer@100"}
+        for resultado in resultados.values():
+            assert resultado["operaciones"] == 100
+            assert resultado["ops_por_segundo"] > 0
+            assert resultado["ns_por_op"] > 0
+
+    def test_pico_rss_por_caso(self):
+        """Test que verifica que el pico de RSS de un caso aislado no incluye la memoria de este proceso."""
+        if pico_rss_mb() is None:
+            pytest.skip("resource no disponible")
+        lastre = b"x" * (200 << 20)
+        resultados = ejecutar_casos([100], ["cifrar_escalar"], repeticiones=1)
+        assert resultados["cifrar_escalar@100"]["pico_rss_mb"] < pico_rss_mb() - 100
+        resultados = ejecutar_casos([100], ["cifrar_escalar"], repeticiones=1, aislar=False)
+        assert resultados["cifrar_escalar@100"]["pico_rss_mb"] >= len(lastre) / (1 << 20)
+
+    def test_comparar_detecta_regresion(self):
+        """Test que verifica la detección de regresiones por encima del umbral."""
+        base = {"a@1": {"ops_por_segundo": 1000.0}, "b@1": {"ops_por_segundo": 1000.0}}
+        actuales = {
+            "a@1": {"ops_por_segundo": 950.0},
+            "b@1": {"ops_por_segundo": 800.0},
+            "c@1": {"ops_por_segundo": 1.0},
+        }
+        regresiones = comparar_con_base(actuales, base, umbral=0.10)
+        assert len(regresiones) == 1
+        assert regresiones[0].startswith("b@1")
+        assert comparar_con_base(actuales, base, umbral=0.25) == []
@@ -227,3 +227,131 @@ class TestCipherLogic:
             cifrado = cipher.cifrar(numero)
             descifrado = cipher.descifrar(cifrado)
             assert descifrado == numero, f"Simetría falló para {numero}"
+
+
+class TestCipherLote:
+    """Tests de la API vectorizada cifrar_lote / descifrar_lote."""
+
+    @pytest.fixture
+    def np(self):
+        """Fixture que provee NumPy (omite los tests si no está instalado)."""
+        return pytest.importorskip("numpy")
+
+    def test_lote_enteros_coincide_con_escalar(self, np):
+        """Test que verifica que el lote de enteros coincide con la ruta escalar."""
+        numeros = np.array([123456, 0, 999999, 12345, 543210, 7], dtype=np.int64)
+        cifrados = CipherLogic.cifrar_lote(numeros)
+        for original, cifrado in zip(numeros, cifrados):
+            assert f"{cifrado:06d}" == CipherLogic.cifrar(f"{original:06d}")
+        assert cifrados.dtype == numeros.dtype
+
+    def test_lote_matriz_digitos(self, np):
+        """Test con una matriz (N, 6) de dígitos uint8."""
+        matriz = np.array([[1, 2, 3, 4, 5, 6], [0, 0, 0, 0, 0, 0]], dtype=np.uint8)
+        cifrada = CipherLogic.cifrar_lote(matriz)
+        assert cifrada.shape == (2, 6)
+        assert cifrada.dtype == np.uint8
+        assert "".join(map(str, cifrada[0])) == "018932"
+        assert "".join(map(str, cifrada[1])) == "777777"
+
+    def test_lote_simetria(self, np):
+        """Test que verifica que descifrar_lote invierte cifrar_lote."""
+        numeros = np.arange(0, 1_000_000, 997, dtype=np.uint32)
+        assert np.array_equal(CipherLogic.descifrar_lote(CipherLogic.cifrar_lote(numeros)), numeros)
+
+    def test_lote_fuera_de_rango(self, np):
+        """Test que verifica el rechazo de valores fuera de rango."""
+        with pytest.raises(ValueError):
+            CipherLogic.cifrar_lote(np.array([1_000_000]))
+        with pytest.raises(ValueError):
+            CipherLogic.cifrar_lote(np.zeros((3, 5), dtype=np.uint8))
+        with pytest.raises(ValueError, match="entre 0 y 9"):
+            CipherLogic.cifrar_lote(np.array([[1, 2, 3, 4, 5, 12]], dtype=np.uint8))
+        with pytest.raises(ValueError, match="entre 0 y 9"):
+            CipherLogic.descifrar_lote(np.array([[1, 2, 3, 4, 5, -1]], dtype=np.int8))
+
+    def test_lote_tipo_estrecho(self, np):
+        """Test que verifica el rechazo de tipos que no admiten el resultado en lugar de desbordarlo."""
+        for tipo in (np.uint16, np.int16, np.uint8):
+            with pytest.raises(TypeError, match="no admite"):
+                CipherLogic.cifrar_lote(np.array([123, 65], dtype=tipo))
+        assert CipherLogic.cifrar_lote(np.array([123, 65535], dtype=np.uint32)).tolist() == [787709, 227320]
+
+
+class TestCipherBuffer:
+    """Tests de la ruta sobre búferes cifrar_buffer / descifrar_buffer."""
+
+    NUMEROS = ["123456", "000000", "999999", "000123", "543210", "987654"]
+
+    def test_buffer_coincide_con_escalar(self):
+        """Test que verifica que el búfer coincide con la ruta escalar."""
+        datos = "".join(f"{n}\n" for n in self.NUMEROS).encode()
+        cifrado = CipherLogic.cifrar_buffer(datos)
+        assert cifrado.decode().splitlines() == [CipherLogic.cifrar(n) for n in self.NUMEROS]
+
+    def test_buffer_simetria_memoryview(self):
+        """Test de ida y vuelta con memoryview y registros contiguos."""
+        datos = bytearray("".join(self.NUMEROS).encode())
+        cifrado = CipherLogic.cifrar_buffer(memoryview(datos), separador=b"")
+        assert len(cifrado) == len(datos)
+        assert CipherLogic.descifrar_buffer(cifrado, separador=b"") == datos
+
+    def test_buffer_separador_crlf(self):
+        """Test con registros terminados en CRLF."""
+        cifrado = CipherLogic.cifrar_buffer(b"123456\r\n999999\r\n", separador=b"\r\n")
+        assert cifrado == b"018932\r\n666666\r\n"
+
+    def test_buffer_vacio(self):
+        """Test con un búfer vacío."""
+        assert CipherLogic.cifrar_buffer(b"") == bytearray()
+
+    def test_buffer_registro_incompleto(self):
+        """Test que verifica el rechazo de registros incompletos."""
+        with pytest.raises(ValueError):
+            CipherLogic.cifrar_buffer(b"123456\n12345\n")
+
+    def test_buffer_registro_invalido(self):
+        """Test que verifica que se indica el registro inválido."""
+        with pytest.raises(ValueError, match="Registro 1"):
+            CipherLogic.cifrar_buffer(b"123456\n12a456\n")
+        with pytest.raises(ValueError, match="Registro 0"):
+            CipherLogic.descifrar_buffer(b"1234567123456\n")
+
+
+class TestCipherEntero:
+    """Tests de la ruta entera cifrar_entero / descifrar_entero."""
+
+    def test_entero_coincide_con_cadena(self):
+        """Test que verifica que la ruta entera coincide con la de cadenas, ceros incluidos."""
+        for valor in list(range(0, 1_000_000, 3331)) + [0, 7, 123, 999999]:
+            assert f"{CipherLogic.cifrar_entero(valor):06d}" == CipherLogic.cifrar(f"{valor:06d}")
+            assert f"{CipherLogic.descifrar_entero(valor):06d}" == CipherLogic.descifrar(f"{valor:06d}")
+
+    def test_entero_valores_conocidos(self):
+        """Test con pares de valores conocidos."""
+        assert CipherLogic.cifrar_entero(123456) == 18932
+        assert CipherLogic.descifrar_entero(18932) == 123456
+        assert CipherLogic.cifrar_entero(0) == 777777
+
+    def test_entero_fuera_de_rango(self):
+        """Test que verifica el rechazo de enteros fuera de rango."""
+        with pytest.raises(ValueError):
+            CipherLogic.cifrar_entero(1_000_000)
+        with pytest.raises(ValueError):
+            CipherLogic.descifrar_entero(-1)
+
+    def test_enteros_array(self):
+        """Test con una columna array('I')."""
+        from array import array
+        numeros = array("I", [123456, 0, 999999])
+        cifrados = CipherLogic.cifrar_enteros(numeros)
+        assert isinstance(cifrados, array) and cifrados.typecode == "I"
+        assert list(cifrados) == [18932, 777777, 666666]
+        assert CipherLogic.descifrar_enteros(cifrados) == numeros
+
+    def test_enteros_lista_y_numpy(self):
+        """Test con una lista y con una columna NumPy."""
+        assert CipherLogic.cifrar_enteros([123456]) == [18932]
+        np = pytest.importorskip("numpy")
+        columna = np.array([123456, 0], dtype=np.int32)
+        assert CipherLogic.cifrar_enteros(columna).tolist() == [18932, 777777]
@@ -0,0 +1,172 @@
+"""
+Tests unitarios para la consola y el procesamiento en flujo.
+"""
+
+import io
+import itertools
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.cli import main
+from src.logic.cipher import CipherLogic
+from src.logic.flujo import (
+    iter_cifrar, iter_descifrar, transformar_lineas, transformar_lista, transformar_en_bloques, escribir_resultados,
+)
+from src.utils.validators import ERROR_LONGITUD, ERROR_NO_DIGITO
+
+RAIZ = Path(__file__).parent.parent
+
+
+class TestFlujo:
+    """Clase de tests para transformar_lineas y escribir_resultados."""
+
+    def test_transformar_lineas_validas(self):
+        """Test que transforma líneas válidas conservando el número de línea."""
+        resultados = list(transformar_lineas(["123456\n", "000000\n"], "cifrar"))
+        assert resultados == [(1, "018932", ""), (2, "777777", "")]
+
+    def test_transformar_lineas_invalidas(self):
+        """Test que reporta las líneas inválidas con el mensaje del validador."""
+        resultados = list(transformar_lineas(["12345\n", "\n", "12a456\n"], "descifrar"))
+        assert resultados == [
+            (1, None, "El número debe tener exactamente 6 dígitos"),
+            (3, None, "Solo se aceptan dígitos numéricos"),
+        ]
+
+    def test_fallo_al_transformar_no_corta_el_flujo(self, monkeypatch):
+        """Test que verifica que una línea válida que no se puede transformar se reporta y se sigue."""
+        original = CipherLogic.cifrar
+
+        def cifrar(codigo):
+            if codigo == "000000":
+                raise ValueError("fallo de prueba")
+            return original(codigo)
+
+        monkeypatch.setattr(CipherLogic, "cifrar", staticmethod(cifrar))
+        resultados = list(transformar_lineas(["123456\n", "000000\n", "999999\n"], "cifrar"))
+        assert resultados == [
+            (1, "018932", ""),
+            (2, None, "No se pudo cifrar: fallo de prueba"),
+            (3, "666666", ""),
+        ]
+
+    def test_transformar_lista(self):
+        """Test que transforma una lista completa con la ruta por búfer."""
+        assert transformar_lista(["123456", "000000"], "cifrar") == ["018932", "777777"]
+        assert transformar_lista(["018932"], "descifrar") == ["123456"]
+        assert transformar_lista([], "cifrar") == []
+
+    def test_transformar_en_bloques(self):
+        """Test que procesa por bloques conservando la alineación de las filas."""
+        codigos = ["123456", "12345", "000000", "12a456", "999999"]
+        bloques = list(transformar_en_bloques(codigos, "cifrar", tam_bloque=2))
+        assert [inicio for inicio, _, _ in bloques] == [0, 2, 4]
+        assert sum((resultados for _, resultados, _ in bloques), []) == ["018932", "", "777777", "", "666666"]
+        assert sum((fallidos for _, _, fallidos in bloques), []) == [(1, ERROR_LONGITUD), (3, ERROR_NO_DIGITO)]
+
+    def test_escribir_resultados(self):
+        """Test que escribe los resultados y cuenta los errores."""
+        salida, errores = io.StringIO(), io.StringIO()
+        resultados = transformar_lineas(["123456", "abc", "999999"], "cifrar")
+        assert escribir_resultados(resultados, salida, errores) == 1
+        assert salida.getvalue() == "018932\n666666\n"
+        assert errores.getvalue() == "Línea 2: El número debe tener exactamente 6 dígitos\n"
+
+
+class TestIterCifrar:
+    """Clase de tests para los generadores iter_cifrar e iter_descifrar."""
+
+    def test_ida_y_vuelta_perezosa(self):
+        """Test que verifica el orden de los resultados a través de varios bloques."""
+        codigos = (f"{valor:06d}" for valor in range(0, 1_000_000, 4999))
+        cifrados = iter_cifrar(codigos, tam_bloque=7)
+        assert list(iter_descifrar(cifrados, tam_bloque=5)) == [f"{valor:06d}" for valor in range(0, 1_000_000, 4999)]
+
+    def test_iterable_infinito(self):
+        """Test que verifica que solo se consume lo necesario de un iterable infinito."""
+        consumidos = []
+
+        def infinito():
+            for valor in itertools.count():
+                consumidos.append(valor)
+                yield "%06d" % (valor % 1_000_000)
+
+        primeros = list(itertools.islice(iter_cifrar(infinito(), tam_bloque=10), 3))
+        assert primeros == [CipherLogic.cifrar(f"{valor:06d}") for valor in range(3)]
+        assert len(consumidos) == 10
+
+    def test_incluir_errores(self):
+        """Test que verifica que los inválidos se entregan como (indice, mensaje)."""
+        resultados = list(iter_cifrar(["123456", "12a456", "000000", ""], tam_bloque=2, incluir_errores=True))
+        assert resultados == [
+            "018932",
+            (1, "Solo se aceptan dígitos numéricos"),
+            "777777",
+            (3, "Por favor ingrese un número"),
+        ]
+
+    def test_digitos_no_ascii_como_error(self):
+        """Test que verifica que un código con dígitos no ASCII se entrega como error, sin excepción."""
+        resultados = list(iter_cifrar(["123456", "¹²³⁴⁵⁶", "000000"], incluir_errores=True))
+        assert resultados == ["018932", (1, "Solo se aceptan dígitos numéricos"), "777777"]
+        with pytest.raises(ValueError, match="Código 1 inválido"):
+            list(iter_descifrar(["018932", "٠١٨٩٣٢"]))
+
+    def test_lanza_en_el_primer_invalido(self):
+        """Test que verifica que sin incluir_errores se lanza ValueError tras los válidos previos."""
+        iterador = iter_descifrar(["018932", "1234"])
+        with pytest.raises(ValueError, match="Código 1"):
+            assert next(iterador) == "123456"
+            next(iterador)
+
+    def test_tam_bloque_invalido_al_llamar(self):
+        """Test que verifica que un tamaño de bloque no positivo falla antes de iterar."""
+        for funcion in (iter_cifrar, iter_descifrar):
+            with pytest.raises(ValueError, match="tamaño de bloque"):
+                funcion(["123456"], tam_bloque=0)
+
+
+class TestCli:
+    """Clase de tests para el punto de entrada de consola."""
+
+    def test_cifrar_y_descifrar_archivo(self, tmp_path):
+        """Test de ida y vuelta usando archivos de entrada y salida."""
+        entrada = tmp_path / "entrada.txt"
+        cifrado = tmp_path / "cifrado.txt"
+        descifrado = tmp_path / "descifrado.txt"
+        entrada.write_text("123456\n000123\n999999\n")
+
+        assert main(["cifrar", "-i", str(entrada), "-o", str(cifrado)]) == 0
+        assert cifrado.read_text() == "018932\n787709\n666666\n"
+
+        try:
+            assert main(["descifrar", "-i", str(cifrado), "-o", str(descifrado), "--tabla"]) == 0
+        finally:
+            CipherLogic.usar_tabla(None)
+        assert descifrado.read_text() == entrada.read_text()
+
+    def test_lineas_invalidas_devuelven_error(self, tmp_path, capsys):
+        """Test que verifica el código de salida ante líneas inválidas."""
+        entrada = tmp_path / "entrada.txt"
+        salida = tmp_path / "salida.txt"
+        entrada.write_text("123456\n12\n")
+        assert main(["cifrar", "-i", str(entrada), "-o", str(salida)]) == 1
+        assert salida.read_text() == "018932\n"
+        assert "Línea 2" in capsys.readouterr().err
+
+    def test_tuberia_sin_pyqt(self):
+        """Test que ejecuta la consola en una tubería sin importar PyQt6 ni src.ui."""
+        codigo = (
+            "import sys, runpy; sys.argv = ['cli', 'cifrar'];"
+            "\ntry:\n    runpy.run_module('src.cli', run_name='__main__')"
+            "\nexcept SystemExit:\n    pass"
+            "\nassert not [m for m in sys.modules if m.startswith(('PyQt6', 'src.ui'))]"
+        )
+        proceso = subprocess.run(
+            [sys.executable, "-c", codigo], input="123456\n", capture_output=True,
+            text=True, cwd=RAIZ, check=True,
+        )
+        assert proceso.stdout == "018932\n"
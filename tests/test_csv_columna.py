@@ -0,0 +1,89 @@
+"""
+Tests unitarios para la transformación de columnas CSV.
+"""
+
+import io
+
+import pytest
+from src.cli import main
+from src.logic.cipher import CipherLogic
+from src.logic.csv_columna import transformar_columna_csv
+
+
+def transformar(texto, columna, operacion="cifrar", **opciones):
+    """Función auxiliar que transforma un CSV en memoria."""
+    salida = io.StringIO(newline="")
+    errores = io.StringIO()
+    num_rechazos = transformar_columna_csv(io.StringIO(texto, newline=""), salida, columna, operacion,
+                                           errores=errores, **opciones)
+    return salida.getvalue(), num_rechazos, errores.getvalue()
+
+
+class TestCsvColumna:
+    """Clase de tests para transformar_columna_csv."""
+
+    def test_columna_por_nombre_conserva_el_resto(self):
+        """Test que verifica que solo cambia la columna indicada, con comillas y CRLF intactos."""
+        texto = (
+            'id;codigo;"nota; larga"\r\n'
+            '1;123456;"dice ""hola"""\r\n'
+            '2;"000123";"dos\r\nlíneas"\r\n'
+        )
+        resultado, num_rechazos, _ = transformar(texto, "codigo", delimitador=";", tam_bloque=1)
+        assert num_rechazos == 0
+        assert resultado == (
+            'id;codigo;"nota; larga"\r\n'
+            f'1;{CipherLogic.cifrar("123456")};"dice ""hola"""\r\n'
+            f'2;"{CipherLogic.cifrar("000123")}";"dos\r\nlíneas"\r\n'
+        )
+
+    def test_ida_y_vuelta_por_indice(self):
+        """Test que verifica que cifrar y descifrar devuelve el archivo original."""
+        texto = "".join(f"{valor},{valor:06d},x\n" for valor in range(0, 1_000_000, 9973))
+        cifrado, _, _ = transformar(texto, 1, encabezado=False, tam_bloque=7)
+        assert cifrado != texto
+        descifrado, _, _ = transformar(cifrado, 1, "descifrar", encabezado=False)
+        assert descifrado == texto
+
+    def test_modos_de_rechazo(self):
+        """Test que verifica los modos conservar, omitir y error."""
+        texto = "codigo,otro\n123456,a\n12a456,b\n\n999\n"
+
+        conservado, num_rechazos, errores = transformar(texto, "codigo")
+        assert num_rechazos == 2
+        assert conservado == f"codigo,otro\n{CipherLogic.cifrar('123456')},a\n12a456,b\n\n999\n"
+        assert errores.splitlines() == [
+            "Línea 3: Solo se aceptan dígitos numéricos",
+            "Línea 5: El número debe tener exactamente 6 dígitos",
+        ]
+
+        omitido, _, _ = transformar(texto, "codigo", rechazo="omitir")
+        assert omitido == f"codigo,otro\n{CipherLogic.cifrar('123456')},a\n\n"
+
+        with pytest.raises(ValueError, match="Línea 3"):
+            transformar(texto, "codigo", rechazo="error")
+
+    def test_fila_sin_columna(self):
+        """Test que verifica el rechazo de filas con menos columnas."""
+        _, num_rechazos, errores = transformar("a,codigo\nsolo\n", "codigo")
+        assert num_rechazos == 1
+        assert "no tiene la columna" in errores
+
+    def test_columna_inexistente(self):
+        """Test que verifica el error cuando la columna no existe."""
+        with pytest.raises(ValueError, match="No existe la columna"):
+            transformar("a,b\n1,2\n", "codigo")
+        with pytest.raises(ValueError):
+            transformar("a,b\n", "codigo", rechazo="ignorar")
+
+    def test_cli_columna(self, tmp_path):
+        """Test que verifica la opción --columna de la consola."""
+        entrada = tmp_path / "datos.csv"
+        cifrado = tmp_path / "cifrado.csv"
+        descifrado = tmp_path / "descifrado.csv"
+        entrada.write_bytes(b"nombre,codigo\r\nAna,123456\r\nLuis,654321\r\n")
+
+        assert main(["cifrar", "-i", str(entrada), "-o", str(cifrado), "--columna", "codigo"]) == 0
+        assert cifrado.read_bytes().splitlines()[1] == f"Ana,{CipherLogic.cifrar('123456')}".encode()
+        assert main(["descifrar", "-i", str(cifrado), "-o", str(descifrado), "--columna", "1"]) == 0
+        assert descifrado.read_bytes() == entrada.read_bytes()
@@ -0,0 +1,120 @@
+"""
+Tests unitarios para el demonio local sobre socket Unix y su cliente.
+"""
+
+import asyncio
+import io
+import socket
+import threading
+
+import pytest
+from src.logic.cipher import CipherLogic
+from src.logic.tabla import TablaCifrado
+from src.servicio import cliente
+from src.servicio.cliente import ClienteCifrado
+from src.servicio.demonio import DemonioCifrado, responder_lineas
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requiere sockets Unix")
+
+
+@pytest.fixture(scope="module")
+def tabla():
+    """Fixture con las tablas construidas una sola vez."""
+    return TablaCifrado.construir()
+
+
+@pytest.fixture
+def demonio(tmp_path, tabla):
+    """Fixture que ejecuta el demonio en un hilo con su propio bucle de eventos."""
+    bucle = asyncio.new_event_loop()
+    demonio = DemonioCifrado(str(tmp_path / "cifrado.sock"), tabla=tabla)
+    bucle.run_until_complete(demonio.iniciar())
+    hilo = threading.Thread(target=bucle.run_forever, daemon=True)
+    hilo.start()
+    yield demonio
+    asyncio.run_coroutine_threadsafe(demonio.detener(), bucle).result()
+    bucle.call_soon_threadsafe(bucle.stop)
+    hilo.join()
+    bucle.close()
+
+
+class TestProtocolo:
+    """Clase de tests para el protocolo de líneas."""
+
+    def test_responder_lineas(self):
+        """Test que verifica respuestas correctas, errores y comandos desconocidos."""
+        respuestas = responder_lineas([b"C 123456", b"D 018932\r", b"C 12a456", b"X 123456", b""])
+        assert respuestas.decode().splitlines() == [
+            "OK 018932",
+            "OK 123456",
+            "ERR Solo se aceptan dígitos numéricos",
+            "ERR Comando desconocido (use C o D)",
+            "ERR Comando desconocido (use C o D)",
+        ]
+
+    def test_fallo_inesperado_solo_afecta_a_su_linea(self, monkeypatch):
+        """Test que verifica que una excepción al transformar responde ERR y sigue con las demás líneas."""
+        original = CipherLogic.cifrar
+
+        def cifrar(codigo):
+            if codigo == "000000":
+                raise ValueError("fallo")
+            return original(codigo)
+
+        monkeypatch.setattr(CipherLogic, "cifrar", staticmethod(cifrar))
+        respuestas = responder_lineas([b"C 123456", b"C 000000", b"C \xc2\xb9\xc2\xb2\xc2\xb3456", b"D 018932"])
+        assert respuestas.decode().splitlines() == [
+            "OK 018932",
+            "ERR Error interno al procesar el código",
+            "ERR Solo se aceptan dígitos numéricos",
+            "OK 123456",
+        ]
+
+
+class TestDemonio:
+    """Clase de tests para el demonio y el cliente."""
+
+    def test_pipelining_en_conexion_persistente(self, demonio):
+        """Test que verifica muchas peticiones en orden sobre una sola conexión."""
+        codigos = [f"{numero:06d}" for numero in range(0, 1_000_000, 97)]
+        with ClienteCifrado(demonio.ruta_socket) as conexion:
+            cifrados = [resultado for resultado, _ in conexion.transformar("cifrar", codigos, ventana=500)]
+            assert cifrados == [CipherLogic.cifrar(codigo) for codigo in codigos]
+            descifrados = [resultado for resultado, _ in conexion.transformar("descifrar", cifrados)]
+            assert descifrados == codigos
+            with pytest.raises(ValueError, match="6 dígitos"):
+                conexion.cifrar("123")
+            assert conexion.descifrar("018932") == "123456"
+
+    def test_socket_abandonado_y_limpieza(self, tmp_path, tabla):
+        """Test que verifica que un socket obsoleto se reemplaza y se elimina al detener."""
+        ruta = tmp_path / "viejo.sock"
+        abandonado = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        abandonado.bind(str(ruta))
+        abandonado.close()
+        assert ruta.exists()
+
+        async def escenario():
+            demonio = await DemonioCifrado(str(ruta), tabla=tabla).iniciar()
+            try:
+                with pytest.raises(OSError, match="Ya hay un demonio"):
+                    await DemonioCifrado(str(ruta), tabla=tabla).iniciar()
+            finally:
+                await demonio.detener()
+
+        asyncio.run(escenario())
+        assert not ruta.exists()
+        assert CipherLogic._tabla is None
+
+    def test_cliente_por_consola(self, demonio, monkeypatch, capsys):
+        """Test que verifica que el cliente pasa la entrada estándar por el demonio."""
+        monkeypatch.setattr("sys.stdin", io.StringIO("123456\n\n12a456\n000000\n"))
+        assert cliente.main(["cifrar", "--socket", demonio.ruta_socket]) == 1
+        salida = capsys.readouterr()
+        assert salida.out.splitlines() == ["018932", "777777"]
+        assert "Línea 3: Solo se aceptan dígitos numéricos" in salida.err
+
+    def test_cliente_sin_demonio(self, tmp_path, capsys):
+        """Test que verifica el código de salida cuando no hay demonio."""
+        assert cliente.main(["cifrar", "--socket", str(tmp_path / "nada.sock")]) == 2
+        assert "No se pudo conectar" in capsys.readouterr().err
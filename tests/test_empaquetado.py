@@ -0,0 +1,140 @@
+"""
+Tests unitarios para el almacenamiento empaquetado de códigos.
+"""
+
+import io
+
+import pytest
+from src.logic.cipher import CipherLogic, PLAN_POR_DEFECTO
+from src.logic.empaquetado import (
+    CABECERA, FORMATOS, LectorEmpaquetado, EscritorEmpaquetado, cifrar_empaquetado, descifrar_empaquetado,
+    desempaquetar, empaquetar, escribir_contenedor, leer_contenedor, transformar_contenedor,
+)
+from src.logic.plan import compilar_plan
+
+NUMEROS = list(range(0, 1_000_000, 997)) + [999999]
+
+
+class LecturasCortas(io.BytesIO):
+    """Archivo en memoria que, como una tubería, entrega como mucho 7 bytes por lectura."""
+
+    def read(self, tam=-1):
+        return super().read(7 if tam is None or tam < 0 else min(tam, 7))
+
+
+class TestEmpaquetado:
+    """Clase de tests para empaquetar, desempaquetar y cifrar en el dominio empaquetado."""
+
+    @pytest.mark.parametrize("formato", FORMATOS)
+    def test_ida_y_vuelta(self, formato):
+        """Test que verifica que desempaquetar invierte a empaquetar (cantidad par e impar)."""
+        for numeros in (NUMEROS, NUMEROS[:-1], []):
+            assert desempaquetar(empaquetar(numeros, formato), formato) == numeros
+
+    def test_tamanos(self):
+        """Test que verifica el tamaño de cada formato y el BCD legible en hexadecimal."""
+        assert empaquetar([123456], "bcd") == bytes.fromhex("123456")
+        assert len(empaquetar([1, 2, 3], "bits20")) == 8
+        with pytest.raises(ValueError):
+            empaquetar([1_000_000], "bcd")
+
+    @pytest.mark.parametrize("formato", FORMATOS)
+    def test_cifrar_sin_desempaquetar(self, formato):
+        """Test que verifica que el cifrado empaquetado coincide con la ruta entera."""
+        datos = empaquetar(NUMEROS, formato)
+        cifrados = CipherLogic.cifrar_empaquetado(datos, formato)
+        assert desempaquetar(cifrados, formato) == [CipherLogic.cifrar_entero(n) for n in NUMEROS]
+        assert CipherLogic.descifrar_empaquetado(cifrados, formato) == datos
+
+        plan = compilar_plan(3, 6, (5, 0, 4, 1, 3, 2))
+        cifrados = cifrar_empaquetado(datos, formato, plan)
+        assert desempaquetar(cifrados, formato) == [plan.cifrar_entero(n) for n in NUMEROS]
+        assert descifrar_empaquetado(cifrados, formato, plan) == datos
+
+    def test_cifrar_sin_numpy(self, monkeypatch):
+        """Test que verifica la ruta bits20 sin NumPy."""
+        monkeypatch.setattr("src.logic.empaquetado._numpy", lambda: None)
+        datos = empaquetar(NUMEROS, "bits20")
+        assert desempaquetar(cifrar_empaquetado(datos, "bits20"), "bits20") == [
+            PLAN_POR_DEFECTO.cifrar_entero(n) for n in NUMEROS]
+
+    def test_datos_invalidos(self):
+        """Test que verifica el rechazo de BCD inválido, enteros fuera de rango y tamaños incompletos."""
+        with pytest.raises(ValueError, match="Código 1 inválido"):
+            cifrar_empaquetado(bytes.fromhex("1234560a0000"), "bcd")
+        with pytest.raises(ValueError, match="Código 0 inválido"):
+            desempaquetar((1_000_000).to_bytes(3, "little"), "bits20")
+        with pytest.raises(ValueError, match="no forman códigos completos"):
+            desempaquetar(b"\x00" * 4, "bits20")
+        with pytest.raises(ValueError, match="Formato desconocido"):
+            empaquetar([1], "texto")
+
+
+class TestContenedor:
+    """Clase de tests para los contenedores con cabecera."""
+
+    @pytest.mark.parametrize("formato", FORMATOS)
+    def test_escribir_y_leer(self, tmp_path, formato):
+        """Test que verifica un contenedor escrito en varias partes y leído por bloques."""
+        ruta = tmp_path / "codigos.paq"
+        with open(ruta, "wb") as archivo, EscritorEmpaquetado(archivo, formato) as escritor:
+            escritor.escribir(NUMEROS[:3])
+            escritor.escribir(NUMEROS[3:])
+        assert ruta.stat().st_size < 7 * len(NUMEROS) / 2
+
+        with open(ruta, "rb") as archivo:
+            lector = LectorEmpaquetado(archivo)
+            assert (lector.formato, lector.cantidad) == (formato, len(NUMEROS))
+            bloques = list(lector.bloques(tam_bloque=100))
+        assert len(bloques) > 1
+        assert [numero for bloque in bloques for numero in bloque] == NUMEROS
+
+    def test_transformar_contenedor(self, tmp_path):
+        """Test que verifica el cifrado en flujo de un contenedor completo."""
+        ruta = tmp_path / "codigos.paq"
+        assert escribir_contenedor(str(ruta), NUMEROS, "bits20") == len(NUMEROS)
+        salida = io.BytesIO()
+        with open(ruta, "rb") as entrada:
+            assert transformar_contenedor(entrada, salida, "cifrar", tam_bloque=64) == len(NUMEROS)
+
+        salida.seek(0)
+        lector = LectorEmpaquetado(salida)
+        assert lector.leer_todo() == [CipherLogic.cifrar_entero(n) for n in NUMEROS]
+        assert leer_contenedor(str(ruta)) == ("bits20", NUMEROS)
+
+    @pytest.mark.parametrize("formato", FORMATOS)
+    def test_lecturas_cortas(self, formato):
+        """Test que verifica que los bloques se completan aunque cada lectura devuelva pocos bytes."""
+        salida = io.BytesIO()
+        with EscritorEmpaquetado(salida, formato) as escritor:
+            escritor.escribir(NUMEROS)
+        lector = LectorEmpaquetado(LecturasCortas(salida.getvalue()))
+        bloques = list(lector.bloques(tam_bloque=100))
+        assert [len(bloque) for bloque in bloques[:-1]] == [100] * (len(bloques) - 1)
+        assert [numero for bloque in bloques for numero in bloque] == NUMEROS
+
+        with pytest.raises(ValueError, match="truncado"):
+            LectorEmpaquetado(LecturasCortas(salida.getvalue()[:-1])).leer_todo()
+
+    def test_error_no_deja_contenedor_valido(self, tmp_path):
+        """Test que verifica que una escritura fallida no deja un contenedor legible."""
+        entrada = io.BytesIO(CABECERA.pack(b"CIFPAQ", 1, 1, 2) + bytes.fromhex("1234560a0000"))
+        assert LectorEmpaquetado(io.BytesIO(entrada.getvalue())).formato == "bcd"
+        salida = io.BytesIO()
+        with pytest.raises(ValueError, match="Código 0 inválido"):
+            transformar_contenedor(entrada, salida, "cifrar", tam_bloque=1)
+        with pytest.raises(ValueError, match="no es un contenedor"):
+            LectorEmpaquetado(io.BytesIO(salida.getvalue()))
+
+        ruta = tmp_path / "codigos.paq"
+        with pytest.raises(ValueError):
+            escribir_contenedor(str(ruta), [1, 2, 1_000_000], "bcd")
+        assert not ruta.exists()
+
+    def test_cabecera_invalida(self):
+        """Test que verifica el rechazo de archivos que no son contenedores."""
+        with pytest.raises(ValueError):
+            LectorEmpaquetado(io.BytesIO(b"123456\n" * 3))
+        truncado = io.BytesIO(CABECERA.pack(b"CIFPAQ", 1, 1, 5) + b"\x12\x34\x56")
+        with pytest.raises(ValueError, match="truncado"):
+            LectorEmpaquetado(truncado).leer_todo()
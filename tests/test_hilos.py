@@ -0,0 +1,49 @@
+"""
+Tests unitarios para la ejecución por lotes en hilos.
+"""
+
+import pytest
+from src.logic.cipher import PLAN_POR_DEFECTO, CipherLogic
+from src.logic.hilos import EjecutorLotes, transformar_en_hilos
+
+
+class TestHilos:
+    """Clase de tests para EjecutorLotes y transformar_en_hilos."""
+
+    def test_buffer_identico_a_ruta_serial(self):
+        """Test que verifica que el resultado combinado coincide con la ruta por búfer."""
+        plan = PLAN_POR_DEFECTO
+        datos = b"".join(b"%06d\n" % (valor * 7919 % 1_000_000) for valor in range(10_007))
+        with EjecutorLotes(hilos=3, tam_fragmento=1000) as ejecutor:
+            cifrado = ejecutor.cifrar(datos)
+            assert cifrado.resultado == plan.cifrar_buffer(datos)
+            assert ejecutor.descifrar(memoryview(cifrado.resultado)).resultado == datos
+
+        assert cifrado.elementos == 10_007
+        assert sum(estadistica.elementos for estadistica in cifrado.estadisticas) == 10_007
+        assert sum(estadistica.fragmentos for estadistica in cifrado.estadisticas) == 11
+        assert all(estadistica.elementos_por_segundo > 0 for estadistica in cifrado.estadisticas)
+
+    def test_buffer_invalido(self):
+        """Test que verifica que un registro inválido se reporta con su posición."""
+        datos = b"123456\n" * 50 + b"12a456\n"
+        with pytest.raises(ValueError, match="registro 40"):
+            transformar_en_hilos(datos, hilos=2, tam_fragmento=40)
+        with pytest.raises(ValueError):
+            transformar_en_hilos(b"12345\n", hilos=1)
+
+    def test_arreglo_numpy(self):
+        """Test que verifica el cifrado de un arreglo de enteros de NumPy."""
+        np = pytest.importorskip("numpy")
+        numeros = np.arange(0, 1_000_000, 37, dtype=np.int64)
+        resultado = transformar_en_hilos(numeros, hilos=4, tam_fragmento=5000)
+        assert resultado.resultado.dtype == numeros.dtype
+        assert np.array_equal(resultado.resultado, PLAN_POR_DEFECTO.cifrar_lote(numeros))
+        assert int(resultado.resultado[1]) == int(CipherLogic.cifrar("000037"))
+        descifrado = transformar_en_hilos(resultado.resultado, "descifrar", hilos=4, tam_fragmento=5000)
+        assert np.array_equal(descifrado.resultado, numeros)
+
+    def test_operacion_desconocida(self):
+        """Test que verifica el rechazo de operaciones desconocidas."""
+        with pytest.raises(ValueError):
+            transformar_en_hilos(b"", "invertir")
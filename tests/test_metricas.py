@@ -0,0 +1,140 @@
+"""
+Tests unitarios para las métricas de uso.
+"""
+
+import json
+import threading
+
+import pytest
+from src.cli import main
+from src.logic.cipher import CipherLogic
+from src.logic.flujo import iter_cifrar, transformar_lista
+from src.utils import metricas
+from src.utils.metricas import Histograma, RegistroMetricas
+from src.utils.validators import Validator
+
+
+@pytest.fixture
+def registro():
+    """Fixture que activa la instrumentación y la desactiva al terminar."""
+    registro = metricas.activar()
+    yield registro
+    metricas.desactivar()
+
+
+class TestHistograma:
+    """Clase de tests para el histograma de latencias."""
+
+    def test_valores_pequenos_exactos(self):
+        """Test que verifica que los valores pequeños se cuentan sin error."""
+        histograma = Histograma()
+        for valor in range(1, 11):
+            histograma.registrar(valor)
+        assert histograma.percentil(50) == 5
+        assert histograma.percentil(100) == 10
+        assert histograma.suma == 55
+
+    def test_error_relativo_acotado(self):
+        """Test que verifica que los percentiles tienen un error relativo menor a 1/16."""
+        histograma = Histograma()
+        valores = [int(1.37 ** exponente) + 40 for exponente in range(60)]
+        for valor in valores:
+            histograma.registrar(valor)
+        valores.sort()
+        for porcentaje in (10, 50, 90, 99):
+            exacto = valores[-(-len(valores) * porcentaje // 100) - 1]
+            aproximado = histograma.percentil(porcentaje)
+            assert exacto <= aproximado <= exacto * 17 / 16
+
+    def test_vacio(self):
+        """Test que verifica un histograma sin valores."""
+        assert Histograma().percentil(99) == 0
+
+
+class TestMetricas:
+    """Clase de tests para la instrumentación y la exportación."""
+
+    def test_desactivada_no_modifica_metodos(self):
+        """Test que verifica que desactivar restaura los métodos originales."""
+        original = CipherLogic.__dict__["cifrar"]
+        metricas.activar()
+        assert CipherLogic.__dict__["cifrar"] is not original
+        metricas.desactivar()
+        assert CipherLogic.__dict__["cifrar"] is original
+        assert metricas.registro_activo() is None
+
+    def test_cuenta_llamadas_y_errores(self, registro):
+        """Test que verifica contadores, clases de error y resultados intactos."""
+        assert CipherLogic.descifrar(CipherLogic.cifrar("123456")) == "123456"
+        assert Validator.validar_numero_6_digitos("12a456")[0] is False
+        Validator.validar_numero_6_digitos("")
+        Validator.validar_numero_6_digitos("123456")
+
+        assert registro.llamadas == {"cifrar": 1, "descifrar": 1, "validar": 3}
+        assert registro.errores == {("validar", "no_digito"): 1, ("validar", "vacio"): 1}
+        assert registro.latencias["validar"].total == 3
+
+    def test_excepciones_se_cuentan(self, registro):
+        """Test que verifica que las excepciones se registran y se propagan."""
+        with pytest.raises(Exception):
+            CipherLogic.cifrar(None)
+        assert sum(cuenta for (operacion, _), cuenta in registro.errores.items() if operacion == "cifrar") == 1
+
+    def test_exportar(self):
+        """Test que verifica la exportación en JSON y en formato Prometheus."""
+        registro = RegistroMetricas()
+        registro.registrar("cifrar", 1500)
+        registro.registrar("cifrar", 2500, "ValueError")
+
+        datos = json.loads(registro.a_json())
+        assert datos["cifrar"]["llamadas"] == 2
+        assert datos["cifrar"]["errores"] == {"ValueError": 1}
+        assert datos["cifrar"]["latencia"]["suma"] == pytest.approx(4e-6)
+
+        texto = registro.a_prometheus()
+        assert '# TYPE cifrado_llamadas_total counter' in texto
+        assert 'cifrado_llamadas_total{operacion="cifrar"} 2' in texto
+        assert 'cifrado_errores_total{operacion="cifrar",clase="ValueError"} 1' in texto
+        assert 'cifrado_latencia_segundos_count{operacion="cifrar"} 2' in texto
+        assert 'quantile="0.99"' in texto
+
+    def test_conteo_exacto_con_hilos(self, registro):
+        """Test que verifica que no se pierden llamadas con varios hilos."""
+        def trabajar():
+            for _ in range(2000):
+                CipherLogic.cifrar("123456")
+
+        hilos = [threading.Thread(target=trabajar) for _ in range(4)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        assert registro.llamadas["cifrar"] == 8000
+        assert registro.total_llamadas() == 8000
+
+    def test_operaciones_por_lotes(self, registro):
+        """Test que verifica que las llamadas por lotes cuentan sus elementos."""
+        CipherLogic.cifrar_buffer(b"123456\n" * 5)
+        CipherLogic.descifrar_buffer(b"018932" * 3, b"")
+        CipherLogic.cifrar_enteros([1, 2, 3, 4])
+        CipherLogic.cifrar_empaquetado(bytes.fromhex("123456000001"), "bcd")
+        CipherLogic.cifrar_empaquetado(b"\x00" * 8, "bits20")
+
+        assert registro.llamadas == {"cifrar_buffer": 1, "cifrar_empaquetado": 2,
+                                     "cifrar_enteros": 1, "descifrar_buffer": 1}
+        assert registro.elementos == {"cifrar_buffer": 5, "cifrar_empaquetado": 5,
+                                      "cifrar_enteros": 4, "descifrar_buffer": 3}
+        assert 'cifrado_elementos_total{operacion="cifrar_buffer"} 5' in registro.a_prometheus()
+
+    def test_flujo_y_consola_instrumentados(self, registro, tmp_path):
+        """Test que verifica que la consola y las funciones de flujo usan los métodos instrumentados."""
+        entrada = tmp_path / "codigos.txt"
+        entrada.write_text("123456\n000000\n12a456\n")
+        assert main(["cifrar", "-i", str(entrada), "-o", str(tmp_path / "cifrados.txt")]) == 1
+        assert registro.llamadas["cifrar"] == 2
+        assert registro.errores[("validar", "no_digito")] == 1
+
+        assert transformar_lista(["123456"] * 4, "descifrar") == ["674598"] * 4
+        assert list(iter_cifrar(["123456", "654321"])) == ["018932", "103289"]
+        assert registro.elementos["descifrar_buffer"] == 4
+        assert registro.elementos["cifrar_buffer"] == 2
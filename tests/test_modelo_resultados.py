@@ -0,0 +1,82 @@
+"""
+Tests unitarios para el modelo de resultados por lotes.
+"""
+
+from array import array
+
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+
+from src.logic.flujo import transformar_en_bloques  # noqa: E402
+from src.ui.modelo_resultados import ModeloResultados, SIN_VALOR  # noqa: E402
+from src.ui.panel_lote import ResultadoLote  # noqa: E402
+from src.utils.validators import ERROR_NO_DIGITO, MENSAJES_ERROR  # noqa: E402
+
+DISPLAY = QtCore.Qt.ItemDataRole.DisplayRole
+
+
+def _celdas(modelo, fila):
+    """Texto de las tres columnas de una fila."""
+    return [modelo.data(modelo.index(fila, columna), DISPLAY) for columna in range(modelo.columnCount())]
+
+
+@pytest.fixture
+def modelo(qapp):
+    """Fixture con un modelo de una fila válida y una inválida."""
+    modelo = ModeloResultados()
+    modelo.cargar(array("i", [123456, SIN_VALOR]), array("i", [18932, SIN_VALOR]),
+                  {1: "12a456"}, {1: ERROR_NO_DIGITO})
+    return modelo
+
+
+class TestModeloResultados:
+    """Clase de tests para ModeloResultados."""
+
+    def test_filas_y_columnas(self, modelo):
+        """Test que verifica rowCount, columnCount y limpiar."""
+        assert modelo.rowCount() == 2
+        assert modelo.columnCount() == 3
+        assert modelo.rowCount(modelo.index(0, 0)) == 0
+        modelo.limpiar()
+        assert modelo.rowCount() == 0
+
+    def test_fila_valida(self, modelo):
+        """Test que verifica el texto de una fila válida, con ceros a la izquierda."""
+        assert _celdas(modelo, 0) == ["123456", "018932", "OK"]
+
+    def test_fila_invalida(self, modelo):
+        """Test que verifica el texto original y el mensaje de una fila inválida."""
+        assert _celdas(modelo, 1) == ["12a456", "", MENSAJES_ERROR[ERROR_NO_DIGITO]]
+
+    def test_roles_e_indices_invalidos(self, modelo):
+        """Test que verifica que otros roles e índices fuera del modelo no devuelven datos."""
+        assert modelo.data(modelo.index(0, 0), QtCore.Qt.ItemDataRole.ToolTipRole) is None
+        assert modelo.data(modelo.index(5, 0), DISPLAY) is None
+        assert modelo.data(QtCore.QModelIndex(), DISPLAY) is None
+        assert modelo.headerData(1, QtCore.Qt.Orientation.Horizontal) == "Salida"
+        assert modelo.headerData(0, QtCore.Qt.Orientation.Vertical) == 1
+        assert modelo.headerData(0, QtCore.Qt.Orientation.Horizontal, QtCore.Qt.ItemDataRole.ToolTipRole) is None
+
+
+class TestResultadoLote:
+    """Clase de tests para ResultadoLote.agregar_bloque."""
+
+    def test_desplazamiento_entre_bloques(self, qapp):
+        """Test que verifica que los índices de error de cada bloque se desplazan al acumularlos."""
+        resultado = ResultadoLote()
+        bloques = [["123456", "12a456"], ["000000", "000001"], ["", "999999", "12345"]]
+        for bloque in bloques:
+            for _, resultados, fallidos in transformar_en_bloques(bloque, "cifrar", len(bloque)):
+                resultado.agregar_bloque(bloque, resultados, fallidos)
+
+        assert len(resultado) == 7
+        assert resultado.entradas.tolist() == [123456, SIN_VALOR, 0, 1, SIN_VALOR, 999999, SIN_VALOR]
+        assert resultado.salidas.tolist() == [18932, SIN_VALOR, 777777, 777787, SIN_VALOR, 666666, SIN_VALOR]
+        assert resultado.invalidos == {1: "12a456", 4: "", 6: "12345"}
+        assert sorted(resultado.errores) == [1, 4, 6]
+
+        modelo = ModeloResultados()
+        modelo.cargar(resultado.entradas, resultado.salidas, resultado.invalidos, resultado.errores)
+        assert _celdas(modelo, 3) == ["000001", "777787", "OK"]
+        assert _celdas(modelo, 6)[:2] == ["12345", ""]
@@ -0,0 +1,120 @@
+"""
+Tests unitarios para el procesamiento por lotes de la interfaz.
+"""
+
+import time
+
+import pytest
+
+pytest.importorskip("PyQt6.QtCore")
+
+from src.ui import panel_lote  # noqa: E402
+from src.ui.panel_lote import PanelLote, TrabajadorLote  # noqa: E402
+
+CODIGOS = ["123456", "12a456", "000000", "", "999999", "12345"]
+
+
+def _conectar(trabajador):
+    """Conecta las señales del trabajador a listas."""
+    senales = {"progreso": [], "terminado": [], "error": []}
+    trabajador.progreso.connect(lambda procesados, total: senales["progreso"].append((procesados, total)))
+    trabajador.terminado.connect(senales["terminado"].append)
+    trabajador.error.connect(senales["error"].append)
+    return senales
+
+
+@pytest.fixture(autouse=True)
+def bloques_pequenos(monkeypatch, qapp):
+    """Fixture que reduce el tamaño de bloque para tener varios bloques con pocos códigos."""
+    monkeypatch.setattr(panel_lote, "TAM_BLOQUE", 2)
+
+
+class TestTrabajadorLote:
+    """Clase de tests para TrabajadorLote.ejecutar (sin iniciar el QThread)."""
+
+    def test_progreso_por_bloques(self):
+        """Test que verifica la secuencia de progreso, en líneas, de un texto pegado."""
+        trabajador = TrabajadorLote("cifrar", texto="\n".join(CODIGOS))
+        senales = _conectar(trabajador)
+        trabajador.ejecutar()
+
+        # La línea vacía cuenta como avance pero no entra en ningún bloque
+        assert senales["progreso"] == [(0, 6), (2, 6), (5, 6), (6, 6)]
+        resultado, = senales["terminado"]
+        assert not resultado.cancelado
+        assert len(resultado) == 5
+        assert senales["error"] == []
+
+    def test_progreso_en_bytes(self, tmp_path):
+        """Test que verifica que el progreso de un archivo se mide en bytes."""
+        ruta = tmp_path / "codigos.txt"
+        ruta.write_bytes(b"123456\n000000\n999999\n")
+        trabajador = TrabajadorLote("descifrar", ruta=str(ruta))
+        senales = _conectar(trabajador)
+        trabajador.ejecutar()
+
+        assert senales["progreso"] == [(0, 21), (14, 21), (21, 21)]
+        assert senales["terminado"][0].salidas.tolist() == [674598, 333333, 222222]
+
+    def test_cancelar_tras_el_bloque_en_curso(self):
+        """Test que verifica que cancelar detiene el proceso al terminar el bloque en curso."""
+        trabajador = TrabajadorLote("cifrar", texto="\n".join(CODIGOS))
+        senales = _conectar(trabajador)
+        trabajador.progreso.connect(lambda procesados, total: procesados and trabajador.cancelar())
+        trabajador.ejecutar()
+
+        assert senales["progreso"] == [(0, 6), (2, 6)]
+        resultado, = senales["terminado"]
+        assert resultado.cancelado
+        assert len(resultado) == 2
+
+    def test_resumen_cuenta_invalidos(self):
+        """Test que verifica que el resumen cuenta las filas inválidas."""
+        trabajador = TrabajadorLote("cifrar", texto="\n".join(CODIGOS))
+        senales = _conectar(trabajador)
+        trabajador.ejecutar()
+        resultado, = senales["terminado"]
+        assert sorted(resultado.errores) == [1, 4]
+
+        panel = PanelLote("cifrar")
+        panel.mostrar_resultado(resultado)
+        lineas = panel.resumen.text().splitlines()
+        assert lineas[0] == "3 procesados, 2 con error"
+        assert lineas[1].startswith("Fila 2 ('12a456')")
+        assert lineas[2].startswith("Fila 5 ('12345')")
+        assert panel.modelo.rowCount() == 5
+
+    def test_archivo_inexistente(self, tmp_path):
+        """Test que verifica que un archivo ilegible emite error y no termina."""
+        trabajador = TrabajadorLote("cifrar", ruta=str(tmp_path / "no_existe.txt"))
+        senales = _conectar(trabajador)
+        trabajador.ejecutar()
+        assert senales["terminado"] == []
+        assert senales["error"][0].startswith("No se pudo leer el archivo")
+
+    def test_excepcion_inesperada_emite_error(self, monkeypatch):
+        """Test que verifica que cualquier excepción termina con la señal error y libera el panel."""
+        def fallar(*args):
+            raise ValueError("fallo de prueba")
+
+        monkeypatch.setattr(panel_lote, "transformar_en_bloques", fallar)
+        trabajador = TrabajadorLote("cifrar", texto="\n".join(CODIGOS))
+        senales = _conectar(trabajador)
+        trabajador.ejecutar()
+        assert senales["terminado"] == []
+        assert senales["error"] == ["Error al procesar el lote: fallo de prueba"]
+
+    def test_panel_se_libera_tras_un_error(self, monkeypatch, qapp):
+        """Test que verifica que el panel vuelve a aceptar lotes tras un error en el hilo."""
+        monkeypatch.setattr(panel_lote, "transformar_en_bloques", lambda *args: 1 / 0)
+        monkeypatch.setattr(panel_lote.QtWidgets.QMessageBox, "warning", lambda *args: None)
+        panel = PanelLote("cifrar")
+        panel.entrada.setPlainText("123456")
+        panel.procesar()
+        limite = time.monotonic() + 5
+        while panel._hilo is not None and time.monotonic() < limite:
+            qapp.processEvents()
+            time.sleep(0.01)
+        assert panel._hilo is None
+        assert panel.btn_procesar.isEnabled()
+        assert panel.resumen.text().startswith("Error al procesar el lote")
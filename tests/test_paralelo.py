@@ -0,0 +1,62 @@
+"""
+Tests unitarios para el procesamiento paralelo de archivos.
+"""
+
+import io
+
+import pytest
+from src.cli import main
+from src.logic.paralelo import dividir_en_fragmentos, procesar_archivo_paralelo
+
+
+@pytest.fixture
+def archivo_codigos(tmp_path):
+    """Fixture que crea un archivo con códigos válidos, inválidos y finales CRLF."""
+    lineas = [f"{valor:06d}" for valor in range(0, 1_000_000, 1237)]
+    lineas[5] = "12a456"
+    lineas[40] = ""
+    lineas[300] = "1234567"
+    ruta = tmp_path / "codigos.txt"
+    ruta.write_bytes(("\n".join(lineas[:500]) + "\r\n" + "\n".join(lineas[500:]) + "\n").encode())
+    return ruta
+
+
+class TestParalelo:
+    """Clase de tests para el modo de archivo paralelo."""
+
+    def test_fragmentos_alineados(self, archivo_codigos):
+        """Test que verifica que los fragmentos cubren el archivo y terminan en salto de línea."""
+        datos = archivo_codigos.read_bytes()
+        fragmentos = dividir_en_fragmentos(str(archivo_codigos), 1000)
+        assert fragmentos[0][0] == 0
+        assert fragmentos[-1][1] == len(datos)
+        for (_, fin), (inicio, _) in zip(fragmentos, fragmentos[1:]):
+            assert fin == inicio
+            assert datos[fin - 1:fin] == b"\n"
+
+    def test_tam_fragmento_invalido(self, archivo_codigos):
+        """Test que verifica el rechazo de tamaños de fragmento no positivos."""
+        with pytest.raises(ValueError):
+            dividir_en_fragmentos(str(archivo_codigos), 0)
+
+    def test_identico_a_ruta_secuencial(self, archivo_codigos, tmp_path):
+        """Test que verifica que la salida paralela es idéntica a la secuencial."""
+        secuencial = tmp_path / "secuencial.txt"
+        paralelo = tmp_path / "paralelo.txt"
+        assert main(["cifrar", "-i", str(archivo_codigos), "-o", str(secuencial)]) == 1
+
+        errores = io.StringIO()
+        num_errores = procesar_archivo_paralelo(
+            str(archivo_codigos), str(paralelo), "cifrar", procesos=2, tam_fragmento=512, errores=errores,
+        )
+        assert num_errores == 2
+        assert paralelo.read_bytes() == secuencial.read_bytes()
+        assert errores.getvalue().splitlines() == [
+            "Línea 6: Solo se aceptan dígitos numéricos",
+            "Línea 301: El número debe tener exactamente 6 dígitos",
+        ]
+
+    def test_cli_paralelo_requiere_archivos(self, archivo_codigos):
+        """Test que verifica que el modo paralelo exige archivos de entrada y salida."""
+        with pytest.raises(SystemExit):
+            main(["cifrar", "-i", str(archivo_codigos), "--procesos", "2"])
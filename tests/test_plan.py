@@ -0,0 +1,114 @@
+"""
+Tests unitarios para los planes de cifrado configurables.
+"""
+
+import pytest
+from src.logic.cipher import CipherLogic, PLAN_POR_DEFECTO
+from src.logic.plan import PlanCifrado, compilar_plan, intercambios_a_permutacion
+from src.utils.validators import Validator
+
+PERMUTACION_8 = intercambios_a_permutacion([(0, 2), (1, 3), (4, 5), (6, 7)], 8)
+
+
+class TestPlanCifrado:
+    """Clase de tests para PlanCifrado y compilar_plan."""
+
+    def test_intercambios_a_permutacion(self):
+        """Test que verifica la conversión de intercambios a permutación."""
+        assert intercambios_a_permutacion([(0, 2), (1, 3), (4, 5)], 6) == (2, 3, 0, 1, 5, 4)
+        assert PERMUTACION_8 == (2, 3, 0, 1, 5, 4, 7, 6)
+
+    def test_plan_por_defecto_coincide_con_cipher(self):
+        """Test que verifica que el plan por defecto reproduce el algoritmo original."""
+        for valor in range(0, 1_000_000, 4999):
+            numero = f"{valor:06d}"
+            assert PLAN_POR_DEFECTO.cifrar(numero) == CipherLogic.cifrar(numero)
+            assert PLAN_POR_DEFECTO.descifrar(numero) == CipherLogic.descifrar(numero)
+
+    def test_compilar_plan_usa_cache(self):
+        """Test que verifica que la misma configuración devuelve el mismo plan."""
+        assert compilar_plan(7, 6, [2, 3, 0, 1, 5, 4]) is PLAN_POR_DEFECTO
+        assert compilar_plan(17, 6, (2, 3, 0, 1, 5, 4)) is PLAN_POR_DEFECTO
+
+    def test_plan_8_digitos(self):
+        """Test de cifrado de 8 dígitos con un cuarto intercambio."""
+        plan = compilar_plan(7, 8, PERMUTACION_8)
+        # 12345678 + 7 -> 89012345; intercambios -> 01893254
+        assert plan.cifrar("12345678") == "01893254"
+        assert plan.descifrar("01893254") == "12345678"
+
+    def test_plan_permutacion_no_involutiva(self):
+        """Test de simetría con una permutación que no es su propia inversa."""
+        plan = compilar_plan(3, 10, (1, 2, 3, 4, 5, 6, 7, 8, 9, 0))
+        for numero in ["0123456789", "9999999999", "0000000001"]:
+            assert plan.descifrar(plan.cifrar(numero)) == numero
+        # 0123456789 + 3 -> 3456789012; rotar una posición -> 4567890123
+        assert plan.cifrar("0123456789") == "4567890123"
+
+    def test_plan_buffer_coincide_con_escalar(self):
+        """Test que compara la ruta por búfer con la escalar en un plan de 10 dígitos."""
+        plan = compilar_plan(4, 10, (9, 8, 7, 6, 5, 4, 3, 2, 1, 0))
+        numeros = ["0123456789", "5555555555", "9081726354"]
+        cifrado = plan.cifrar_buffer("".join(n + "\n" for n in numeros).encode())
+        assert cifrado.decode().splitlines() == [plan.cifrar(n) for n in numeros]
+        assert plan.descifrar_buffer(cifrado).decode().splitlines() == numeros
+
+    def test_plan_lote_numpy(self):
+        """Test de la ruta vectorizada en un plan de 8 dígitos."""
+        np = pytest.importorskip("numpy")
+        plan = compilar_plan(7, 8, PERMUTACION_8)
+        numeros = np.array([12345678, 0, 99999999, 1], dtype=np.int64)
+        cifrados = plan.cifrar_lote(numeros)
+        assert [f"{v:08d}" for v in cifrados] == [plan.cifrar(f"{v:08d}") for v in numeros]
+        assert np.array_equal(plan.descifrar_lote(cifrados), numeros)
+
+    def test_codigo_invalido(self):
+        """Test que verifica el rechazo de códigos con longitud o caracteres inválidos."""
+        with pytest.raises(ValueError):
+            PLAN_POR_DEFECTO.cifrar("12345")
+        with pytest.raises(ValueError):
+            PLAN_POR_DEFECTO.descifrar("12a456")
+
+    def test_permutacion_invalida(self):
+        """Test que verifica el rechazo de permutaciones mal formadas."""
+        with pytest.raises(ValueError):
+            PlanCifrado(7, 6, (0, 1, 2, 3, 4))
+        with pytest.raises(ValueError):
+            PlanCifrado(7, 6, (0, 0, 1, 2, 3, 4))
+
+    def test_validar_numero_digitos(self):
+        """Test del validador con un número de dígitos configurable."""
+        assert Validator.validar_numero_digitos("12345678", 8) == (True, "")
+        assert Validator.validar_numero_digitos("123456", 8) == (
+            False, "El número debe tener exactamente 8 dígitos")
+        indices, codigos = Validator.validar_lote(["1234567890", "123456"], num_digitos=10)
+        assert list(indices) == [1]
+        assert Validator.mensajes_error(codigos, 10) == ["El número debe tener exactamente 10 dígitos"]
+
+    def test_plan_entero_varios_tamanos(self):
+        """Test de la ruta entera en planes de 1, 8 y 10 dígitos."""
+        for plan in (compilar_plan(7, 1, (0,)), compilar_plan(7, 8, PERMUTACION_8),
+                     compilar_plan(3, 10, (1, 2, 3, 4, 5, 6, 7, 8, 9, 0))):
+            n = plan.num_digitos
+            for valor in (0, 1, 10 ** n - 1, 10 ** n // 3):
+                cifrado = plan.cifrar_entero(valor)
+                assert f"{cifrado:0{n}d}" == plan.cifrar(f"{valor:0{n}d}")
+                assert plan.descifrar_entero(cifrado) == valor
+
+    def test_funcion_generada(self):
+        """Test que verifica la fuente inspeccionable y la caché de las funciones generadas."""
+        import inspect
+
+        plan = compilar_plan(7, 3, (2, 0, 1))
+        assert "T[s[2]], T[s[0]], T[s[1]]" in plan.fuente_cifrar
+        assert "for" not in plan.fuente_cifrar
+        assert inspect.getsource(plan.descifrar_generado) == plan.fuente_descifrar
+        assert PlanCifrado(7, 3, (2, 0, 1)).cifrar_generado is plan.cifrar_generado
+        for valor in range(1000):
+            codigo = f"{valor:03d}"
+            assert plan.descifrar_generado(plan.cifrar_generado(codigo)) == codigo
+
+    def test_cipher_conserva_ruta_general(self):
+        """Test que verifica que los dígitos Unicode siguen usando la ruta por dígitos."""
+        assert CipherLogic.cifrar("١٢٣٤٥٦") == CipherLogic.cifrar("123456") == "018932"
+        assert CipherLogic.descifrar("٠١٨٩٣٢") == "123456"
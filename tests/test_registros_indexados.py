@@ -0,0 +1,106 @@
+"""
+Tests unitarios para los archivos indexados de acceso directo.
+"""
+
+import io
+
+import pytest
+from src.cli import main
+from src.logic.cipher import CipherLogic
+from src.logic.registros_indexados import CABECERA, EscritorIndexado, LectorIndexado, crear_indexado
+
+ORIGINALES = [f"{numero:06d}" for numero in range(0, 1_000_000, 331)]
+CIFRADOS = [CipherLogic.cifrar(codigo) for codigo in ORIGINALES]
+
+
+@pytest.fixture
+def ruta_indexada(tmp_path):
+    """Fixture con un archivo indexado de bloques pequeños."""
+    ruta = tmp_path / "cifrados.idx"
+    with open(ruta, "wb") as salida:
+        assert crear_indexado(io.StringIO("\n".join(CIFRADOS) + "\n\n"), salida, tam_bloque=100) == len(CIFRADOS)
+    return ruta
+
+
+class TestRegistrosIndexados:
+    """Clase de tests para EscritorIndexado y LectorIndexado."""
+
+    def test_acceso_directo(self, ruta_indexada):
+        """Test que verifica registros sueltos, rangos e índices negativos."""
+        assert ruta_indexada.stat().st_size == CABECERA.size + 3 * len(CIFRADOS) + 4 * -(-len(CIFRADOS) // 100)
+        with LectorIndexado(str(ruta_indexada)) as lector:
+            assert len(lector) == len(CIFRADOS)
+            assert lector.descifrar(1234) == ORIGINALES[1234]
+            assert lector.descifrar(-1) == ORIGINALES[-1]
+            assert lector.descifrar_rango(95, 205) == ORIGINALES[95:205]
+            assert lector.cifrados(0, 3) == CIFRADOS[:3]
+            assert lector.descifrar_rango(7, 7) == []
+            with pytest.raises(IndexError):
+                lector.descifrar(len(CIFRADOS))
+            assert lector.comprobar() == []
+
+    def test_suma_detecta_corrupcion(self, ruta_indexada):
+        """Test que verifica que solo falla la lectura del bloque dañado."""
+        datos = bytearray(ruta_indexada.read_bytes())
+        datos[CABECERA.size + 3 * 250] ^= 0x01
+        ruta_indexada.write_bytes(bytes(datos))
+
+        with LectorIndexado(str(ruta_indexada)) as lector:
+            assert lector.descifrar(10) == ORIGINALES[10]
+            with pytest.raises(ValueError, match="bloque 2"):
+                lector.descifrar(299)
+            assert lector.comprobar() == [2]
+        with LectorIndexado(str(ruta_indexada), verificar=False) as lector:
+            assert lector.cifrados(250, 251) != CIFRADOS[250:251]
+
+    def test_sin_sumas_y_escritura_en_partes(self, tmp_path):
+        """Test que verifica un archivo sin sumas escrito en varias llamadas."""
+        ruta = tmp_path / "sin_sumas.idx"
+        with open(ruta, "wb") as salida, EscritorIndexado(salida, tam_bloque=7, sumas=False) as escritor:
+            escritor.escribir(CIFRADOS[:10])
+            escritor.escribir(CIFRADOS[10:])
+            with pytest.raises(ValueError, match="inválido"):
+                escritor.escribir(["12a456"])
+        assert ruta.stat().st_size == CABECERA.size + 3 * len(CIFRADOS)
+        with LectorIndexado(str(ruta)) as lector:
+            assert not lector.con_sumas
+            assert lector.descifrar_rango(0, len(CIFRADOS)) == ORIGINALES
+
+    def test_archivo_invalido(self, tmp_path):
+        """Test que verifica el rechazo de archivos ajenos o truncados."""
+        ajeno = tmp_path / "codigos.txt"
+        ajeno.write_text("123456\n" * 10)
+        with pytest.raises(ValueError, match="no es un archivo indexado"):
+            LectorIndexado(str(ajeno))
+        with pytest.raises(ValueError, match="Línea 2"):
+            crear_indexado(io.StringIO("018932\n01893\n"), io.BytesIO())
+
+    def test_error_no_deja_archivo_valido(self, tmp_path, capsys):
+        """Test que verifica que una línea inválida no deja un archivo indexado utilizable."""
+        parcial = tmp_path / "parcial.idx"
+        with open(parcial, "wb") as salida:
+            with pytest.raises(ValueError, match="Línea 3"):
+                crear_indexado(io.StringIO("018932\n777777\nabc\n"), salida, tam_lote=1)
+        with pytest.raises(ValueError, match="truncado"):
+            LectorIndexado(str(parcial))
+
+        entrada = tmp_path / "cifrados.txt"
+        entrada.write_text("\n".join(CIFRADOS[:5]) + "\n01893\n")
+        indexado = tmp_path / "cifrados.idx"
+        assert main(["indexar", "-i", str(entrada), "-o", str(indexado)]) == 1
+        assert "Línea 6" in capsys.readouterr().err
+        assert not indexado.exists()
+
+    def test_cli(self, tmp_path, capsys):
+        """Test que verifica los subcomandos indexar y consultar."""
+        entrada = tmp_path / "cifrados.txt"
+        entrada.write_text("\n".join(CIFRADOS) + "\n")
+        indexado = tmp_path / "cifrados.idx"
+        assert main(["indexar", "-i", str(entrada), "-o", str(indexado), "--tam-bloque", "64"]) == 0
+
+        assert main(["consultar", str(indexado), "5", "10:12", "-1"]) == 0
+        assert capsys.readouterr().out.split() == [ORIGINALES[5], *ORIGINALES[10:12], ORIGINALES[-1]]
+        assert main(["consultar", str(indexado), "--cifrados", "0"]) == 0
+        assert capsys.readouterr().out.split() == [CIFRADOS[0]]
+        assert main(["consultar", str(indexado), str(len(CIFRADOS))]) == 1
+        assert "fuera del archivo" in capsys.readouterr().err
@@ -0,0 +1,154 @@
+"""
+Tests unitarios para el servicio HTTP de cifrado.
+"""
+
+import asyncio
+
+import pytest
+from src.servicio.servidor import AgrupadorLotes, ColaLlena, ServidorCifrado
+
+
+async def _peticion(lector, escritor, linea_peticion, cuerpo=b"", cabeceras=""):
+    """Envía una petición y devuelve (estado, cabeceras, cuerpo) de la respuesta."""
+    if cuerpo:
+        cabeceras += f"Content-Length: {len(cuerpo)}\r\n"
+    escritor.write(f"{linea_peticion} HTTP/1.1\r\nHost: localhost\r\n{cabeceras}\r\n".encode() + cuerpo)
+    await escritor.drain()
+    estado = int((await lector.readline()).split()[1])
+    respuesta = {}
+    while (linea := await lector.readline()) != b"\r\n":
+        nombre, _, valor = linea.decode().partition(":")
+        respuesta[nombre.lower()] = valor.strip()
+    texto = (await lector.readexactly(int(respuesta["content-length"]))).decode().strip()
+    return estado, respuesta, texto
+
+
+class TestServidorCifrado:
+    """Clase de tests para ServidorCifrado en localhost."""
+
+    def test_conexion_persistente(self):
+        """Test con varias peticiones sobre la misma conexión."""
+        async def escenario():
+            servidor = await ServidorCifrado(puerto=0).iniciar()
+            try:
+                lector, escritor = await asyncio.open_connection("127.0.0.1", servidor.puerto)
+                respuestas = [
+                    await _peticion(lector, escritor, "GET /cifrar/123456"),
+                    await _peticion(lector, escritor, "POST /descifrar", b"018932"),
+                    await _peticion(lector, escritor, "GET /cifrar/12a456"),
+                    await _peticion(lector, escritor, "GET /otra/123456"),
+                    await _peticion(lector, escritor, "DELETE /cifrar/123456", cabeceras="Connection: close\r\n"),
+                ]
+                assert await lector.read() == b""
+                escritor.close()
+                return respuestas
+            finally:
+                await servidor.detener()
+
+        respuestas = asyncio.run(escenario())
+        assert [(estado, texto) for estado, _, texto in respuestas] == [
+            (200, "018932"),
+            (200, "123456"),
+            (400, "Solo se aceptan dígitos numéricos"),
+            (404, "Ruta no encontrada"),
+            (405, "Método no permitido"),
+        ]
+        assert respuestas[0][1]["connection"] == "keep-alive"
+        assert respuestas[-1][1]["connection"] == "close"
+
+    def test_peticiones_concurrentes_se_agrupan(self):
+        """Test que verifica que las peticiones concurrentes comparten lotes."""
+        async def cliente(puerto, valor):
+            lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+            estado, _, texto = await _peticion(lector, escritor, f"GET /cifrar/{valor:06d}")
+            escritor.close()
+            return estado, texto
+
+        async def escenario():
+            servidor = await ServidorCifrado(puerto=0, max_espera=0.05).iniciar()
+            try:
+                resultados = await asyncio.gather(*(cliente(servidor.puerto, v) for v in range(50)))
+                return resultados, servidor.agrupadores["cifrar"].lotes_procesados
+            finally:
+                await servidor.detener()
+
+        resultados, lotes = asyncio.run(escenario())
+        from src.logic.cipher import CipherLogic
+        assert resultados == [(200, CipherLogic.cifrar(f"{v:06d}")) for v in range(50)]
+        assert lotes < 50
+
+
+class TestAgrupadorLotes:
+    """Clase de tests para AgrupadorLotes."""
+
+    def test_respeta_max_lote(self):
+        """Test que verifica que ningún lote supera max_lote."""
+        tamanos = []
+
+        def funcion(codigos):
+            tamanos.append(len(codigos))
+            return [c[::-1] for c in codigos]
+
+        async def escenario():
+            agrupador = AgrupadorLotes(funcion, max_lote=4, max_espera=0.01)
+            agrupador.iniciar()
+            try:
+                return await asyncio.gather(*(agrupador.enviar(str(i)) for i in range(10, 20)))
+            finally:
+                await agrupador.detener()
+
+        assert asyncio.run(escenario()) == [str(i)[::-1] for i in range(10, 20)]
+        assert max(tamanos) <= 4
+        assert sum(tamanos) == 10
+
+    def test_fallo_aislado_en_el_lote(self):
+        """Test que verifica que un código que hace fallar el lote solo falla su propia solicitud."""
+        def funcion(codigos):
+            if "malo" in codigos:
+                raise ValueError("código malo")
+            return [c[::-1] for c in codigos]
+
+        async def escenario():
+            agrupador = AgrupadorLotes(funcion, max_espera=0.01)
+            agrupador.iniciar()
+            try:
+                return await asyncio.gather(*(agrupador.enviar(c) for c in ("123", "malo", "456")),
+                                            return_exceptions=True)
+            finally:
+                await agrupador.detener()
+
+        correcto, error, otro = asyncio.run(escenario())
+        assert (correcto, otro) == ("321", "654")
+        assert isinstance(error, ValueError)
+
+    def test_error_interno_sin_detalles(self, caplog):
+        """Test que verifica que el 500 no expone el texto de la excepción, que queda en el registro."""
+        async def escenario():
+            servidor = await ServidorCifrado(puerto=0).iniciar()
+            servidor.agrupadores["cifrar"].funcion_lote = lambda codigos: 1 / 0
+            try:
+                lector, escritor = await asyncio.open_connection("127.0.0.1", servidor.puerto)
+                respuesta = await _peticion(lector, escritor, "GET /cifrar/123456")
+                escritor.close()
+                return respuesta
+            finally:
+                await servidor.detener()
+
+        estado, _, texto = asyncio.run(escenario())
+        assert (estado, texto) == (500, "Error interno del servidor")
+        assert "division by zero" in caplog.text
+
+    def test_cola_llena(self):
+        """Test que verifica la contrapresión cuando la cola está llena."""
+        async def escenario():
+            agrupador = AgrupadorLotes(lambda codigos: codigos, max_cola=1)
+            pendiente = asyncio.ensure_future(agrupador.enviar("123456"))
+            await asyncio.sleep(0)
+            with pytest.raises(ColaLlena):
+                await agrupador.enviar("654321")
+            agrupador.iniciar()
+            resultado = await pendiente
+            await agrupador.detener()
+            return resultado
+
+        assert asyncio.run(escenario()) == "123456"
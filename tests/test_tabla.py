@@ -0,0 +1,92 @@
+"""
+Tests unitarios para el motor de cifrado por tablas precalculadas.
+"""
+
+from array import array
+
+import pytest
+from src.logic.cipher import CipherLogic
+from src.logic.tabla import TablaCifrado, TAM_DOMINIO
+
+
+@pytest.fixture(scope="module")
+def tabla():
+    """Fixture que construye las tablas una sola vez por módulo."""
+    return TablaCifrado.construir()
+
+
+class TestTablaCifrado:
+    """Clase de tests para TablaCifrado."""
+
+    def test_valores_conocidos(self, tabla):
+        """Test con pares de valores conocidos (original, cifrado)."""
+        assert tabla.cifrar("123456") == "018932"
+        assert tabla.cifrar("000000") == "777777"
+        assert tabla.descifrar("018932") == "123456"
+        assert tabla.descifrar("666666") == "999999"
+
+    def test_coincide_con_calculo_por_digitos(self, tabla):
+        """Test que compara la tabla con la ruta escalar en una muestra del dominio."""
+        for valor in range(0, TAM_DOMINIO, 7919):
+            numero = f"{valor:06d}"
+            assert tabla.cifrar(numero) == CipherLogic.cifrar(numero)
+            assert tabla.descifrar(numero) == CipherLogic.descifrar(numero)
+
+    def test_tablas_inversas(self, tabla):
+        """Test que verifica que la tabla inversa deshace la directa."""
+        for valor in range(0, TAM_DOMINIO, 1013):
+            assert tabla.inversa[tabla.directa[valor]] == valor
+
+    def test_guardar_y_cargar(self, tabla, tmp_path):
+        """Test que verifica la persistencia de las tablas en disco."""
+        ruta = tmp_path / "tablas.bin"
+        tabla.guardar(str(ruta))
+        cargada = TablaCifrado.cargar(str(ruta))
+        assert cargada.directa == tabla.directa
+        assert cargada.inversa == tabla.inversa
+
+    def test_cargar_archivo_invalido(self, tmp_path):
+        """Test que verifica el rechazo de archivos sin la cabecera esperada."""
+        ruta = tmp_path / "otro.bin"
+        ruta.write_bytes(b"no es una tabla")
+        with pytest.raises(ValueError):
+            TablaCifrado.cargar(str(ruta))
+
+    def test_cargar_o_construir_persiste(self, tmp_path):
+        """Test que verifica que cargar_o_construir crea el archivo de caché."""
+        ruta = tmp_path / "cache.bin"
+        tabla = TablaCifrado.cargar_o_construir(str(ruta))
+        assert ruta.exists()
+        assert TablaCifrado.cargar_o_construir(str(ruta)).directa == tabla.directa
+
+    def test_lote_indexacion_avanzada(self, tabla):
+        """Test de cifrado en lote con indexación avanzada de NumPy."""
+        np = pytest.importorskip("numpy")
+        numeros = np.array([123456, 0, 999999])
+        assert tabla.cifrar_lote(numeros).tolist() == [18932, 777777, 666666]
+        assert tabla.descifrar_lote(tabla.cifrar_lote(numeros)).tolist() == numeros.tolist()
+
+    def test_lote_invalido(self, tabla):
+        """Test que verifica el rechazo de números negativos, demasiado grandes o no enteros."""
+        np = pytest.importorskip("numpy")
+        for lote, error in ((np.array([-1]), ValueError), (np.array([0, 1_000_000]), ValueError),
+                            (np.array([1.0]), TypeError)):
+            with pytest.raises(error):
+                tabla.cifrar_lote(lote)
+            with pytest.raises(error):
+                tabla.descifrar_lote(lote)
+            # Mismo tipo de error que la ruta del plan
+            with pytest.raises(error):
+                CipherLogic.cifrar_lote(lote)
+
+    def test_metodos_estaticos_usan_tabla(self):
+        """Test que verifica que CipherLogic delega en la tabla activa (una identidad, para distinguirla)."""
+        identidad = array("I", range(TAM_DOMINIO))
+        CipherLogic.usar_tabla(TablaCifrado(identidad, identidad))
+        try:
+            assert CipherLogic.cifrar("123456") == "123456"
+            assert CipherLogic.descifrar("018932") == "018932"
+            assert CipherLogic.cifrar_entero(123456) == 123456
+        finally:
+            CipherLogic.usar_tabla(None)
+        assert CipherLogic.cifrar("123456") == "018932"
@@ -0,0 +1,84 @@
+"""
+Tests unitarios para las tablas de cifrado en memoria compartida.
+"""
+
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from src.logic.cipher import CipherLogic
+from src.logic.tabla import TablaCifrado
+from src.logic.tabla_compartida import TablaCompartida, usar_tabla_compartida
+
+
+def _cifrar_en_trabajador(codigo):
+    """Cifra en un proceso trabajador e informa qué segmento usó."""
+    return CipherLogic.cifrar(codigo), CipherLogic._tabla.nombre
+
+
+@pytest.fixture(scope="module")
+def tabla():
+    """Fixture con las tablas construidas una sola vez."""
+    return TablaCifrado.construir()
+
+
+class TestTablaCompartida:
+    """Clase de tests para publicar y adjuntar tablas compartidas."""
+
+    def test_adjuntar_sin_copia(self, tabla):
+        """Test que verifica que el proceso adjunto lee los mismos valores en solo lectura."""
+        with TablaCompartida.publicar(tabla) as publicada:
+            adjunta = TablaCompartida.adjuntar(publicada.nombre)
+            assert adjunta.cifrar("123456") == "018932"
+            assert adjunta.descifrar("018932") == "123456"
+            assert adjunta.directa.tolist() == tabla.directa.tolist()
+            assert adjunta.inversa.readonly
+            adjunta.cerrar()
+
+        with pytest.raises(FileNotFoundError):
+            TablaCompartida.adjuntar(publicada.nombre)
+
+    def test_trabajadores_de_un_grupo(self, tabla):
+        """Test que verifica que los trabajadores usan el segmento y no lo eliminan al salir."""
+        with TablaCompartida.publicar(tabla) as publicada:
+            with ProcessPoolExecutor(max_workers=2, initializer=usar_tabla_compartida,
+                                     initargs=(publicada.nombre,)) as ejecutor:
+                resultados = list(ejecutor.map(_cifrar_en_trabajador, ["123456", "000000"]))
+            assert resultados == [("018932", publicada.nombre), ("777777", publicada.nombre)]
+            TablaCompartida.adjuntar(publicada.nombre).cerrar()
+
+    def test_proceso_independiente_no_elimina_el_segmento(self, tabla):
+        """Test que verifica que un proceso con su propio resource_tracker se adjunta sin eliminar el segmento."""
+        with TablaCompartida.publicar(tabla) as publicada:
+            codigo = ("import sys\nfrom src.logic.tabla_compartida import TablaCompartida\n"
+                      "print(TablaCompartida.adjuntar(sys.argv[1]).cifrar('123456'))")
+            salida = subprocess.run([sys.executable, "-c", codigo, publicada.nombre], capture_output=True,
+                                    text=True, check=True)
+            assert salida.stdout.strip() == "018932"
+            assert "Traceback" not in salida.stderr
+            TablaCompartida.adjuntar(publicada.nombre).cerrar()
+
+    def test_limpieza_al_salir_el_dueno(self):
+        """Test que verifica que el segmento desaparece cuando termina el proceso dueño."""
+        codigo = ("from src.logic.tabla_compartida import TablaCompartida\n"
+                  "print(TablaCompartida.publicar().nombre)")
+        nombre = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True,
+                                check=True).stdout.strip()
+        with pytest.raises(FileNotFoundError):
+            TablaCompartida.adjuntar(nombre)
+
+    def test_segmento_ajeno(self):
+        """Test que verifica el rechazo de segmentos sin tablas de cifrado."""
+        from multiprocessing import resource_tracker, shared_memory
+
+        ajeno = shared_memory.SharedMemory(create=True, size=64)
+        try:
+            with pytest.raises(ValueError):
+                TablaCompartida.adjuntar(ajeno.name)
+        finally:
+            ajeno.close()
+            if sys.version_info < (3, 13):
+                # Adjuntarse desde este proceso anuló el registro del creador (mismo resource_tracker)
+                resource_tracker.register(ajeno._name, "shared_memory")
+            ajeno.unlink()
@@ -0,0 +1,67 @@
+"""
+Tests unitarios para la rotación de planes de cifrado.
+"""
+
+import io
+from array import array
+
+import pytest
+from src.cli import main
+from src.logic.cipher import PLAN_POR_DEFECTO
+from src.logic.plan import compilar_plan
+from src.logic.transcodificador import componer_planes, leer_plan, transcodificar_archivo, transcodificar_enteros
+from src.logic.verificacion import dominio_buffer
+
+PLAN_NUEVO = compilar_plan(3, 6, (5, 0, 4, 1, 3, 2))
+
+
+class TestTranscodificador:
+    """Clase de tests para componer_planes y la transcodificación."""
+
+    def test_composicion_equivale_a_dos_pasadas(self):
+        """Test que verifica el plan compuesto sobre todo el dominio de 6 dígitos."""
+        cifrados = PLAN_POR_DEFECTO.cifrar_buffer(dominio_buffer(6))
+        esperado = PLAN_NUEVO.cifrar_buffer(PLAN_POR_DEFECTO.descifrar_buffer(cifrados))
+        compuesto = componer_planes(PLAN_POR_DEFECTO, PLAN_NUEVO)
+        assert compuesto.cifrar_buffer(cifrados) == esperado
+        assert componer_planes(PLAN_NUEVO, PLAN_NUEVO) is compilar_plan(0, 6, range(6))
+
+    def test_enteros(self):
+        """Test que verifica la transcodificación de columnas de enteros."""
+        numeros = array("I", [PLAN_POR_DEFECTO.cifrar_entero(n) for n in (0, 123456, 999999)])
+        rotados = transcodificar_enteros(numeros, PLAN_POR_DEFECTO, PLAN_NUEVO)
+        assert isinstance(rotados, array)
+        assert list(rotados) == [PLAN_NUEVO.cifrar_entero(n) for n in (0, 123456, 999999)]
+
+    def test_archivo_en_bloques_y_ultimo_registro(self):
+        """Test que verifica bloques pequeños y un último registro sin salto de línea."""
+        codigos = [f"{numero:06d}" for numero in range(0, 1_000_000, 4099)]
+        entrada = io.BytesIO("\n".join(PLAN_POR_DEFECTO.cifrar(c) for c in codigos).encode())
+        salida = io.BytesIO()
+        assert transcodificar_archivo(entrada, salida, PLAN_POR_DEFECTO, PLAN_NUEVO, tam_bloque=50) == len(codigos)
+        assert salida.getvalue().decode() == "\n".join(PLAN_NUEVO.cifrar(c) for c in codigos)
+
+    def test_errores(self):
+        """Test que verifica registros inválidos, planes incompatibles y texto mal formado."""
+        with pytest.raises(ValueError, match="registro 2"):
+            transcodificar_archivo(io.BytesIO(b"123456\n654321\n12a456\n"), io.BytesIO(),
+                                   PLAN_POR_DEFECTO, PLAN_NUEVO, tam_bloque=14)
+        with pytest.raises(ValueError, match="mismo número de dígitos"):
+            componer_planes(PLAN_POR_DEFECTO, compilar_plan(7, 4, (1, 0, 3, 2)))
+        assert leer_plan("7:2,3,0,1,5,4") is PLAN_POR_DEFECTO
+        for texto in ("7", "x:1,0", "7:0,0"):
+            with pytest.raises(ValueError):
+                leer_plan(texto)
+
+    def test_cli_rotar(self, tmp_path):
+        """Test que verifica el subcomando rotar con salida y en sitio."""
+        origen = tmp_path / "cifrados.txt"
+        origen.write_bytes(b"018932\n777777\n")
+        destino = tmp_path / "rotados.txt"
+        assert main(["rotar", "--nuevo", "3:5,0,4,1,3,2", "-i", str(origen), "-o", str(destino)]) == 0
+        esperado = f"{PLAN_NUEVO.cifrar('123456')}\n{PLAN_NUEVO.cifrar('000000')}\n".encode()
+        assert destino.read_bytes() == esperado
+
+        assert main(["rotar", "--nuevo", "3:5,0,4,1,3,2", "-i", str(origen), "--en-sitio"]) == 0
+        assert origen.read_bytes() == esperado
+        assert main(["rotar", "--nuevo", "3:1,0", "-i", str(origen), "--en-sitio"]) == 1
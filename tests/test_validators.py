@@ -3,7 +3,7 @@ Tests unitarios para el módulo de validadores.
 """
 
 import pytest
-from src.utils.validators import Validator
+from src.utils.validators import Validator, ERROR_VACIO, ERROR_LONGITUD, ERROR_NO_DIGITO
 
 
 class TestValidator:
@@ -240,19 +240,15 @@ class TestValidator:
     # ==================== Tests de Casos Especiales ====================
 
     def test_validar_unicode_numeros(self, validator):
-        """Test de validación con números unicode (no ASCII)."""
-        # Nota: Python's isdigit() acepta varios tipos de dígitos unicode
-        # incluyendo números árabes "١٢٣٤٥٦" y números circulados "①②③④⑤⑥"
-        # Por lo tanto, este test verifica que el validador acepta dígitos unicode válidos
-        # Si se requiere validación estricta de ASCII, se debe modificar el validador
-
-        # Test que los números unicode son procesados consistentemente
-        entrada_unicode = "①②③④⑤⑥"
-        es_valido, mensaje = validator.validar_numero_6_digitos(entrada_unicode)
-        # El resultado depende de la implementación del validador
-        # Solo verificamos que retorna tipos correctos
-        assert isinstance(es_valido, bool)
-        assert isinstance(mensaje, str)
+        """Test que verifica que los dígitos Unicode no ASCII se rechazan."""
+        # str.isdigit acepta superíndices, dígitos árabes y números circulados
+        for entrada in ("¹²³⁴⁵⁶", "١٢٣٤٥٦", "①②③④⑤⑥", "12345٦"):
+            es_valido, mensaje = validator.validar_numero_6_digitos(entrada)
+            assert es_valido is False, f"Entrada {entrada} debería ser inválida"
+            assert mensaje == "Solo se aceptan dígitos numéricos"
+        indices, codigos = Validator.validar_lote(["123456", "¹²³⁴⁵⁶", "١٢٣٤٥٦"])
+        assert list(indices) == [1, 2]
+        assert list(codigos) == [ERROR_NO_DIGITO, ERROR_NO_DIGITO]
 
     def test_validar_numero_hexadecimal(self, validator):
         """Test de validación con representación hexadecimal."""
@@ -284,3 +280,34 @@ class TestValidator:
             resultados = [validator.validar_numero_6_digitos(entrada) for _ in range(5)]
             # Todos los resultados deben ser iguales
             assert all(r == resultados[0] for r in resultados)
+
+
+class TestValidarLote:
+    """Clase de tests para la validación en lote."""
+
+    def test_lote_todos_validos(self):
+        """Test con un lote sin errores."""
+        indices, codigos = Validator.validar_lote(["123456", "000000", "999999"])
+        assert list(indices) == []
+        assert list(codigos) == []
+
+    def test_lote_clases_de_error(self):
+        """Test que verifica las tres clases de error del validador escalar."""
+        entradas = ["123456", "", "12345", "12a456", "1234567", "999999"]
+        indices, codigos = Validator.validar_lote(entradas)
+        assert list(indices) == [1, 2, 3, 4]
+        assert list(codigos) == [ERROR_VACIO, ERROR_LONGITUD, ERROR_NO_DIGITO, ERROR_LONGITUD]
+
+    def test_lote_coincide_con_escalar(self):
+        """Test que verifica que los mensajes coinciden con la validación escalar."""
+        entradas = ["", "1", "abcdef", "12 456", "123456", "12345678"]
+        indices, codigos = Validator.validar_lote(entradas)
+        mensajes = Validator.mensajes_error(codigos)
+        for indice, mensaje in zip(indices, mensajes):
+            assert Validator.validar_numero_6_digitos(entradas[indice]) == (False, mensaje)
+
+    def test_lote_buffer_bytes(self):
+        """Test con un búfer de bytes con un código por línea."""
+        indices, codigos = Validator.validar_lote(b"123456\n12345\r\n\n65432x\n")
+        assert list(indices) == [1, 2, 3]
+        assert list(codigos) == [ERROR_LONGITUD, ERROR_VACIO, ERROR_NO_DIGITO]
@@ -0,0 +1,74 @@
+"""
+Tests unitarios para la verificación exhaustiva del cifrado.
+"""
+
+import pytest
+from src.cli import main
+from src.logic.cipher import PLAN_POR_DEFECTO
+from src.logic.plan import compilar_plan
+from src.logic.verificacion import cifrar_por_digitos, dominio_buffer, verificar
+
+
+class TestVerificacion:
+    """Clase de tests para verificar()."""
+
+    def test_dominio_buffer(self):
+        """Test que verifica que el dominio contiene todos los códigos en orden."""
+        assert dominio_buffer(3) == "".join(f"{numero:03d}\n" for numero in range(1000)).encode()
+
+    def test_plan_por_defecto(self):
+        """Test que verifica todo el dominio de 6 dígitos por las rutas vectorizadas."""
+        pytest.importorskip("numpy")
+        resultado = verificar(["buffer", "lote", "tabla"])
+        assert resultado.exitoso, resultado.resumen()
+        assert resultado.num_codigos == 1_000_000
+        assert set(resultado.tiempos) == {"buffer", "lote", "tabla"}
+
+    def test_plan_configurable(self):
+        """Test que verifica un plan de 4 dígitos y omite las rutas exclusivas del plan por defecto."""
+        plan = compilar_plan(3, 4, (3, 2, 1, 0))
+        resultado = verificar(["buffer", "entero", "escalar"], plan=plan, procesos=1)
+        assert resultado.exitoso, resultado.resumen()
+        assert set(resultado.tiempos) == {"buffer", "entero"}
+        assert "escalar" in resultado.omitidas
+
+    def test_detecta_colisiones(self, monkeypatch):
+        """Test que verifica que una ruta defectuosa se reporta."""
+        plan = compilar_plan(1, 3, (1, 0, 2))
+        original = plan.cifrar_entero
+        monkeypatch.setattr(plan, "cifrar_entero", lambda numero: original(6 if numero == 5 else numero))
+
+        resultado = verificar(["buffer", "entero"], plan=plan, procesos=1)
+        assert not resultado.exitoso
+        fallos = "\n".join(resultado.fallos)
+        assert "entero: descifrar(cifrar(005)) = 006" in fallos
+        assert "se repite" in fallos
+        assert "la ruta de referencia" in fallos
+
+    def test_algoritmo_original(self):
+        """Test que verifica la referencia dígito a dígito con valores conocidos."""
+        assert cifrar_por_digitos(PLAN_POR_DEFECTO, 123456) == 18932
+        assert cifrar_por_digitos(PLAN_POR_DEFECTO, 0) == 777777
+        assert cifrar_por_digitos(compilar_plan(3, 4, (3, 2, 1, 0)), 1234) == 7654
+
+    def test_detecta_error_comun_a_las_rutas(self, monkeypatch):
+        """Test que verifica que una ruta biyectiva pero distinta del algoritmo original se reporta."""
+        plan = compilar_plan(1, 3, (1, 0, 2))
+        cifrar, descifrar = plan.cifrar_entero, plan.descifrar_entero
+        monkeypatch.setattr(plan, "cifrar_entero", lambda numero: (cifrar(numero) + 1) % 1000)
+        monkeypatch.setattr(plan, "descifrar_entero", lambda numero: descifrar((numero - 1) % 1000))
+
+        resultado = verificar(["entero"], plan=plan, procesos=1)
+        assert not resultado.exitoso
+        assert "entero: cifrar(000) = 112, el algoritmo original da 111" in resultado.fallos
+
+    def test_ruta_desconocida(self):
+        """Test que verifica el rechazo de rutas inexistentes."""
+        with pytest.raises(ValueError):
+            verificar(["magia"])
+
+    def test_cli_verificar(self, capsys):
+        """Test que verifica el subcomando verificar de la consola."""
+        assert main(["verificar", "--rutas", "buffer"]) == 0
+        assert "Verificación correcta" in capsys.readouterr().out
+        assert main(["verificar", "--rutas", "magia"]) == 2